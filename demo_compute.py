@@ -0,0 +1,494 @@
+"""
+Demo Compute Registry — Karim Osman Portfolio
+The pure compute behind each Live Demo, kept apart from its Streamlit UI.
+Every function is registered under a demo name, memoized by its input
+parameters in a bounded LRU shared by all sessions, and timed with
+perf_counter, so the page shows measured latency and whether a result was
+served from cache.
+
+    python demo_compute.py      # cold vs cached time for every demo
+"""
+
+import hashlib
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+
+from path_planner import plan, random_grid
+
+DEMO_CACHE_SIZE = int(os.getenv("DEMO_CACHE_SIZE", "64"))  # entries per demo
+
+
+@dataclass(frozen=True)
+class DemoRun:
+    value: Any
+    ms: float          # wall time of this call (a lookup on a cache hit)
+    compute_ms: float  # time the result took to compute
+    cached: bool
+
+
+def _read_only(value):
+    """Cached results are shared across sessions: freeze their arrays."""
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            _read_only(v)
+    elif isinstance(value, dict):
+        for v in value.values():
+            _read_only(v)
+    return value
+
+
+class DemoRegistry:
+    """Named, memoized, timed compute functions with hit/miss counters."""
+
+    def __init__(self, maxsize: int = DEMO_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._demos: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, key: Callable | None = None, maxsize: int | None = None):
+        """Decorator: calls return a DemoRun. Arguments must be hashable, or `key`
+        maps them to a hashable cache key (e.g. a digest of uploaded bytes)."""
+        def decorate(fn):
+            entry = {"fn": fn, "data": OrderedDict(), "maxsize": maxsize or self.maxsize,
+                     "hits": 0, "misses": 0, "compute_ms": 0.0}
+            with self._lock:
+                self._demos[name] = entry
+
+            def run(*args, **kwargs) -> DemoRun:
+                t0 = time.perf_counter()
+                cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+                with self._lock:
+                    hit = entry["data"].get(cache_key)
+                    if hit is not None:
+                        entry["data"].move_to_end(cache_key)
+                        entry["hits"] += 1
+                if hit is not None:
+                    value, compute_ms = hit
+                    return DemoRun(value, (time.perf_counter() - t0) * 1e3, compute_ms, True)
+
+                value = _read_only(fn(*args, **kwargs))
+                compute_ms = (time.perf_counter() - t0) * 1e3
+                with self._lock:
+                    entry["data"][cache_key] = (value, compute_ms)
+                    entry["data"].move_to_end(cache_key)
+                    while len(entry["data"]) > entry["maxsize"]:
+                        entry["data"].popitem(last=False)
+                    entry["misses"] += 1
+                    entry["compute_ms"] += compute_ms
+                return DemoRun(value, compute_ms, compute_ms, False)
+
+            run.__name__, run.__doc__ = fn.__name__, fn.__doc__
+            run.compute = fn
+            return run
+        return decorate
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in self._demos.values():
+                entry["data"].clear()
+                entry["hits"] = entry["misses"] = 0
+                entry["compute_ms"] = 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {name: {"hits": e["hits"], "misses": e["misses"], "size": len(e["data"]),
+                           "mean_compute_ms": e["compute_ms"] / e["misses"] if e["misses"] else 0.0}
+                    for name, e in self._demos.items()}
+
+
+REGISTRY = DemoRegistry()
+register = REGISTRY.register
+
+
+def _digest(data: bytes, *args) -> tuple:
+    return (hashlib.sha1(data).hexdigest(), *args)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  AI / LLM
+# ─────────────────────────────────────────────────────────────────────────────
+RAG_DEMO_KB = {
+    "rag": ("**RAG (Retrieval-Augmented Generation)** is a technique that combines a retrieval "
+            "system (vector search over a knowledge base) with a generative LLM. Instead of relying "
+            "purely on the model's parametric memory, RAG grounds answers in up-to-date, domain-specific "
+            "documents — reducing hallucinations by up to 60% in production systems."),
+    "finetun": ("**LLM Fine-tuning** adapts a pre-trained model to a specific domain by continuing training "
+                "on curated data. Modern approaches: **LoRA** (Low-Rank Adaptation) injects trainable rank "
+                "decomposition matrices, reducing trainable params by 10,000×. **QLoRA** adds 4-bit NormalFloat "
+                "quantisation for GPU-efficient training of 70B+ parameter models."),
+    "vector": ("**Vector Databases** store high-dimensional embeddings for semantic similarity search. "
+               "FAISS (Meta) uses IVF+PQ indexing for billion-scale nearest-neighbour search at <10ms. "
+               "Production stacks: FAISS → low-latency offline; Pinecone/Weaviate → managed cloud; "
+               "PGVector → Postgres-native for existing infra."),
+    "transformer": ("**Transformers** are the architecture powering modern LLMs. Key components: "
+                    "Multi-Head Self-Attention (O(n²) complexity), positional encodings, feed-forward layers, "
+                    "and layer normalisation. GPT series uses decoder-only; BERT uses encoder-only; T5 uses "
+                    "encoder-decoder. Flash Attention 2 reduces memory to O(n) via IO-aware tiling."),
+    "agent": ("**AI Agents** use LLMs as reasoning engines with tool-use capabilities. ReAct pattern: "
+              "Reason → Act → Observe loop. Modern frameworks: LangChain Agents, LlamaIndex Agents, "
+              "AutoGen multi-agent systems. Key challenges: planning reliability, tool call errors, "
+              "context window limits. Function calling (OpenAI, Gemini) enables structured tool use."),
+}
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+@register("rag_qa")
+def rag_qa(query: str) -> dict:
+    """Keyword retrieval over RAG_DEMO_KB. grounding = share of the query's content
+    words found in the retrieved passage (None for the generic fallback)."""
+    q_lower = query.lower()
+    topic = next((k for k in RAG_DEMO_KB if k in q_lower), None)
+    if topic is None:
+        return {"topic": None, "grounding": None,
+                "answer": ("Based on vector search over the knowledge base: "
+                           f"**'{query}'** relates to AI systems design and production ML engineering. "
+                           "The RAG pattern grounds LLM responses in factual documents, "
+                           "reducing hallucination while enabling domain-specific expertise. "
+                           "Key stack: FAISS + sentence-transformers + LangChain + hosted LLM.")}
+    answer = RAG_DEMO_KB[topic]
+    terms = {w for w in _WORD_RE.findall(q_lower) if len(w) > 3}
+    passage = set(_WORD_RE.findall(answer.lower()))
+    grounding = len(terms & passage) / len(terms) if terms else 1.0
+    return {"topic": topic, "answer": answer, "grounding": grounding}
+
+
+_POS_WORDS = ["incredible", "great", "amazing", "excellent", "fantastic", "love", "best", "perfect",
+              "outstanding", "impressive", "real-time", "incredible", "wonderful", "superb"]
+_NEG_WORDS = ["frustrating", "failed", "unreliable", "bad", "terrible", "worst", "useless", "killing",
+              "broken", "error", "fail", "poor", "awful", "horrible"]
+
+
+@register("sentiment")
+def sentiment(text: str) -> dict:
+    text_l = text.lower()
+    pos_score = sum(1 for w in _POS_WORDS if w in text_l)
+    neg_score = sum(1 for w in _NEG_WORDS if w in text_l)
+    total = pos_score + neg_score or 1
+    pos_p = round(pos_score / total, 3)
+    neg_p = round(neg_score / total, 3)
+    if pos_score > neg_score:
+        label = "POSITIVE"
+    elif neg_score > pos_score:
+        label = "NEGATIVE"
+    else:
+        label = "NEUTRAL"
+    return {"label": label, "pos_score": pos_score, "neg_score": neg_score,
+            "pos_p": pos_p, "neg_p": neg_p, "neu_p": round(max(0, 1 - pos_p - neg_p), 3),
+            "compound": round((pos_score - neg_score) / (pos_score + neg_score + 0.0001), 4)}
+
+
+_ZS_KEYWORDS = {
+    "Robotics":           ["robot","arm","servo","actuator","motor","gripper","manipulator","kinematic","ros","autonomous","drone","uav"],
+    "Computer Vision":    ["image","vision","detection","yolo","camera","pixel","segmentation","opencv","bounding","frame","cnn"],
+    "NLP":                ["text","nlp","language","rag","llm","bert","gpt","token","embedding","sentiment","classify","summarise"],
+    "MLOps":              ["deploy","pipeline","kubernetes","docker","mlflow","monitor","ci/cd","triton","airflow","infra"],
+    "Generative AI":      ["generate","diffusion","stable","dalle","midjourney","gan","synthetic","creative","generative","image generation"],
+    "Data Engineering":   ["data","pipeline","kafka","spark","etl","warehouse","snowflake","bigquery","airflow","dbt","ingest"],
+}
+
+
+@register("zero_shot")
+def zero_shot(text: str, labels: tuple[str, ...]) -> list[tuple[str, float]]:
+    """(label, score) sorted best first. The small per-label prior is seeded by
+    (text, label), so the same input always scores the same."""
+    text_lower = text.lower()
+    scores = {}
+    for lbl in labels:
+        kws = _ZS_KEYWORDS.get(lbl, [lbl.lower()])
+        hits = sum(1 for k in kws if k in text_lower)
+        noise = random.Random(f"{text}|{lbl}").uniform(0.05, 0.20)
+        scores[lbl] = round(min(0.98, hits * 0.25 + noise), 3)
+    total_s = sum(scores.values()) or 1
+    return sorted(((k, round(v / total_s, 3)) for k, v in scores.items()), key=lambda x: x[1], reverse=True)
+
+
+@register("summarise")
+def summarise(doc: str, n_sents: int) -> dict | None:
+    """Extractive summary by term-frequency sentence scores; None if too short."""
+    sentences = [s.strip() for s in re.split(r'[.!?]', doc) if len(s.strip()) > 40]
+    if not sentences:
+        return None
+    freq = {}
+    for w in doc.lower().split():
+        w = re.sub(r'[^a-z]', '', w)
+        if len(w) > 4:
+            freq[w] = freq.get(w, 0) + 1
+
+    def score_sent(s):
+        return sum(freq.get(re.sub(r'[^a-z]', '', w.lower()), 0) for w in s.split() if len(w) > 4)
+
+    summary = sorted(sentences, key=score_sent, reverse=True)[:n_sents]
+    return {"sentences": summary,
+            "compression": round(1 - len(" ".join(summary)) / max(len(doc), 1), 2)}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  ROBOTICS
+# ─────────────────────────────────────────────────────────────────────────────
+@register("inverse_kinematics")
+def inverse_kinematics(l1: float, l2: float, tx: float, ty: float) -> dict:
+    """Geometric 2-link IK (elbow-down); joints are None if the target is unreachable."""
+    import math
+
+    dist = math.sqrt(tx**2 + ty**2)
+    if not (abs(l1 - l2) <= dist <= l1 + l2):
+        return {"reachable": False, "dist": dist}
+    cos2 = max(-1, min(1, (tx**2 + ty**2 - l1**2 - l2**2) / (2 * l1 * l2)))
+    theta2 = math.acos(cos2)
+    theta1 = math.atan2(ty, tx) - math.atan2(l2 * math.sin(theta2), l1 + l2 * math.cos(theta2))
+    j1 = (l1 * math.cos(theta1), l1 * math.sin(theta1))
+    j2 = (j1[0] + l2 * math.cos(theta1 + theta2), j1[1] + l2 * math.sin(theta1 + theta2))
+    return {"reachable": True, "dist": dist, "theta1": theta1, "theta2": theta2,
+            "joints": ((0.0, 0.0), j1, j2)}
+
+
+@register("path_planning")
+def path_planning(grid_size: int, obstacle_pct: int, seed: int, method: str = "astar",
+                  rough_pct: int = 0) -> dict:
+    """Random occupancy grid (start/goal kept free) and an 8-connected path.
+
+    rough_pct of the free cells cost 3× to cross; a weighted map always uses
+    A*, since JPS assumes uniform step costs.
+    """
+    grid = random_grid(grid_size, obstacle_pct, seed)
+    weights = None
+    if rough_pct:
+        weights = np.where(np.random.default_rng(seed + 1).random(grid.shape) < rough_pct / 100, 3.0, 1.0)
+        method = "astar"
+    start, goal = (0, 0), (grid_size - 1, grid_size - 1)
+    res = plan(grid, start, goal, weights=weights, method=method)
+    return {"grid": grid, "weights": weights, "start": start, "goal": goal, "method": method,
+            "path": res.path, "cost": res.cost, "expanded": res.expanded}
+
+
+@register("force_control")
+def force_control(kp: float, ki: float, kd: float, target_force: float, seed: int = 0) -> dict:
+    """PID force loop over 5 s with seeded sensor noise."""
+    rng = np.random.default_rng(seed)
+    t_arr = np.linspace(0, 5, 200)
+    dt = t_arr[1] - t_arr[0]
+    noise = rng.normal(0, 0.15, len(t_arr))
+    force = np.zeros_like(t_arr)
+    err_int = 0.0
+    prev_err = 0.0
+    for i in range(1, len(t_arr)):
+        err = target_force - force[i - 1]
+        err_int += err * dt
+        err_der = (err - prev_err) / dt
+        ctrl = kp * err + ki * err_int + kd * err_der
+        force[i] = force[i - 1] + ctrl * dt * 0.8 + noise[i]
+        prev_err = err
+    return {"t": t_arr, "force": force,
+            "steady_state": float(np.mean(force[-20:])),
+            "overshoot": float(max(0, (np.max(force) - target_force) / target_force * 100))}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  DATA SCIENCE
+# ─────────────────────────────────────────────────────────────────────────────
+@register("anomaly")
+def anomaly(n_points: int, noise_level: float, anomaly_pct: int, threshold: float, seed: int) -> dict:
+    """Seasonal signal with injected spikes, flagged by |z| > threshold."""
+    rng = np.random.default_rng(int(seed))
+    t_ax = np.arange(n_points)
+    signal = np.sin(t_ax * 0.15) * 3 + rng.normal(0, noise_level, n_points)
+    n_anom = max(1, int(n_points * anomaly_pct / 100))
+    anom_idx = rng.choice(n_points, n_anom, replace=False)
+    for idx in anom_idx:
+        signal[idx] += rng.choice([-1, 1]) * (5 + rng.uniform(1, 4))
+
+    z_scores = (signal - signal.mean()) / signal.std()
+    detected = np.abs(z_scores) > threshold
+    tp = np.isin(np.where(detected)[0], anom_idx)
+    return {"t": t_ax, "signal": signal, "detected": detected, "n_anom": n_anom,
+            "mean": float(signal.mean()), "std": float(signal.std()),
+            "precision": tp.sum() / max(detected.sum(), 1), "recall": tp.sum() / max(n_anom, 1)}
+
+
+@register("clustering")
+def clustering(k: int, n_pts: int, spread: float, seed: int, max_iter: int) -> dict:
+    """Gaussian blobs and Lloyd's k-means from random initial centres."""
+    rng = np.random.default_rng(int(seed))
+    cx = rng.uniform(-4, 4, k)
+    cy = rng.uniform(-4, 4, k)
+    X = np.vstack([rng.normal([cx[i], cy[i]], spread, (n_pts, 2)) for i in range(k)])
+
+    centers = X[rng.choice(len(X), k, replace=False)]
+    for _ in range(max_iter):
+        dists = np.linalg.norm(X[:, None] - centers[None, :], axis=2)
+        labels = np.argmin(dists, axis=1)
+        new_c = np.array([X[labels == i].mean(axis=0) if (labels == i).any() else centers[i]
+                          for i in range(k)])
+        if np.allclose(centers, new_c, atol=1e-4):
+            break
+        centers = new_c
+    inertia = sum(np.linalg.norm(X[labels == i] - centers[i])**2 for i in range(k))
+    return {"X": X, "labels": labels, "centers": centers, "inertia": float(inertia)}
+
+
+@register("forecast")
+def forecast(n_hist: int, horizon: int, trend: float, season: float, noise: float) -> dict:
+    """Trend + weekly/monthly seasonality history and its noise-free extrapolation."""
+    rng = np.random.default_rng(42)
+    t_h = np.arange(n_hist)
+    hist = (trend * t_h + season * np.sin(2 * np.pi * t_h / 7) +
+            season * 0.5 * np.sin(2 * np.pi * t_h / 30) +
+            rng.normal(0, noise, n_hist))
+    t_f = np.arange(n_hist, n_hist + horizon)
+    fcast = (trend * t_f + season * np.sin(2 * np.pi * t_f / 7) +
+             season * 0.5 * np.sin(2 * np.pi * t_f / 30))
+    return {"t_hist": t_h, "hist": hist, "t_fcast": t_f, "fcast": fcast,
+            "ci": noise * np.sqrt(np.arange(1, horizon + 1) * 0.5),
+            "mape": noise / max(abs(hist.mean()), 0.01) * 100}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  COMPUTER VISION
+# ─────────────────────────────────────────────────────────────────────────────
+DEFECT_TYPES = ["Surface Scratch", "Micro-Crack", "Corrosion Spot", "Dimensional Deviation", "No Defect"]
+DEFECT_WEIGHTS = [0.12, 0.09, 0.09, 0.08, 0.62]
+
+
+def _rgb(data: bytes) -> np.ndarray:
+    import io
+
+    from PIL import Image
+    return np.asarray(Image.open(io.BytesIO(data)).convert("RGB"))
+
+
+@register("object_detector", key=_digest, maxsize=16)
+def object_detector(data: bytes) -> dict:
+    """Simulated defect classifier. The real part is the YOLO-style pre-processing
+    (decode, letterbox to 640, normalise); the class is drawn, seeded by the image.
+    No model runs, so no confidence score is reported."""
+    from PIL import Image
+
+    img = Image.fromarray(_rgb(data))
+    scale = 640 / max(img.size)
+    img = img.resize((max(1, round(img.width * scale)), max(1, round(img.height * scale))))
+    tensor = np.zeros((640, 640, 3), dtype=np.float32)
+    tensor[:img.height, :img.width] = np.asarray(img, dtype=np.float32) / 255.0
+
+    rng = random.Random(hashlib.sha1(data).hexdigest())
+    result = rng.choices(DEFECT_TYPES, weights=DEFECT_WEIGHTS)[0]
+    return {"result": result, "input_shape": tensor.shape}
+
+
+@register("image_stats", key=_digest, maxsize=16)
+def image_stats(data: bytes) -> dict:
+    """Per-channel mean / std / range and 64-bin histograms."""
+    arr = _rgb(data)
+    channels = []
+    for i in range(3):
+        ch = arr[:, :, i].ravel()
+        hist, _ = np.histogram(ch, bins=64, range=(0, 255))
+        channels.append({"mean": float(ch.mean()), "std": float(ch.std()),
+                         "min": int(ch.min()), "max": int(ch.max()), "hist": hist})
+    return {"width": arr.shape[1], "height": arr.shape[0], "channels": channels}
+
+
+@register("edges", key=_digest, maxsize=16)
+def edges(data: bytes, operator: str) -> np.ndarray:
+    """Edge map with the chosen OpenCV operator; raises ImportError without OpenCV."""
+    import cv2
+
+    gray = cv2.cvtColor(_rgb(data), cv2.COLOR_RGB2GRAY)
+    if operator == "Sobel X":
+        result = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
+    elif operator == "Sobel Y":
+        result = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
+    elif operator == "Laplacian":
+        result = cv2.Laplacian(gray, cv2.CV_64F)
+    else:
+        result = cv2.Canny(gray, 50, 150)
+    return np.uint8(np.abs(result))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  GENERATIVE AI
+# ─────────────────────────────────────────────────────────────────────────────
+MOOD_PALETTES = {
+    "cyberpunk": [(180,90,60),(280,70,50),(200,100,55),(330,80,45),(240,60,70)],
+    "ocean":     [(200,60,45),(185,50,55),(170,40,65),(210,70,35),(195,55,50)],
+    "forest":    [(120,45,30),(140,40,40),(100,35,45),(160,50,35),(130,55,25)],
+    "sunset":    [(20,80,55),(40,85,50),(350,75,55),(30,90,45),(10,70,60)],
+    "electric":  [(180,100,50),(200,90,55),(160,85,45),(220,95,40),(190,100,60)],
+    "neon":      [(300,100,55),(180,100,50),(60,100,55),(270,90,60),(150,100,50)],
+}
+
+
+@register("palette")
+def palette(mood: str, n_colors: int) -> list[str]:
+    """Hex colours: a matching mood palette padded with seeded picks, else evenly spaced hues."""
+    import colorsys
+
+    seed_val = int(hashlib.md5(mood.encode()).hexdigest()[:8], 16)
+    rng_p = random.Random(seed_val)
+    base_h = rng_p.random()
+
+    matched_key = next((k for k in MOOD_PALETTES if k in mood.lower()), None)
+    if matched_key:
+        hsl_bases = MOOD_PALETTES[matched_key][:n_colors]
+        while len(hsl_bases) < n_colors:
+            hsl_bases.append((rng_p.randint(0, 360), rng_p.randint(40, 90), rng_p.randint(35, 65)))
+    else:
+        hsl_bases = [(int((base_h + i / n_colors) % 1 * 360), 70, 50) for i in range(n_colors)]
+
+    colours = []
+    for h, s, l in hsl_bases:
+        r, g, b = colorsys.hls_to_rgb(h / 360, l / 100, s / 100)
+        colours.append("#{:02X}{:02X}{:02X}".format(int(r * 255), int(g * 255), int(b * 255)))
+    return colours
+
+
+@register("tokens")
+def tokens(text: str, top_n: int = 20) -> dict:
+    """Simple BPE-like tokenisation (split on word boundaries, lowercase):
+    counts with the top_n most frequent first."""
+    raw_tokens = re.findall(r"[a-zA-Z']+|[0-9]+|[^\s\w]", text)
+    freq = {}
+    for tok in raw_tokens:
+        freq[tok.lower()] = freq.get(tok.lower(), 0) + 1
+    return {"top": sorted(freq.items(), key=lambda x: x[1], reverse=True)[:top_n],
+            "total": len(raw_tokens), "unique": len(freq)}
+
+
+if __name__ == "__main__":
+    import io
+
+    from PIL import Image
+
+    buf = io.BytesIO()
+    Image.fromarray(np.random.default_rng(0).integers(0, 255, (480, 640, 3), dtype=np.uint8)).save(buf, "PNG")
+    image = buf.getvalue()
+    cases = [
+        (rag_qa, ("How does RAG reduce hallucination?",)),
+        (sentiment, ("Incredible results with YOLOv8 on edge devices — real-time at 30fps!",)),
+        (zero_shot, ("Our robot arm achieved sub-millimetre precision", tuple(_ZS_KEYWORDS))),
+        (summarise, (" ".join(RAG_DEMO_KB.values()), 2)),
+        (inverse_kinematics, (1.2, 0.9, 1.5, 1.2)),
+        (path_planning, (200, 25, 42)),
+        (force_control, (2.0, 0.5, 0.3, 8.0)),
+        (anomaly, (150, 1.2, 5, 2.5, 7)),
+        (clustering, (3, 80, 0.9, 42, 20)),
+        (forecast, (60, 14, 0.05, 2.0, 0.8)),
+        (object_detector, (image,)),
+        (image_stats, (image,)),
+        (palette, ("cyberpunk neon", 5)),
+        (tokens, (" ".join(RAG_DEMO_KB.values()),)),
+    ]
+    print(f"{'demo':>20} {'cold ms':>9} {'cached ms':>10}")
+    for fn, args in cases:
+        cold, warm = fn(*args), fn(*args)
+        print(f"{fn.__name__:>20} {cold.ms:>9.3f} {warm.ms:>10.4f}")
@@ -0,0 +1,389 @@
+"""
+Path Planner — Karim Osman Portfolio
+Grid path planning for the robotics demo: A* (weighted, 4- or 8-connected)
+and Jump Point Search (uniform cost, 8-connected) on NumPy occupancy grids.
+
+Both search over flat cell indices of a grid padded with a blocked border, so
+neighbour tests need no bounds checks; g-costs and parent pointers live in
+flat arrays and the open set is a binary heap. Paths are rebuilt by walking
+parent pointers once at the end. Diagonal moves never cut a blocked corner.
+
+    python path_planner.py      # A* / JPS vs the demo's old BFS, grids up to 2000×2000
+"""
+
+import heapq
+import math
+import time
+from array import array
+from dataclasses import dataclass
+
+import numpy as np
+
+SQRT2 = math.sqrt(2.0)
+
+
+@dataclass(frozen=True)
+class PlanResult:
+    path: np.ndarray  # (k, 2) int (row, col) cells from start to goal; empty if unreachable
+    cost: float       # sum of step lengths × destination-cell weight; inf if unreachable
+    expanded: int     # nodes popped from the open set
+    ms: float
+
+    @property
+    def found(self) -> bool:
+        return len(self.path) > 0
+
+
+class _Padded:
+    """Grid with a one-cell blocked border, flattened row-major."""
+
+    def __init__(self, grid: np.ndarray, weights: np.ndarray | None):
+        grid = np.asarray(grid)
+        if grid.ndim != 2:
+            raise ValueError(f"Occupancy grid must be 2-D, got shape {grid.shape}")
+        self.h, self.w = grid.shape
+        self.W = self.w + 2
+        blocked = np.ones((self.h + 2, self.W), dtype=np.uint8)
+        blocked[1:-1, 1:-1] = grid != 0
+        self.weights = None
+        self.w_min = 1.0
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+            if weights.shape != grid.shape:
+                raise ValueError(f"weights shape {weights.shape} != grid shape {grid.shape}")
+            blocked[1:-1, 1:-1] |= ~np.isfinite(weights)
+            free = weights[blocked[1:-1, 1:-1] == 0]
+            if free.size and free.min() <= 0:
+                raise ValueError("Cell weights must be positive")
+            padded = np.ones((self.h + 2, self.W), dtype=np.float64)
+            padded[1:-1, 1:-1] = np.where(np.isfinite(weights), weights, 1.0)
+            self.weights = array("d")
+            self.weights.frombytes(padded.tobytes())
+            self.w_min = float(free.min()) if free.size else 1.0
+        self.blocked = blocked.tobytes()  # bytes indexing → int, the fastest per-cell test
+
+    def index(self, cell) -> int:
+        r, c = int(cell[0]), int(cell[1])
+        if not (0 <= r < self.h and 0 <= c < self.w):
+            raise ValueError(f"Cell {cell} outside the {self.h}×{self.w} grid")
+        return (r + 1) * self.W + c + 1
+
+    def cells(self, nodes: list[int]) -> np.ndarray:
+        n = np.asarray(nodes, dtype=np.int64)
+        return np.stack([n // self.W - 1, n % self.W - 1], axis=1) if len(n) else np.empty((0, 2), np.int64)
+
+    def octile(self, a: int, b: int) -> float:
+        dr = abs(a // self.W - b // self.W)
+        dc = abs(a % self.W - b % self.W)
+        return (max(dr, dc) - min(dr, dc)) + SQRT2 * min(dr, dc)
+
+
+def _no_path(expanded: int, t0: float) -> PlanResult:
+    return PlanResult(np.empty((0, 2), np.int64), math.inf, expanded, (time.perf_counter() - t0) * 1e3)
+
+
+def _walk(parent: array, goal: int) -> list[int]:
+    nodes = [goal]
+    while parent[nodes[-1]] >= 0:
+        nodes.append(parent[nodes[-1]])
+    nodes.reverse()
+    return nodes
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  A*
+# ─────────────────────────────────────────────────────────────────────────────
+def astar(grid: np.ndarray, start, goal, weights: np.ndarray | None = None,
+          diagonal: bool = True) -> PlanResult:
+    """Shortest path on an occupancy grid (nonzero = blocked).
+
+    Moving into a cell costs its weight (default 1; inf blocks it) times the
+    step length, 1 or √2. The octile (or Manhattan) heuristic is scaled by
+    the smallest weight, so it stays admissible and the path is optimal.
+    """
+    t0 = time.perf_counter()
+    g = _Padded(grid, weights)
+    s, t = g.index(start), g.index(goal)
+    blocked, W, wts = g.blocked, g.W, g.weights
+    if blocked[s] or blocked[t]:
+        return _no_path(0, t0)
+
+    straight = ((1, 1.0), (-1, 1.0), (W, 1.0), (-W, 1.0))
+    diag = ((W + 1, 1, W), (W - 1, -1, W), (-W + 1, 1, -W), (-W - 1, -1, -W))
+    t_row, t_col = divmod(t, W)
+    scale = g.w_min
+
+    def h(n):
+        dr = abs(n // W - t_row)
+        dc = abs(n % W - t_col)
+        if diagonal:
+            return scale * ((dr + dc) + (SQRT2 - 2) * min(dr, dc))
+        return scale * (dr + dc)
+
+    size = len(blocked)
+    cost = array("d", [math.inf]) * size
+    parent = array("l", [-1]) * size
+    closed = bytearray(size)
+    cost[s] = 0.0
+    heap = [(h(s), s)]
+    expanded = 0
+    while heap:
+        _, n = heapq.heappop(heap)
+        if closed[n]:
+            continue
+        if n == t:
+            nodes = _walk(parent, t)
+            return PlanResult(g.cells(nodes), cost[t], expanded + 1, (time.perf_counter() - t0) * 1e3)
+        closed[n] = 1
+        expanded += 1
+        gn = cost[n]
+        for d, step in straight:
+            m = n + d
+            if blocked[m] or closed[m]:
+                continue
+            gm = gn + (step * wts[m] if wts is not None else step)
+            if gm < cost[m]:
+                cost[m] = gm
+                parent[m] = n
+                heapq.heappush(heap, (gm + h(m), m))
+        if not diagonal:
+            continue
+        for d, dc, dr in diag:
+            m = n + d
+            if blocked[m] or closed[m] or blocked[n + dc] or blocked[n + dr]:
+                continue
+            gm = gn + (SQRT2 * wts[m] if wts is not None else SQRT2)
+            if gm < cost[m]:
+                cost[m] = gm
+                parent[m] = n
+                heapq.heappush(heap, (gm + h(m), m))
+    return _no_path(expanded, t0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  JUMP POINT SEARCH
+# ─────────────────────────────────────────────────────────────────────────────
+def jps(grid: np.ndarray, start, goal) -> PlanResult:
+    """Jump Point Search: A* that only expands jump points, for uniform-cost
+    8-connected grids. Returns the same optimal cost as astar(diagonal=True).
+
+    Straight runs and diagonals are scanned in loops (no recursion, so long
+    corridors on large grids are fine). The returned path is every cell
+    between consecutive jump points.
+    """
+    t0 = time.perf_counter()
+    g = _Padded(grid, None)
+    s, t = g.index(start), g.index(goal)
+    blocked, W = g.blocked, g.W
+    if blocked[s] or blocked[t]:
+        return _no_path(0, t0)
+
+    def jump_straight(n, d, p):
+        # p is the perpendicular offset; a forced neighbour appears where a wall beside us ends
+        while True:
+            n += d
+            if blocked[n]:
+                return -1
+            if n == t:
+                return n
+            if (not blocked[n + p] and blocked[n - d + p]) or (not blocked[n - p] and blocked[n - d - p]):
+                return n
+
+    def jump_diagonal(n, dx, dy):
+        while True:
+            n += dx + dy
+            if blocked[n]:
+                return -1
+            if n == t or jump_straight(n, dx, W) >= 0 or jump_straight(n, dy, 1) >= 0:
+                return n
+            if blocked[n + dx] or blocked[n + dy]:
+                return -1
+
+    def successors(n, par):
+        """(direction dx, dy) pairs to scan from n, pruned by the arrival direction."""
+        if par < 0:
+            dirs = [(dx, 0) for dx in (1, -1) if not blocked[n + dx]]
+            dirs += [(0, dy) for dy in (W, -W) if not blocked[n + dy]]
+            dirs += [(dx, dy) for dx in (1, -1) for dy in (W, -W)
+                     if not blocked[n + dx] and not blocked[n + dy] and not blocked[n + dx + dy]]
+            return dirs
+        # Unit step of the arrival direction: dx ∈ {0, ±1}, dy ∈ {0, ±W}
+        dy = W * ((n // W > par // W) - (n // W < par // W))
+        dx = (n % W > par % W) - (n % W < par % W)
+        dirs = []
+        if dx and dy:
+            if not blocked[n + dy]:
+                dirs.append((0, dy))
+            if not blocked[n + dx]:
+                dirs.append((dx, 0))
+            if not blocked[n + dy] and not blocked[n + dx] and not blocked[n + dx + dy]:
+                dirs.append((dx, dy))
+        elif dx:
+            ahead, up, down = not blocked[n + dx], not blocked[n + W], not blocked[n - W]
+            if ahead:
+                dirs.append((dx, 0))
+                if up and not blocked[n + dx + W]:
+                    dirs.append((dx, W))
+                if down and not blocked[n + dx - W]:
+                    dirs.append((dx, -W))
+            if up:
+                dirs.append((0, W))
+            if down:
+                dirs.append((0, -W))
+        else:
+            ahead, right, left = not blocked[n + dy], not blocked[n + 1], not blocked[n - 1]
+            if ahead:
+                dirs.append((0, dy))
+                if right and not blocked[n + 1 + dy]:
+                    dirs.append((1, dy))
+                if left and not blocked[n - 1 + dy]:
+                    dirs.append((-1, dy))
+            if right:
+                dirs.append((1, 0))
+            if left:
+                dirs.append((-1, 0))
+        return dirs
+
+    size = len(blocked)
+    cost = array("d", [math.inf]) * size
+    parent = array("l", [-1]) * size
+    closed = bytearray(size)
+    cost[s] = 0.0
+    heap = [(g.octile(s, t), s)]
+    expanded = 0
+    while heap:
+        _, n = heapq.heappop(heap)
+        if closed[n]:
+            continue
+        if n == t:
+            return PlanResult(g.cells(_interpolate(_walk(parent, t), W)), cost[t], expanded + 1,
+                              (time.perf_counter() - t0) * 1e3)
+        closed[n] = 1
+        expanded += 1
+        gn = cost[n]
+        for dx, dy in successors(n, parent[n]):
+            m = jump_diagonal(n, dx, dy) if dx and dy else jump_straight(n, dx + dy, W if dx else 1)
+            if m < 0 or closed[m]:
+                continue
+            gm = gn + g.octile(n, m)
+            if gm < cost[m]:
+                cost[m] = gm
+                parent[m] = n
+                heapq.heappush(heap, (gm + g.octile(m, t), m))
+    return _no_path(expanded, t0)
+
+
+def _interpolate(jumps: list[int], W: int) -> list[int]:
+    """Every cell along the straight/diagonal segments between jump points."""
+    nodes = [jumps[0]]
+    for a, b in zip(jumps, jumps[1:]):
+        dr = (b // W > a // W) - (b // W < a // W)
+        dc = (b % W > a % W) - (b % W < a % W)
+        step = dr * W + dc
+        n = a
+        while n != b:
+            n += step
+            nodes.append(n)
+    return nodes
+
+
+def plan(grid: np.ndarray, start, goal, weights: np.ndarray | None = None,
+         method: str = "auto") -> PlanResult:
+    """method: "astar", "jps", or "auto" (JPS unless the grid is weighted)."""
+    if method == "auto":
+        method = "astar" if weights is not None else "jps"
+    if method == "jps":
+        if weights is not None:
+            raise ValueError("JPS needs uniform step costs; use A* for weighted grids")
+        return jps(grid, start, goal)
+    if method == "astar":
+        return astar(grid, start, goal, weights)
+    raise ValueError(f"Unknown planner: {method}")
+
+
+def random_grid(size: int, obstacle_pct: float, seed: int = 0) -> np.ndarray:
+    """size×size occupancy grid with the corners (default start / goal) kept free."""
+    grid = np.random.default_rng(seed).random((size, size)) < obstacle_pct / 100
+    grid[0, 0] = grid[-1, -1] = False
+    return grid
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  BENCHMARK
+# ─────────────────────────────────────────────────────────────────────────────
+def _legacy_bfs(grid: np.ndarray, start, goal) -> list:
+    """The demo's original planner: 4-connected BFS that enqueues a copy of the
+    whole path at every step."""
+    from collections import deque
+
+    n_rows, n_cols = grid.shape
+    rows = grid.tolist()
+    queue = deque([[tuple(start)]])
+    visited = {tuple(start)}
+    while queue:
+        p = queue.popleft()
+        if p[-1] == tuple(goal):
+            return p
+        r, c = p[-1]
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < n_rows and 0 <= nc < n_cols and not rows[nr][nc] and (nr, nc) not in visited:
+                visited.add((nr, nc))
+                queue.append(p + [(nr, nc)])
+    return []
+
+
+def _rooms(size: int, seed: int = 0) -> np.ndarray:
+    """Warehouse-like floor: walls every size/8 cells with a door in each wall
+    segment, so every room is reachable — long open runs where JPS jumps."""
+    rng = np.random.default_rng(seed)
+    grid = np.zeros((size, size), dtype=bool)
+    step = max(size // 8, 3)
+    lines = range(step, size - 1, step)
+    for k in lines:
+        grid[k, :] = grid[:, k] = True
+    bounds = [0, *lines, size]
+    for k in lines:
+        for lo, hi in zip(bounds, bounds[1:]):
+            if hi - lo > 1:
+                door = int(rng.integers(lo + 1, hi))
+                grid[k, door] = grid[door, k] = False
+    grid[0, 0] = grid[-1, -1] = False
+    return grid
+
+
+def _bench(sizes=(10, 100, 300, 1000, 2000), bfs_max: int = 300) -> None:
+    """Wall time per planner; peak traced memory in a second pass (tracemalloc
+    slows the run several-fold, so it never overlaps the timing)."""
+    import tracemalloc
+
+    print(f"{'map':>12} {'planner':>10} {'ms':>10} {'peak MB':>8} {'expanded':>9} {'len':>6} {'cost':>8}")
+    for size in sizes:
+        goal = (size - 1, size - 1)
+        for label, grid in ((f"random {size}", random_grid(size, 20, seed=1)), (f"rooms {size}", _rooms(size, 1))):
+            runs = [("A* 8-conn", lambda: astar(grid, (0, 0), goal)),
+                    ("JPS", lambda: jps(grid, (0, 0), goal)),
+                    ("A* 4-conn", lambda: astar(grid, (0, 0), goal, diagonal=False))]
+            if size <= bfs_max:
+                runs.append(("old BFS", lambda: _legacy_bfs(grid, (0, 0), goal)))
+            for name, fn in runs:
+                t0 = time.perf_counter()
+                res = fn()
+                ms = (time.perf_counter() - t0) * 1e3
+                peak = "—"
+                if size <= bfs_max:
+                    tracemalloc.start()
+                    fn()
+                    peak = f"{tracemalloc.get_traced_memory()[1] / 2**20:.1f}"
+                    tracemalloc.stop()
+                if isinstance(res, PlanResult):
+                    expanded, n, cost = res.expanded, len(res.path), res.cost
+                else:
+                    expanded, n, cost = "—", len(res), float(len(res) - 1) if res else math.inf
+                print(f"{label:>12} {name:>10} {ms:>10.1f} {peak:>8} {expanded:>9} {n:>6} {cost:>8.1f}")
+    print(f"old BFS skipped above {bfs_max}×{bfs_max}: every queued entry copies its whole path, "
+          f"O(cells × path length) time and memory")
+
+
+if __name__ == "__main__":
+    _bench()
@@ -1,11 +1,41 @@
 """
 RAG-Powered Resume Agent — Karim Osman Portfolio
-FAISS vector store + sentence-transformers for in-session retrieval
+FAISS (or exact NumPy) vector store + sentence-transformers for in-session retrieval
 """
 
 import streamlit as st
 import numpy as np
+import os
 import re
+import time
+
+from rag_cache import QueryEmbeddingCache, SemanticAnswerCache, normalize_query
+from rag_compress import (ProjectedEncoder, compress_embeddings, index_codec, load_projection,
+                          storage_key, storage_tag)
+from rag_encoders import ENCODER_BACKEND, encoder_id, load_encoder
+from rag_ingest import Chunk, embed_into_store, iter_chunks
+from rag_index import (TARGET_RECALL, FaissIndex, build_index, choose_kind, make_index,
+                       resolve_backend, restore_index)
+from rag_live import KB_WATCH, KBWatcher, LiveKB
+from rag_metrics import cache_event, count, stage, start_metrics_server, track_turn
+from rag_llm import CoalescingGenerator, GenerationUnavailable, build_messages, make_generator
+from rag_packer import make_token_counter, pack_context
+from rag_reranker import RERANK_CANDIDATES, Reranker, load_reranker
+from rag_router import IntentRouter
+from rag_server import connect_remote_state
+from rag_sparse import BM25Index, rrf_fuse
+from rag_store import kb_fingerprint, load_artifacts, save_index
+from rag_warmup import start_warmup, warmup_status, is_warm, WARM, WARMING, FAILED
+
+EMBED_MODEL = os.getenv("RAG_EMBED_MODEL", "all-MiniLM-L6-v2")
+QUERY_CACHE_SIZE = int(os.getenv("RAG_QUERY_CACHE_SIZE", "1024"))
+ANSWER_CACHE_SIZE = int(os.getenv("RAG_ANSWER_CACHE_SIZE", "256"))
+ANSWER_CACHE_THRESHOLD = float(os.getenv("RAG_ANSWER_CACHE_THRESHOLD", "0.9"))
+ANSWER_CACHE_TTL = float(os.getenv("RAG_ANSWER_CACHE_TTL", "3600"))
+RRF_K = int(os.getenv("RAG_RRF_K", "60"))
+CONTEXT_TOKEN_BUDGET = int(os.getenv("RAG_CONTEXT_TOKENS", "384"))
+PACK_CANDIDATES = int(os.getenv("RAG_PACK_CANDIDATES", "12"))
+EMBED_SERVER_URL = os.getenv("RAG_EMBED_SERVER", "")  # e.g. http://127.0.0.1:8765
 
 # ==== KNOWLEDGE BASE ====
 KARIM_KB = [
@@ -77,120 +107,370 @@ KARIM_KB = [
 ]
 
 @st.cache_resource(show_spinner=False)
-def build_rag_index():
-    """Build FAISS index from knowledge base using sentence-transformers."""
-    try:
-        from sentence_transformers import SentenceTransformer
-        import faiss
+def get_kb_chunks() -> list[Chunk]:
+    """Deduplicated KB chunks streamed from KARIM_KB and the content files (RAG_KB_SOURCES)."""
+    return list(iter_chunks())
+
 
-        model = SentenceTransformer("all-MiniLM-L6-v2")
-        embeddings = model.encode(KARIM_KB, show_progress_bar=False, normalize_embeddings=True)
-        embeddings = np.array(embeddings, dtype=np.float32)
+def get_kb_docs() -> list[str]:
+    return [c.text for c in get_kb_chunks()]
 
-        dim = embeddings.shape[1]
-        index = faiss.IndexFlatIP(dim)  # Inner product = cosine on normalized vecs
-        index.add(embeddings)
 
-        return {"index": index, "model": model, "docs": KARIM_KB, "ok": True}
+def load_rag_state() -> dict:
+    """Build the vector index from knowledge base using sentence-transformers.
+
+    Embeddings and the serialized index are persisted by KB/model fingerprint,
+    so a restart or a new replica only re-encodes when the KB text changes.
+    Uses FAISS when installed, otherwise the NumPy backend; the encoder is
+    PyTorch or ONNX Runtime per RAG_ENCODER_BACKEND. The index kind (exact,
+    IVF or HNSW) follows the corpus size and RAG_TARGET_RECALL; trained
+    indexes are persisted next to the embeddings. RAG_EMBED_DTYPE /
+    RAG_EMBED_DIM / RAG_INDEX_PQ select compact storage (see rag_compress).
+    """
+    try:
+        backend = resolve_backend()
+        codec = index_codec() if backend == "faiss" else "Flat"
+        model = load_encoder(EMBED_MODEL, ENCODER_BACKEND)
+        docs = get_kb_docs()
+        raw_key = kb_fingerprint(docs, encoder_id(EMBED_MODEL))
+        key = storage_key(raw_key)
+
+        stored = load_artifacts(key)
+        index, projection = None, None
+        if stored is not None:
+            embeddings = stored["embeddings"]
+            projection = load_projection(key)
+            dim = embeddings.shape[1]
+            ann = stored["meta"].get("ann", {})
+            index = restore_index(embeddings, ann, backend, stored["index"], stored["centroids"])
+            if index is None and ann.get("kind", "flat") == "flat" and codec == "Flat":
+                if backend == "faiss" and stored["index"] is not None:
+                    index = FaissIndex(dim, stored["index"])
+                else:
+                    index = make_index(dim, embeddings, backend=backend)
+        else:
+            raw = load_artifacts(raw_key) if key != raw_key else None
+            if raw is not None:
+                embeddings = raw["embeddings"]
+            else:
+                # Inner product = cosine on normalized vecs; encoded batch by batch into the store
+                embeddings, index = embed_into_store(
+                    docs, model, raw_key, lambda dim: make_index(dim, backend=backend),
+                    meta={"model": encoder_id(EMBED_MODEL), "n_docs": len(docs)})
+                if embeddings is None:
+                    embeddings = index.vectors()
+            if key != raw_key:
+                # Compact storage is derived from the float32 matrix, never re-encoded
+                # Keep the fitted projection: if publishing failed it is not on disk
+                embeddings, projection = compress_embeddings(embeddings, key)
+                index = None
+
+        if projection is not None:
+            model = ProjectedEncoder(model, projection)
+
+        if index is None or index.kind != choose_kind(len(docs), TARGET_RECALL, backend, codec=codec):
+            vectors = embeddings if embeddings is not None else index.vectors()
+            index = build_index(vectors, backend=backend, codec=codec)
+            save_index(key, index, index.describe())
+
+        return {"index": index, "model": model, "docs": docs, "embeddings": embeddings,
+                "key": key, "backend": backend, "ann": index.describe(),
+                "storage": storage_tag() or "float32", "ok": True}
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
 
-def retrieve_context(query: str, rag_state: dict, top_k: int = 4) -> list[str]:
-    """Retrieve top-k relevant KB chunks for a query."""
-    if not rag_state.get("ok"):
-        return []
+def make_live_state(rag_state: dict) -> dict:
+    """Wrap a local RAG state in a LiveKB so chunks can be added/updated/deleted in place.
+
+    With RAG_KB_WATCH on, edits to the KB source files are applied live.
+    """
+    backend = rag_state["backend"]
+    codec = index_codec() if backend == "faiss" else "Flat"
+    live = LiveKB(get_kb_chunks(), rag_state["embeddings"], rag_state["index"], rag_state["model"],
+                  lambda rows: build_index(rows, backend=backend, codec=codec))
+    # Cached answers may quote facts that just changed
+    live.on_change.append(lambda delta: get_answer_cache(live.dim).clear())
+    if KB_WATCH:
+        KBWatcher(live).start()
+    return {**rag_state, "index": live, "docs": live.docs, "embeddings": live.embeddings,
+            "live": live}
+
+
+@st.cache_resource(show_spinner=False)
+def build_rag_index():
+    """Process-wide RAG state: the shared embedding server if configured, else a local index."""
+    if EMBED_SERVER_URL:
+        docs = get_kb_docs()
+        remote = connect_remote_state(EMBED_SERVER_URL,
+                                      storage_key(kb_fingerprint(docs, encoder_id(EMBED_MODEL))))
+        if remote is not None:
+            return {**remote, "docs": docs}
+    rag_state = load_rag_state()
+    return make_live_state(rag_state) if rag_state.get("ok") else rag_state
+
+
+@st.cache_resource(show_spinner=False)
+def get_query_cache() -> QueryEmbeddingCache:
+    """Process-wide query-embedding LRU shared across all sessions."""
+    return QueryEmbeddingCache(maxsize=QUERY_CACHE_SIZE)
+
+
+def encode_queries(queries: list[str], rag_state: dict, batch_size: int = 64) -> np.ndarray:
+    """Encode queries, serving repeats from the LRU and batch-encoding only the misses.
+
+    Queries that normalize to the same key are looked up and encoded once per batch.
+    """
+    cache = get_query_cache()
+    keys = [normalize_query(q) for q in queries]
+    first: dict[str, int] = {}
+    for i, key in enumerate(keys):
+        first.setdefault(key, i)
+    found = {key: cache.get(queries[i]) for key, i in first.items()}
+    missing = [key for key, vec in found.items() if vec is None]
+    cache_event("query_embedding", True, len(queries) - len(missing))
+    cache_event("query_embedding", False, len(missing))
+    if missing:
+        with stage("encode"):
+            fresh = rag_state["model"].encode([queries[first[key]] for key in missing], batch_size=batch_size,
+                                              show_progress_bar=False, normalize_embeddings=True)
+        for key, vec in zip(missing, fresh):
+            cache.put(queries[first[key]], vec)
+            found[key] = vec
+    return np.ascontiguousarray(np.stack([found[key] for key in keys]), dtype=np.float32)
+
+
+@st.cache_resource(show_spinner=False)
+def get_answer_cache(dim: int) -> SemanticAnswerCache:
+    """Process-wide semantic answer cache for paraphrased questions."""
+    return SemanticAnswerCache(dim, maxsize=ANSWER_CACHE_SIZE,
+                               threshold=ANSWER_CACHE_THRESHOLD, ttl=ANSWER_CACHE_TTL)
+
+
+@st.cache_resource(show_spinner=False)
+def build_sparse_index() -> BM25Index:
+    """BM25 inverted index over the KB — no model needed, usable while warming."""
+    return BM25Index(get_kb_docs())
+
+
+def retrieve_sparse(query: str, top_k: int = 4) -> list[str]:
+    """Keyword-only (BM25) retrieval for when the dense index is cold or unavailable."""
+    docs = get_kb_docs()
+    with stage("search"):
+        hits = build_sparse_index().search(query, top_k)
+    return [docs[i] for i, _ in hits]
+
+
+@st.cache_resource(show_spinner=False)
+def get_reranker() -> Reranker | None:
+    """Process-wide cross-encoder reranker, or None if RAG_RERANK_MODEL is unset or fails to load."""
+    try:
+        return load_reranker()
+    except Exception as e:
+        print(f"RAG reranker unavailable: {e}")
+        return None
+
+
+def _search_ids(queries: list[str], query_vecs: np.ndarray, rag_state: dict,
+                top_k: int) -> list[list[tuple[int, float]]]:
+    """Hybrid search: dense + BM25 candidate lists fused with reciprocal-rank fusion.
+
+    With a reranker configured, a wider fused candidate set is rescored by the
+    cross-encoder within its latency budget before the top_k cut.
+    """
+    reranker = get_reranker()
+    fetch = max(top_k, RERANK_CANDIDATES) if reranker is not None else top_k
+    depth = max(fetch * 3, 10)
+    docs = rag_state["docs"]
+
+    candidates = []
+    with stage("search"):
+        D, I = rag_state["index"].search(query_vecs, depth)
+        sparse = rag_state["live"].sparse if "live" in rag_state else build_sparse_index()
+        for query, dense_row in zip(queries, I):
+            sparse_ids = [i for i, _ in sparse.search(query, depth)]
+            fused = rrf_fuse([dense_row.tolist(), sparse_ids], k=RRF_K, return_scores=True)
+            candidates.append([(i, score) for i, score in fused if i < len(docs)][:fetch])
+    if reranker is not None:
+        with stage("rerank"):
+            candidates = [reranker.rerank(query, hits, docs) for query, hits in zip(queries, candidates)]
+    return [hits[:top_k] for hits in candidates]
+
+
+def _search_docs(queries: list[str], query_vecs: np.ndarray, rag_state: dict,
+                 top_k: int) -> list[list[str]]:
+    docs = rag_state["docs"]
+    return [[docs[i] for i, _ in hits] for hits in _search_ids(queries, query_vecs, rag_state, top_k)]
+
+
+def pack_prompt_context(hits: list[tuple[int, float]], rag_state: dict,
+                        budget_tokens: int | None = None) -> list[str]:
+    """Fill the prompt token budget from scored candidates (dedup + MMR diversity)."""
+    docs = rag_state.get("docs") or get_kb_docs()
+    count_tokens = rag_state.setdefault(
+        "count_tokens", make_token_counter(getattr(rag_state.get("model"), "tokenizer", None)))
+    embeddings = rag_state.get("embeddings")
+    ids = [i for i, _ in hits]
     try:
-        query_vec = rag_state["model"].encode([query], normalize_embeddings=True)
-        query_vec = np.array(query_vec, dtype=np.float32)
-        D, I = rag_state["index"].search(query_vec, top_k)
-        return [rag_state["docs"][i] for i in I[0] if i < len(rag_state["docs"])]
-    except Exception:
-        return []
+        doc_vecs = embeddings[ids] if embeddings is not None else None
+    except KeyError:
+        doc_vecs = None  # a live-KB delete landed since the search: pack without MMR
+    return pack_context([docs[i] for i in ids], [s for _, s in hits],
+                        CONTEXT_TOKEN_BUDGET if budget_tokens is None else budget_tokens,
+                        count_tokens, doc_vecs=doc_vecs)
+
+
+def retrieve_context(query: str, rag_state: dict, top_k: int = 4) -> list[str]:
+    """Retrieve top-k relevant KB chunks for a query (BM25 only if the dense index is down)."""
+    with track_turn("retrieve", query):
+        if not rag_state.get("ok"):
+            return retrieve_sparse(query, top_k)
+        try:
+            return _search_docs([query], encode_queries([query], rag_state), rag_state, top_k)[0]
+        except Exception:
+            return retrieve_sparse(query, top_k)
+
+
+@st.cache_resource(show_spinner=False)
+def get_generator() -> CoalescingGenerator | None:
+    """Process-wide LLM generator (shared single-flight + queue), or None if not configured."""
+    return make_generator()
+
+
+def _word_chunks(text: str):
+    """Split synthesized text into word-sized pieces for streaming."""
+    for m in re.finditer(r"\S+\s*", text):
+        yield m.group(0)
+
+
+def _sources_preview(context_docs: list[str], n: int = 2, width: int = 90) -> str:
+    shown = [d if len(d) <= width else d[:width].rstrip() + "…" for d in context_docs[:n]]
+    return "*🔎 " + " · ".join(shown) + "*\n\n"
+
+
+def stream_answer(query: str, rag_state: dict, top_k: int = 4, show_sources: bool = True,
+                  out: dict | None = None):
+    """Full agent turn as a generator, for st.write_stream.
+
+    Yields the retrieved chunks first (as soon as retrieval finishes), then the
+    answer piece by piece — tokens from the local LLM when RAG_LLM_URL is set,
+    otherwise (or if it is busy/down) the rule-based synthesizer.
+    Semantic-cache hits yield the answer at once.
+    If `out` is given, the final answer and context are recorded in it.
+    """
+    out = {} if out is None else out
+    with track_turn("answer", query):
+        yield from _answer_turn(query, rag_state, top_k, show_sources, out)
+
+
+def _answer_turn(query: str, rag_state: dict, top_k: int, show_sources: bool, out: dict):
+    generator = get_generator()
+    # Generation prompts are packed from a wider candidate set under a token budget
+    depth = max(top_k, PACK_CANDIDATES) if generator is not None else top_k
+
+    query_vec, cache = None, None
+    if rag_state.get("ok"):
+        try:
+            query_vec = encode_queries([query], rag_state)
+            cache = get_answer_cache(query_vec.shape[1])
+            cached = cache.get(query_vec[0])
+            cache_event("answer", cached is not None)
+            if cached is not None:
+                count("rag_answer_path_total", "path", "cache")
+                out.update(answer=cached, context=[], cached=True)
+                yield cached
+                return
+            hits = _search_ids([query], query_vec, rag_state, depth)[0]
+        except Exception:
+            query_vec, cache = None, None
+            with stage("search"):
+                hits = build_sparse_index().search(query, depth)
+    else:
+        with stage("search"):
+            hits = build_sparse_index().search(query, depth)
+    docs = rag_state["docs"] if query_vec is not None else get_kb_docs()
+    context = [docs[i] for i, _ in hits[:top_k]]
+
+    if show_sources and context:
+        yield _sources_preview(context)
+
+    # Wall time until the last piece is handed over, consumer included — as the visitor sees it
+    with stage("synthesize"):
+        answer, partial = None, ""
+        if generator is not None:
+            pieces = []
+            try:
+                prompt_context = pack_prompt_context(hits, rag_state if query_vec is not None else {})
+                for token in generator.stream(build_messages(query, prompt_context)):
+                    pieces.append(token)
+                    yield token
+                answer = "".join(pieces).strip() or None
+            except GenerationUnavailable:
+                partial = "".join(pieces).strip()  # failed mid-stream: keep what was shown, never cache it
+        if answer is not None:
+            count("rag_answer_path_total", "path", "llm")
+        else:
+            count("rag_answer_path_total", "path", "rule")
+            fallback = simple_rag_answer(query, context)
+            if partial:
+                yield "\n\n"
+            yield from _word_chunks(fallback)
+            answer = f"{partial}\n\n{fallback}" if partial else fallback
+    out.update(answer=answer, context=context, cached=False)
+    if cache is not None and not partial:
+        cache.put(query_vec[0], answer)
+
+
+def answer_query(query: str, rag_state: dict, top_k: int = 4) -> str:
+    """Full agent turn: semantic-cache lookup, then retrieval + synthesis on a miss."""
+    return "".join(stream_answer(query, rag_state, top_k, show_sources=False))
+
+
+def retrieve_context_many(queries: list[str], rag_state: dict, top_k: int = 4,
+                          batch_size: int = 64) -> dict:
+    """Batched retrieval: one encode call and one multi-row index search.
+
+    Returns {"results": [[chunk, ...] per query], "timings": {...ms}} for bulk
+    scoring of logged questions, evaluation runs and precomputed answers.
+    Falls back to per-query BM25, like retrieve_context, while the dense index
+    is cold or unavailable.
+    """
+    queries = list(queries)
+    if rag_state.get("ok") and queries:
+        try:
+            t0 = time.perf_counter()
+            query_vecs = encode_queries(queries, rag_state, batch_size=batch_size)
+            t1 = time.perf_counter()
+            results = _search_docs(queries, query_vecs, rag_state, top_k)
+            t2 = time.perf_counter()
+            return {"results": results,
+                    "timings": {"encode_ms": (t1 - t0) * 1e3, "search_ms": (t2 - t1) * 1e3,
+                                "total_ms": (t2 - t0) * 1e3, "n_queries": len(queries)}}
+        except Exception:
+            pass
+    t0 = time.perf_counter()
+    results = [retrieve_sparse(q, top_k) for q in queries]
+    ms = (time.perf_counter() - t0) * 1e3
+    return {"results": results,
+            "timings": {"encode_ms": 0.0, "search_ms": ms, "total_ms": ms, "n_queries": len(queries)}}
+
+
+@st.cache_resource(show_spinner=False)
+def get_intent_router() -> IntentRouter:
+    """Compiled intent router, loaded once per process from rag_intents.json."""
+    return IntentRouter.from_file()
 
 
 def simple_rag_answer(query: str, context_docs: list[str]) -> str:
     """Rule-based RAG answer synthesizer (no API key required)."""
-    context = " ".join(context_docs)
-    q_lower = query.lower()
-
-    # Pattern matching for common questions
-    if any(w in q_lower for w in ["revenue", "money", "€", "eur", "business impact", "financial"]):
-        return ("💰 **Revenue Impact:** Karim delivered **€2M+** in quantified revenue impact at Baker Hughes through "
-                "AI-powered automation, RAG systems, and intelligent document processing. This includes direct cost "
-                "savings from 60% reduction in document review time and efficiency gains across 500+ global members.")
-
-    if any(w in q_lower for w in ["uptime", "reliability", "sla", "production", "99.9"]):
-        return ("⚡ **Production Reliability:** Karim's systems maintain **99.9% uptime** using blue/green "
-                "Kubernetes deployments, circuit breakers, health checks, and automated rollback mechanisms. "
-                "The RAG-as-a-Service platform at Baker Hughes serves 100,000+ daily users with sub-200ms P95 latency.")
-
-    if any(w in q_lower for w in ["rag", "retrieval", "langchain", "llamaindex", "vector", "faiss", "knowledge"]):
-        return ("🔍 **RAG Expertise:** Karim architected the RAG-as-a-Service platform at Baker Hughes for 500+ engineers, "
-                "processing **10,000+ documents daily** with 95% accuracy. Tech stack: LangChain/LlamaIndex, FAISS/PGVector, "
-                "cross-lingual embeddings, evaluation harnesses (faithfulness, toxicity, bias), prompt versioning, "
-                "and safety guardrails. Fine-tuned Llama 3.1 8B on engineering conversation transcripts.")
-
-    if any(w in q_lower for w in ["vision", "yolo", "defect", "computer vision", "detection", "opencv"]):
-        return ("👁️ **Computer Vision:** Karim trained custom **YOLOv8** models with targeted augmentations and hard-negative "
-                "mining for industrial defect detection, achieving **98.7% recall** and a **22% boost in defect detection**. "
-                "Deployed on NVIDIA Jetson with TensorRT INT8 quantization (3.1s cycle time vs 7.5s before). "
-                "Defect escape rate cut from 1.8% to 0.3%.")
-
-    if any(w in q_lower for w in ["finetun", "lora", "qlora", "peft", "llm", "gpt", "llama", "training"]):
-        return ("🧠 **LLM Fine-tuning:** Karim is an expert in **LoRA/QLoRA** (PEFT) fine-tuning for domain adaptation. "
-                "Applied at Baker Hughes to fine-tune Llama 3.1 8B on engineering documentation, "
-                "instruction tuning for technical Q&A, and RLHF alignment. Expertise in DPO, PPO, and "
-                "efficient training with gradient checkpointing, mixed precision, and quantization.")
-
-    if any(w in q_lower for w in ["skill", "technolog", "stack", "python", "pytorch", "tensorflow", "know"]):
-        return ("🛠️ **Tech Stack:** Core AI: Python, PyTorch, TensorFlow, JAX, HuggingFace, LangChain, LlamaIndex, "
-                "OpenAI API, FAISS, Pinecone. MLOps: Kubernetes, Docker, Triton, KServe, MLflow, W&B, Ray. "
-                "Cloud: AWS (SageMaker, EKS), GCP (Vertex AI), Azure (ML). "
-                "Data: Spark, Kafka, Airflow, Snowflake, PostgreSQL, MongoDB.")
-
-    if any(w in q_lower for w in ["certif", "aws", "google", "ibm", "azure", "credential", "course"]):
-        return ("📜 **Certifications:** ✅ IBM Generative AI Professional Certificate | ✅ DeepLearning.AI LLMOps | "
-                "✅ Microsoft Azure AI Engineer Associate | "
-                "🔄 AWS Machine Learning Specialty (in-progress) | "
-                "🔄 Google Cloud Professional ML Engineer (in-progress) | "
-                "🔄 Databricks Certified ML Professional (in-progress).")
-
-    if any(w in q_lower for w in ["education", "degree", "university", "study", "master", "paris", "sorbonne"]):
-        return ("🎓 **Education:** Machine Learning Engineering — Paris 1 Panthéon-Sorbonne University (2023–2024) | "
-                "Master of Finance — Università di Siena, Italy (2017–2022) | "
-                "Erasmus — Universität Liechtenstein (2019) | "
-                "Overseas — Akita International University, Japan (2020-2021).")
-
-    if any(w in q_lower for w in ["experience", "work", "job", "baker hughes", "uniqmaster", "career"]):
-        return ("💼 **Experience:** Currently Senior AI Engineer at **Baker Hughes** (Italy, 2022–present) — "
-                "architecting RAG-as-a-Service, LLM-as-a-Service, and Computer Vision platforms for 500+ engineers. "
-                "Previously ML Engineer at **UniqMaster** (Germany, 2020–2022) — ML pipelines, NLP, and predictive analytics. "
-                "€2M+ revenue impact, 99.9% uptime, 100k+ daily users.")
-
-    if any(w in q_lower for w in ["language", "speak", "arabic", "french", "italian", "english", "german", "multilingual"]):
-        return ("🌍 **Languages:** Arabic (native) | English (C1/C2 professional) | "
-                "Italian (professional, based in Italy) | French (professional, studied in Paris) | German (intermediate). "
-                "Karim's multilingual ability enables him to lead AI projects across EMEA and build truly global RAG systems.")
-
-    if any(w in q_lower for w in ["contact", "hire", "reach", "email", "linkedin", "github"]):
-        return ("📬 **Contact Karim:** Email: karim.osman.ai@gmail.com | "
-                "LinkedIn: linkedin.com/in/karimosman89 | GitHub: github.com/karimosman89 | "
-                "Available for senior AI engineering roles, consulting engagements, and speaking opportunities.")
-
-    if any(w in q_lower for w in ["mlops", "deploy", "kubernetes", "docker", "pipeline", "cicd", "infra"]):
-        return ("🚀 **MLOps:** Karim designs production ML infrastructure using Kubernetes (EKS/GKE/AKS), "
-                "Triton Inference Server, KServe, MLflow, W&B, Ray, Prometheus/Grafana, and Datadog. "
-                "CI/CD via GitHub Actions + ArgoCD. Feature stores with Feast. "
-                "Achieved 99.9% uptime across all production systems.")
-
-    if any(w in q_lower for w in ["scale", "user", "100k", "daily", "throughput", "performance"]):
-        return ("📊 **Scale:** Karim's systems serve **100,000+ daily users** at Baker Hughes with sub-200ms latency. "
-                "The document processing pipeline handles **10,000+ documents/day**. "
-                "Real-time inference on Triton with GPU autoscaling handles burst traffic automatically.")
+    intent = get_intent_router().route(query)
+    if intent is not None:
+        count("rag_intent_total", "intent", intent)
+        return get_intent_router().answer(intent)
 
     # Fallback: synthesize from retrieved context
     if context_docs:
+        count("rag_intent_total", "intent", "context")
         # Pick the most relevant sentences
         relevant = context_docs[:3]
         answer = "Based on Karim's profile: " + " ".join(relevant[:2])
@@ -198,17 +478,37 @@ def simple_rag_answer(query: str, context_docs: list[str]) -> str:
             answer = answer[:500] + "..."
         return answer
 
+    count("rag_intent_total", "intent", "help")
     return ("I'm Karim's AI assistant with deep knowledge of his work. Try asking about: "
             "**RAG systems**, **revenue impact**, **Baker Hughes projects**, **tech stack**, "
             "**certifications**, **computer vision**, **LLM fine-tuning**, or **contact info**.")
 
 
+@st.cache_resource(show_spinner=False)
+def get_metrics_server():
+    """Process-wide Prometheus endpoint, started once if RAG_METRICS_PORT is set."""
+    return start_metrics_server()
+
+
 def render_rag_sidebar():
     """Render the RAG assistant in the sidebar."""
-    lang = st.session_state.get("lang", "en")
-    is_ar = (lang == "ar")
-
-    st.sidebar.markdown("""
+    get_metrics_server()
+    with st.sidebar:
+        _rag_agent_fragment()
+
+
+@st.fragment
+def _rag_agent_fragment():
+    """The chat widget as a fragment: a chat turn reruns only this, not the page."""
+    start_warmup()
+    status = warmup_status()["status"]
+    status_label = {
+        WARM:    ("#10B981", "index warm"),
+        WARMING: ("#F59E0B", "warming up · keyword mode"),
+        FAILED:  ("#6B7280", "keyword mode"),
+    }.get(status, ("#6B7280", "cold"))
+
+    st.markdown(f"""
     <div class="rag-header">
         <div class="rag-title">
             <span class="rag-pulse"></span>
@@ -217,11 +517,14 @@ def render_rag_sidebar():
         <div style="font-size:0.7rem; color:#9CA3AF; margin-top:0.4rem;">
             Powered by RAG · FAISS · MiniLM
         </div>
+        <div style="font-size:0.65rem; color:{status_label[0]}; margin-top:0.2rem;">
+            ● {status_label[1]}
+        </div>
     </div>
     """, unsafe_allow_html=True)
 
     # Suggested questions
-    with st.sidebar.expander("💡 Suggested Questions", expanded=False):
+    with st.expander("💡 Suggested Questions", expanded=False):
         suggestions = [
             "What's Karim's revenue impact?",
             "Tell me about the RAG system at Baker Hughes",
@@ -241,40 +544,45 @@ def render_rag_sidebar():
     for msg in st.session_state.rag_history[-6:]:  # last 3 exchanges
         role_label = "You" if msg["role"] == "user" else "🤖 Karim AI"
         css_class = "chat-bubble-user" if msg["role"] == "user" else "chat-bubble-ai"
-        st.sidebar.markdown(f'<div class="{css_class}"><strong>{role_label}:</strong> {msg["content"]}</div>',
-                           unsafe_allow_html=True)
+        st.markdown(f'<div class="{css_class}"><strong>{role_label}:</strong> {msg["content"]}</div>',
+                    unsafe_allow_html=True)
+
+    # Streamed answers land here, directly below the history
+    live = st.container()
 
     # Query input
     default_q = st.session_state.pop("rag_query", "")
-    query = st.sidebar.text_input(
+    query = st.text_input(
         "Ask about Karim...",
         value=default_q,
         placeholder="e.g. What's the revenue impact?",
         key="rag_input"
     )
 
-    col_ask, col_clear = st.sidebar.columns([3, 1])
+    col_ask, col_clear = st.columns([3, 1])
     with col_ask:
         ask_btn = st.button("Ask →", key="rag_ask", use_container_width=True)
     with col_clear:
         if st.button("Clear", key="rag_clear"):
             st.session_state.rag_history = []
-            st.rerun()
+            st.rerun(scope="fragment")
 
     if ask_btn and query.strip():
-        with st.sidebar:
-            with st.spinner("Searching knowledge base..."):
-                rag_state = build_rag_index()
-                context = retrieve_context(query, rag_state)
-                answer = simple_rag_answer(query, context)
+        # Never block on encoder load: answer from keywords (BM25) until warm
+        rag_state = build_rag_index() if is_warm() else {"ok": False}
+        with live:
+            st.markdown(f'<div class="chat-bubble-user"><strong>You:</strong> {query}</div>',
+                        unsafe_allow_html=True)
+            st.markdown("**🤖 Karim AI:**")
+            turn = {}
+            st.write_stream(stream_answer(query, rag_state, out=turn))
 
         st.session_state.rag_history.append({"role": "user", "content": query})
-        st.session_state.rag_history.append({"role": "assistant", "content": answer})
-        st.rerun()
+        st.session_state.rag_history.append({"role": "assistant", "content": turn.get("answer", "")})
 
     # Footer info
-    st.sidebar.markdown("""
+    st.markdown("""
     <div style="font-size:0.65rem; color:#4B5563; text-align:center; margin-top:1rem; padding-top:0.5rem; border-top:1px solid #1F2937;">
-        Knowledge base: Baker Hughes · UniqMaster<br>RAG · FAISS · sentence-transformers
+        Knowledge base: Baker Hughes · UniqMaster · portfolio content<br>RAG · FAISS · sentence-transformers
     </div>
     """, unsafe_allow_html=True)
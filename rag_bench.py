@@ -0,0 +1,237 @@
+"""
+RAG Benchmark — Karim Osman Portfolio
+Quality and latency harness for rag_agent: the labelled questions in
+rag_bench_questions.json are run through the real retrieval and answer path
+and scored with recall@k and MRR, alongside encode / search / synthesize
+latency percentiles and memory. The JSON report is diffed against a stored
+baseline to flag regressions.
+
+    python rag_bench.py                                     # run, write rag_bench_report.json
+    python rag_bench.py --save-baseline                     # ... and store it as the baseline
+    python rag_bench.py --baseline rag_bench_baseline.json  # exit 1 on a regression
+
+rag_bench_baseline.json is not generated here: latencies are only comparable
+on the same machine class, encoder and RAG_* settings. Generate it with
+--save-baseline on the machine that runs the check (the CI runner image, with
+the production encoder and a warm .rag_store), commit it, and regenerate it
+in the same change whenever the model, index settings or runner change. CI
+runs `--baseline rag_bench_baseline.json` against the committed file; with no
+baseline the script says so and exits 2 instead of passing silently.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import time
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+QUESTIONS_FILE = os.path.join(BASE_DIR, "rag_bench_questions.json")
+REPORT_FILE = os.path.join(BASE_DIR, "rag_bench_report.json")
+BASELINE_FILE = os.path.join(BASE_DIR, "rag_bench_baseline.json")
+
+K_VALUES = (1, 4, 10)
+STAGES = ("encode", "search", "synthesize", "total")
+
+
+def load_questions(path: str = QUESTIONS_FILE) -> list[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["questions"]
+
+
+def relevant_ids(docs: list[str], expect: list[str]) -> set[int]:
+    """Chunks containing any expected substring (case-insensitive)."""
+    needles = [e.casefold() for e in expect]
+    return {i for i, d in enumerate(docs) if any(n in d.casefold() for n in needles)}
+
+
+def percentiles(samples_ms: list[float]) -> dict:
+    if not samples_ms:
+        return {}
+    a = np.asarray(samples_ms)
+    return {"p50": round(float(np.percentile(a, 50)), 3), "p95": round(float(np.percentile(a, 95)), 3),
+            "p99": round(float(np.percentile(a, 99)), 3), "mean": round(float(a.mean()), 3)}
+
+
+def _peak_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 2**20 if sys.platform == "darwin" else rss / 1024
+
+
+def _nbytes(arr) -> int:
+    return int(arr.nbytes) if isinstance(arr, np.ndarray) else 0
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  RUN
+# ─────────────────────────────────────────────────────────────────────────────
+def run_benchmark(questions: list[dict], repeats: int = 3, top_k: int = 4) -> dict:
+    """Score every question once for quality, time it `repeats` times for latency.
+
+    recall@k = |relevant ∩ top-k| / min(|relevant|, k), so a question with
+    many relevant chunks can still reach 1.0 at small k. MRR uses the first
+    relevant chunk within the top max(K_VALUES).
+    """
+    import rag_agent
+
+    rag_state = rag_agent.load_rag_state()
+    hybrid = bool(rag_state.get("ok"))
+    docs = rag_state["docs"] if hybrid else rag_agent.get_kb_docs()
+    sparse = rag_agent.build_sparse_index()
+    depth = max(K_VALUES)
+
+    timings = {stage: [] for stage in STAGES}
+    per_question = []
+    for item in questions:
+        query, relevant = item["question"], relevant_ids(docs, item["expect"])
+        for rep in range(repeats):
+            t_start = time.perf_counter()
+            if hybrid:
+                vec = np.asarray(rag_state["model"].encode([query], normalize_embeddings=True),
+                                 dtype=np.float32)  # uncached: measures the encoder itself
+                t_enc = time.perf_counter()
+                ids = [i for i, _ in rag_agent._search_ids([query], vec, rag_state, depth)[0]]
+            else:
+                t_enc = time.perf_counter()
+                ids = [i for i, _ in sparse.search(query, depth)]
+            t_search = time.perf_counter()
+            answer = rag_agent.simple_rag_answer(query, [docs[i] for i in ids[:top_k]])
+            t_end = time.perf_counter()
+
+            if hybrid:
+                timings["encode"].append((t_enc - t_start) * 1e3)
+            timings["search"].append((t_search - t_enc) * 1e3)
+            timings["synthesize"].append((t_end - t_search) * 1e3)
+            timings["total"].append((t_end - t_start) * 1e3)
+            if rep:
+                continue
+
+            rank = next((r for r, i in enumerate(ids, 1) if i in relevant), None)
+            per_question.append({
+                "question": query,
+                "n_relevant": len(relevant),
+                "first_relevant_rank": rank,
+                **{f"recall@{k}": len(relevant & set(ids[:k])) / max(min(len(relevant), k), 1)
+                   for k in K_VALUES},
+                "answer_hit": any(e.casefold() in answer.casefold() for e in item["expect"]),
+            })
+
+    n = max(len(per_question), 1)
+    quality = {f"recall@{k}": round(sum(q[f"recall@{k}"] for q in per_question) / n, 4)
+               for k in K_VALUES}
+    quality["mrr"] = round(sum(1.0 / q["first_relevant_rank"] for q in per_question
+                               if q["first_relevant_rank"]) / n, 4)
+    quality["answer_hit_rate"] = round(sum(q["answer_hit"] for q in per_question) / n, 4)
+
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "mode": "hybrid" if hybrid else "sparse",
+            "error": rag_state.get("error"),
+            "embed_model": rag_agent.EMBED_MODEL,
+            "backend": rag_state.get("backend"),
+            "index": rag_state.get("ann"),
+            "storage": rag_state.get("storage"),
+            "rerank": rag_agent.get_reranker() is not None,
+            "n_docs": len(docs),
+            "n_questions": len(per_question),
+            "repeats": repeats,
+            "python": platform.python_version(),
+        },
+        "quality": quality,
+        "latency_ms": {stage: percentiles(timings[stage]) for stage in STAGES if timings[stage]},
+        "memory": {
+            "rss_peak_mb": round(_peak_rss_mb(), 1),
+            "embeddings_mb": round(_nbytes(rag_state.get("embeddings")) / 2**20, 3),
+        },
+        "per_question": per_question,
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  REPORT + BASELINE DIFF
+# ─────────────────────────────────────────────────────────────────────────────
+def compare(report: dict, baseline: dict, quality_tol: float = 0.01,
+            latency_tol: float = 0.25, latency_floor_ms: float = 0.5) -> list[str]:
+    """Regressions vs the baseline: any quality metric down by more than
+    quality_tol, or a p95 latency up by more than latency_tol (relative) and
+    latency_floor_ms (absolute, so sub-millisecond jitter is ignored)."""
+    problems = []
+    if report["meta"]["mode"] != baseline["meta"]["mode"]:
+        problems.append(f"mode changed: {baseline['meta']['mode']} → {report['meta']['mode']}")
+    for name, old in baseline["quality"].items():
+        new = report["quality"].get(name)
+        if new is not None and new < old - quality_tol:
+            problems.append(f"{name}: {old:.4f} → {new:.4f}")
+    for stage, old in baseline["latency_ms"].items():
+        new = report["latency_ms"].get(stage)
+        if not new or not old:
+            continue
+        if new["p95"] > old["p95"] * (1 + latency_tol) and new["p95"] - old["p95"] > latency_floor_ms:
+            problems.append(f"{stage} p95: {old['p95']:.2f} ms → {new['p95']:.2f} ms")
+    return problems
+
+
+def print_report(report: dict, baseline: dict | None = None) -> None:
+    meta = report["meta"]
+    print(f"RAG benchmark · {meta['mode']} · {meta['n_questions']} questions × {meta['repeats']} "
+          f"· {meta['n_docs']} chunks · index {(meta['index'] or {}).get('kind', '—')} "
+          f"· rerank {'on' if meta['rerank'] else 'off'}")
+
+    def delta(new, old, fmt):
+        return "" if old is None else f"  ({'+' if new >= old else ''}{fmt.format(new - old)})"
+
+    for name, value in report["quality"].items():
+        old = (baseline or {}).get("quality", {}).get(name)
+        print(f"  {name:>16}: {value:.4f}{delta(value, old, '{:.4f}')}")
+    for stage, p in report["latency_ms"].items():
+        old = (baseline or {}).get("latency_ms", {}).get(stage, {}).get("p95")
+        print(f"  {stage:>16}: p50 {p['p50']:8.2f}  p95 {p['p95']:8.2f}  p99 {p['p99']:8.2f} ms"
+              f"{delta(p['p95'], old, '{:.2f}')}")
+    print(f"  {'memory':>16}: peak RSS {report['memory']['rss_peak_mb']} MB · "
+          f"embeddings {report['memory']['embeddings_mb']} MB")
+    misses = [q["question"] for q in report["per_question"] if not q["first_relevant_rank"]]
+    if misses:
+        print(f"  no relevant chunk in top {max(K_VALUES)}: " + "; ".join(misses))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="RAG retrieval quality / latency benchmark")
+    parser.add_argument("--questions", default=QUESTIONS_FILE)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--out", default=REPORT_FILE)
+    parser.add_argument("--baseline", default=None, help="diff against this report; exit 1 on regressions")
+    parser.add_argument("--save-baseline", action="store_true", help=f"also write {BASELINE_FILE}")
+    args = parser.parse_args(argv)
+
+    if args.baseline and not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline} — generate one with --save-baseline and commit it")
+        return 2
+
+    report = run_benchmark(load_questions(args.questions), repeats=args.repeats)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    if args.save_baseline:
+        with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if baseline is not None:
+        problems = compare(report, baseline)
+        for p in problems:
+            print(f"REGRESSION {p}")
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
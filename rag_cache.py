@@ -0,0 +1,176 @@
+"""
+RAG Caches — Karim Osman Portfolio
+Process-wide caches shared by every Streamlit session: query embeddings keyed
+by normalized text, rerank scores keyed by (query, chunk), and a semantic
+answer cache for paraphrased questions.
+"""
+
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+import numpy as np
+
+_PUNCT_RE = re.compile(r"[^\w\s.€$%+#]")
+_LOOSE_DOT_RE = re.compile(r"(?<!\d)\.|\.(?!\d)")  # keep decimal points like 99.9
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """Fold case, whitespace and punctuation so trivial variants share a key."""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = _PUNCT_RE.sub(" ", text)
+    text = _LOOSE_DOT_RE.sub(" ", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+class QueryEmbeddingCache:
+    """Bounded, thread-safe LRU of query embeddings with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, query: str) -> np.ndarray | None:
+        key = normalize_query(query)
+        with self._lock:
+            vec = self._data.get(key)
+            if vec is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return vec
+
+    def put(self, query: str, vec: np.ndarray) -> None:
+        key = normalize_query(query)
+        vec = np.array(vec, dtype=np.float32)
+        vec.setflags(write=False)
+        with self._lock:
+            self._data[key] = vec
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._data),
+                    "maxsize": self.maxsize, "hit_rate": self.hits / total if total else 0.0}
+
+
+class PairScoreCache:
+    """Bounded, thread-safe LRU of cross-encoder scores keyed by (normalized query, chunk id)."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, query: str, chunk_ids: list[str]) -> list[float | None]:
+        key = normalize_query(query)
+        out = []
+        with self._lock:
+            for cid in chunk_ids:
+                score = self._data.get((key, cid))
+                if score is None:
+                    self.misses += 1
+                else:
+                    self._data.move_to_end((key, cid))
+                    self.hits += 1
+                out.append(score)
+        return out
+
+    def put_many(self, query: str, chunk_ids: list[str], scores) -> None:
+        key = normalize_query(query)
+        with self._lock:
+            for cid, score in zip(chunk_ids, scores):
+                self._data[(key, cid)] = float(score)
+                self._data.move_to_end((key, cid))
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._data),
+                    "maxsize": self.maxsize, "hit_rate": self.hits / total if total else 0.0}
+
+
+class SemanticAnswerCache:
+    """Answers for past queries, served again to paraphrases above a cosine threshold.
+
+    Entries live in a fixed-size float32 matrix (one matmul per lookup); expired
+    slots are reused first, then the least recently used one.
+    """
+
+    def __init__(self, dim: int, maxsize: int = 256, threshold: float = 0.9, ttl: float = 3600.0):
+        self.dim = dim
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.ttl = ttl
+        self._vecs = np.zeros((maxsize, dim), dtype=np.float32)
+        self._answers: list[str | None] = [None] * maxsize
+        self._created = np.full(maxsize, -np.inf)
+        self._used = np.full(maxsize, -np.inf)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _live(self, now: float) -> np.ndarray:
+        return (now - self._created) < self.ttl
+
+    def get(self, vec: np.ndarray, now: float | None = None) -> str | None:
+        now = time.time() if now is None else now
+        vec = np.asarray(vec, dtype=np.float32).reshape(self.dim)
+        with self._lock:
+            sims = self._vecs @ vec
+            sims[~self._live(now)] = -np.inf
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                self.misses += 1
+                return None
+            self._used[best] = now
+            self.hits += 1
+            return self._answers[best]
+
+    def put(self, vec: np.ndarray, answer: str, now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        vec = np.asarray(vec, dtype=np.float32).reshape(self.dim)
+        with self._lock:
+            stale = np.flatnonzero(~self._live(now))
+            slot = int(stale[0]) if stale.size else int(np.argmin(self._used))
+            self._vecs[slot] = vec
+            self._answers[slot] = answer
+            self._created[slot] = self._used[slot] = now
+
+    def clear(self) -> None:
+        with self._lock:
+            self._vecs[:] = 0.0
+            self._answers = [None] * self.maxsize
+            self._created[:] = self._used[:] = -np.inf
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses,
+                    "size": int(self._live(time.time()).sum()), "maxsize": self.maxsize,
+                    "threshold": self.threshold, "hit_rate": self.hits / total if total else 0.0}
@@ -0,0 +1,207 @@
+"""
+RAG Compact Embeddings — Karim Osman Portfolio
+Optional compact storage for the KB embedding matrix, for large ingested
+corpora and for containers where several workers each hold the index:
+
+    float16   half the bytes per vector, recall essentially unchanged
+    PCA       projection to RAG_EMBED_DIM dims (e.g. 128) fitted on the KB;
+              queries go through the same projection via ProjectedEncoder
+    PQ        FAISS product quantization, RAG_INDEX_PQ bytes per vector
+
+The compact matrix is published as its own artifact (the float32 key plus a
+storage tag) and derived from the float32 one, so changing these settings
+never re-encodes the KB.
+
+    python rag_compress.py      # recall@10 vs memory for each setting
+"""
+
+import os
+import time
+
+import numpy as np
+
+from rag_store import ArtifactWriter, artifact_dir, load_artifacts
+
+EMBED_DTYPE = os.getenv("RAG_EMBED_DTYPE", "float32")  # float32 | float16
+EMBED_DIM = int(os.getenv("RAG_EMBED_DIM", "0"))       # 0 = encoder's full dim, else PCA
+INDEX_PQ = int(os.getenv("RAG_INDEX_PQ", "0"))         # FAISS only: PQ bytes/vector, 0 = off
+
+PROJECTION_FILE = "pca.npz"
+
+
+def storage_tag(dtype: str = EMBED_DTYPE, dim: int = EMBED_DIM, pq: int = INDEX_PQ) -> str:
+    """Artifact key suffix for a storage setting; empty for float32 at full dim."""
+    parts = []
+    if dim:
+        parts.append(f"pca{dim}")
+    if np.dtype(dtype) == np.float16:
+        parts.append("f16")
+    elif np.dtype(dtype) != np.float32:
+        raise ValueError(f"Unsupported embedding dtype: {dtype}")
+    if pq:
+        parts.append(f"pq{pq}")
+    return "-".join(parts)
+
+
+def storage_key(key: str, dtype: str = EMBED_DTYPE, dim: int = EMBED_DIM, pq: int = INDEX_PQ) -> str:
+    tag = storage_tag(dtype, dim, pq)
+    return f"{key}-{tag}" if tag else key
+
+
+def index_codec(dtype: str = EMBED_DTYPE, pq: int = INDEX_PQ) -> str:
+    """FAISS vector codec for a storage setting (see rag_index.make_index)."""
+    if pq:
+        return f"PQ{pq}"
+    return "SQfp16" if np.dtype(dtype) == np.float16 else "Flat"
+
+
+class PCAProjection:
+    """Centered projection onto the top principal components, re-normalized so
+    inner products remain cosines."""
+
+    def __init__(self, mean: np.ndarray, components: np.ndarray):
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.components = np.ascontiguousarray(components, dtype=np.float32)
+
+    @property
+    def dim(self) -> int:
+        return self.components.shape[0]
+
+    @classmethod
+    def fit(cls, vectors: np.ndarray, dim: int, sample: int = 50_000, seed: int = 0) -> "PCAProjection":
+        rng = np.random.default_rng(seed)
+        picks = np.sort(rng.choice(len(vectors), min(sample, len(vectors)), replace=False))
+        x = np.asarray(vectors[picks], dtype=np.float32)
+        mean = x.mean(axis=0)
+        _, _, vt = np.linalg.svd(x - mean, full_matrices=False)
+        return cls(mean, vt[:dim])
+
+    def __call__(self, vectors: np.ndarray) -> np.ndarray:
+        y = (np.asarray(vectors, dtype=np.float32) - self.mean) @ self.components.T
+        return y / np.clip(np.linalg.norm(y, axis=1, keepdims=True), 1e-12, None)
+
+    def save(self, path) -> None:
+        np.savez(path, mean=self.mean, components=self.components)
+
+    @classmethod
+    def load(cls, path) -> "PCAProjection":
+        with np.load(path) as f:
+            return cls(f["mean"], f["components"])
+
+
+class ProjectedEncoder:
+    """Encoder wrapper that returns projected vectors; everything else passes through."""
+
+    def __init__(self, encoder, projection: PCAProjection):
+        self.encoder, self.projection = encoder, projection
+
+    def encode(self, texts, **kwargs) -> np.ndarray:
+        return self.projection(self.encoder.encode(texts, **{**kwargs, "normalize_embeddings": True}))
+
+    def __getattr__(self, name):
+        return getattr(self.encoder, name)
+
+
+def load_projection(key: str, store_dir: str | None = None) -> PCAProjection | None:
+    path = artifact_dir(key, store_dir) / PROJECTION_FILE
+    return PCAProjection.load(path) if path.exists() else None
+
+
+def compress_embeddings(raw: np.ndarray, key: str, dtype: str = EMBED_DTYPE, dim: int = EMBED_DIM,
+                        store_dir: str | None = None, block: int = 65536):
+    """Derive compact embeddings from the float32 matrix and publish them under `key`.
+
+    Returns (embeddings, projection): embeddings is the published memory map,
+    or an in-memory array if publishing failed; projection is None without PCA.
+    """
+    projection = PCAProjection.fit(raw, dim) if dim and dim < raw.shape[1] else None
+    out_dim = projection.dim if projection is not None else raw.shape[1]
+
+    def blocks():
+        for start in range(0, len(raw), block):
+            rows = raw[start:start + block]
+            yield start, (projection(rows) if projection is not None else rows)
+
+    try:
+        writer = ArtifactWriter(key, len(raw), out_dim, store_dir, dtype=dtype)
+    except OSError as e:
+        print(f"RAG compress: not persisting artifacts {key}: {e}")
+        writer = None
+    if writer is not None:
+        for start, rows in blocks():
+            writer.write(start, rows)
+        if projection is not None:
+            projection.save(writer.tmp / PROJECTION_FILE)
+        if writer.commit(None, {"dtype": str(np.dtype(dtype)), "dim": out_dim,
+                                "pca": projection is not None}):
+            stored = load_artifacts(key, store_dir)
+            if stored is not None:
+                return stored["embeddings"], projection
+    return np.vstack([rows.astype(dtype) for _, rows in blocks()]), projection
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  REPORT
+# ─────────────────────────────────────────────────────────────────────────────
+def _index_bytes(index) -> int:
+    if getattr(index, "faiss_index", None) is not None:
+        import faiss
+        return int(faiss.serialize_index(index.faiss_index).size)
+    return int(index.vectors().nbytes) + int(getattr(index, "centroids", np.empty(0)).nbytes)
+
+
+def _synthetic(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    """Clustered vectors with a decaying spectrum, like sentence embeddings."""
+    from rag_index import _clustered
+
+    rng = np.random.default_rng(seed)
+    x = _clustered(n, dim, rng) * (1.0 / (1.0 + np.arange(dim) / 16.0)).astype(np.float32)
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+def _report(vectors: np.ndarray, label: str, n_queries: int = 200):
+    """Recall@10 (vs float32 exact search) and index memory for each storage setting,
+    on the index kind build_index picks for this corpus size."""
+    import tempfile
+
+    from rag_index import RECALL_K, build_index, exact_neighbours, faiss_available, sample_queries
+
+    n, dim = vectors.shape
+    queries = sample_queries(vectors, n_queries, seed=1)
+    truth = exact_neighbours(vectors, queries)
+    settings = [("float32", 0, 0), ("float16", 0, 0), ("float32", 128, 0), ("float16", 128, 0)]
+    if faiss_available():
+        settings += [("float32", 0, 48), ("float32", 128, 16)]
+
+    print(f"{label}: {n} × {dim}, recall@{RECALL_K} vs float32 exact")
+    print(f"{'storage':>16} {'kind':>5} {'bytes/vec':>10} {'index MB':>9} {'recall':>7} {'µs/q':>8}")
+    with tempfile.TemporaryDirectory() as store:
+        for dtype, pca_dim, pq in settings:
+            if pca_dim >= dim:
+                continue
+            key = storage_key("report", dtype, pca_dim, pq)
+            emb, projection = compress_embeddings(vectors, key, dtype, pca_dim, store_dir=store)
+            index = build_index(emb, backend="faiss" if pq else None, codec=index_codec(dtype, pq))
+            q = projection(queries) if projection is not None else queries
+            index.search(q[:1], RECALL_K)
+            t0 = time.perf_counter()
+            found = np.vstack([index.search(row[None, :], RECALL_K)[1] for row in q])
+            us = (time.perf_counter() - t0) / len(q) * 1e6
+            recall = np.mean([len(np.intersect1d(f, t)) / RECALL_K for f, t in zip(found, truth)])
+            nbytes = _index_bytes(index) + (projection.components.nbytes if projection is not None else 0)
+            print(f"{storage_tag(dtype, pca_dim, pq) or 'float32':>16} {index.kind:>5} {nbytes / n:>10.0f} "
+                  f"{nbytes / 2**20:>9.1f} {recall:>7.3f} {us:>8.1f}")
+
+
+if __name__ == "__main__":
+    try:
+        from rag_encoders import ENCODER_BACKEND, load_encoder
+        from rag_ingest import iter_chunks
+
+        encoder = load_encoder(os.getenv("RAG_EMBED_MODEL", "all-MiniLM-L6-v2"), ENCODER_BACKEND)
+        kb = np.asarray(encoder.encode([c.text for c in iter_chunks()], batch_size=64,
+                                       normalize_embeddings=True), dtype=np.float32)
+        _report(kb, "knowledge base")
+    except ImportError as e:
+        print(f"(skipping the real KB — encoder unavailable: {e})")
+    _report(_synthetic(100_000, 384), "synthetic corpus")
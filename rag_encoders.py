@@ -0,0 +1,214 @@
+"""
+RAG Encoders — Karim Osman Portfolio
+Selectable query/document encoders behind the SentenceTransformer.encode API:
+PyTorch (sentence-transformers) or an exported ONNX Runtime graph, optionally
+int8 dynamic-quantized for CPU-only instances.
+
+    python rag_encoders.py            # parity (cosine vs PyTorch) + latency/memory report
+"""
+
+import os
+import shutil
+import threading
+import time
+
+import numpy as np
+
+from rag_store import DEFAULT_STORE_DIR
+
+ENCODER_BACKEND = os.getenv("RAG_ENCODER_BACKEND", "torch")  # torch | onnx | onnx-int8
+ONNX_THREADS = int(os.getenv("RAG_ONNX_THREADS", "0"))  # 0 = onnxruntime default
+MAX_SEQ_LENGTH = 256  # all-MiniLM-L6-v2 truncation length
+BACKENDS = ("torch", "onnx", "onnx-int8")
+
+
+def encoder_id(model_name: str, backend: str = ENCODER_BACKEND) -> str:
+    """Identity used in artifact fingerprints — embeddings differ across backends."""
+    return model_name if backend == "torch" else f"{model_name}@{backend}"
+
+
+def _hf_name(model_name: str) -> str:
+    return model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+
+
+def _publish_dir(tmp_dir: str, out_dir: str, marker: str) -> None:
+    """Rename tmp_dir to out_dir. An out_dir without `marker` (a partial export from
+    an older version) is renamed aside first and only deleted once it is out of
+    the way — never while it could be another process's fresh export."""
+    if os.path.isdir(out_dir) and not os.path.exists(os.path.join(out_dir, marker)):
+        aside = f"{tmp_dir}.stale"
+        try:
+            os.rename(out_dir, aside)
+        except OSError:
+            pass  # another process moved it first
+        else:
+            if os.path.exists(os.path.join(aside, marker)):
+                try:
+                    os.rename(aside, out_dir)  # published between the check and the rename: put it back
+                except OSError:
+                    pass  # ...and out_dir has been republished since, so the aside copy is spare
+            shutil.rmtree(aside, ignore_errors=True)
+    try:
+        os.replace(tmp_dir, out_dir)
+    except OSError:
+        # Another process published the export first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def export_onnx(model_name: str, quantize: bool = False, store_dir: str | None = None) -> str:
+    """Export the transformer to ONNX once (plus an int8 copy); returns the export dir.
+
+    Like rag_store's ArtifactWriter, everything is written to a temp path and
+    renamed into place, so a process warming up concurrently never loads a
+    half-written model or a model without its tokenizer.
+    """
+    out_dir = os.path.join(store_dir or DEFAULT_STORE_DIR, "onnx", model_name.replace("/", "__"))
+    fp32_path = os.path.join(out_dir, "model.onnx")
+    int8_path = os.path.join(out_dir, "model-int8.onnx")
+    suffix = f".tmp-{os.getpid()}-{threading.get_ident()}"
+
+    if not os.path.exists(fp32_path):
+        import torch
+        from transformers import AutoModel, AutoTokenizer
+
+        tmp_dir = out_dir + suffix
+        os.makedirs(tmp_dir, exist_ok=True)
+        try:
+            tokenizer = AutoTokenizer.from_pretrained(_hf_name(model_name))
+            model = AutoModel.from_pretrained(_hf_name(model_name)).eval()
+            dummy = tokenizer(["export the encoder graph"], return_tensors="pt")
+            inputs = ["input_ids", "attention_mask", "token_type_ids"]
+            with torch.no_grad():
+                torch.onnx.export(
+                    model, tuple(dummy[n] for n in inputs), os.path.join(tmp_dir, "model.onnx"),
+                    input_names=inputs, output_names=["last_hidden_state"],
+                    dynamic_axes={n: {0: "batch", 1: "seq"} for n in inputs + ["last_hidden_state"]},
+                    opset_version=14,
+                )
+            tokenizer.save_pretrained(tmp_dir)
+            _publish_dir(tmp_dir, out_dir, "model.onnx")
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+    if quantize and not os.path.exists(int8_path):
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        tmp_path = int8_path + suffix
+        try:
+            quantize_dynamic(fp32_path, tmp_path, weight_type=QuantType.QInt8)
+            os.replace(tmp_path, int8_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return out_dir
+
+
+class OnnxEncoder:
+    """MiniLM on ONNX Runtime: tokenize → graph → mean-pool → L2-normalize.
+
+    Mirrors sentence-transformers' pooling so embeddings are interchangeable
+    with the PyTorch backend (see the parity report in __main__).
+    """
+
+    def __init__(self, model_name: str, quantize: bool = False):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        out_dir = export_onnx(model_name, quantize=quantize)
+        self.tokenizer = AutoTokenizer.from_pretrained(out_dir)
+
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if ONNX_THREADS:
+            opts.intra_op_num_threads = ONNX_THREADS
+        path = os.path.join(out_dir, "model-int8.onnx" if quantize else "model.onnx")
+        self.session = ort.InferenceSession(path, opts, providers=["CPUExecutionProvider"])
+        self._inputs = {i.name for i in self.session.get_inputs()}
+
+    def encode(self, texts, batch_size: int = 32, show_progress_bar: bool = False,
+               normalize_embeddings: bool = True, **_kwargs) -> np.ndarray:
+        texts = [texts] if isinstance(texts, str) else list(texts)
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        # Length-sorted batches keep padding (and wasted FLOPs) to a minimum
+        order = np.argsort([len(t) for t in texts], kind="stable")
+        out = [None] * len(texts)
+        for start in range(0, len(texts), batch_size):
+            idx = order[start:start + batch_size]
+            enc = self.tokenizer([texts[i] for i in idx], padding=True, truncation=True,
+                                 max_length=MAX_SEQ_LENGTH, return_tensors="np")
+            feeds = {k: v.astype(np.int64) for k, v in enc.items() if k in self._inputs}
+            hidden = self.session.run(None, feeds)[0]
+            mask = enc["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            if normalize_embeddings:
+                pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            for row, i in enumerate(idx):
+                out[i] = pooled[row]
+        return np.stack(out).astype(np.float32)
+
+
+def load_encoder(model_name: str, backend: str = ENCODER_BACKEND):
+    """Encoder object exposing .encode(texts, batch_size=..., normalize_embeddings=...)."""
+    if backend == "torch":
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(model_name)
+    if backend in ("onnx", "onnx-int8"):
+        return OnnxEncoder(model_name, quantize=backend == "onnx-int8")
+    raise ValueError(f"Unknown encoder backend: {backend}")
+
+
+def _peak_rss_mb() -> float:
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0  # KiB on Linux
+
+
+def _profile_backend(args) -> dict:
+    """Runs in a fresh process so load time and peak RSS are not polluted by other backends."""
+    backend, model_name, docs, queries = args
+    rss0 = _peak_rss_mb()
+    t0 = time.perf_counter()
+    encoder = load_encoder(model_name, backend)
+    load_s = time.perf_counter() - t0
+
+    doc_vecs = np.asarray(encoder.encode(docs, normalize_embeddings=True), dtype=np.float32)
+    encoder.encode(queries[:2], normalize_embeddings=True)  # warm up kernels
+    lat = []
+    for q in queries:
+        t = time.perf_counter()
+        encoder.encode([q], normalize_embeddings=True)
+        lat.append((time.perf_counter() - t) * 1e3)
+    return {"backend": backend, "load_s": load_s, "p50_ms": float(np.percentile(lat, 50)),
+            "p95_ms": float(np.percentile(lat, 95)), "rss_mb": _peak_rss_mb() - rss0,
+            "doc_vecs": doc_vecs}
+
+
+def _report(model_name: str, backends=BACKENDS, min_cosine: float = 0.99):
+    import multiprocessing as mp
+    from rag_agent import KARIM_KB
+
+    queries = [d.split(",")[0][:80] for d in KARIM_KB]
+    ctx = mp.get_context("spawn")
+    results = []
+    for backend in backends:
+        with ctx.Pool(1) as pool:
+            try:
+                results.append(pool.apply(_profile_backend, ((backend, model_name, KARIM_KB, queries),)))
+            except Exception as e:
+                print(f"{backend:>10}: unavailable ({e})")
+
+    ref = next((r for r in results if r["backend"] == "torch"), None)
+    print(f"{'backend':>10} {'load s':>8} {'p50 ms':>8} {'p95 ms':>8} {'RSS MB':>8} {'min cos':>8}")
+    for r in results:
+        cos = "—"
+        if ref is not None:
+            c = float((r["doc_vecs"] * ref["doc_vecs"]).sum(axis=1).min())
+            cos = f"{c:.4f}" + ("" if c >= min_cosine else " FAIL")
+        print(f"{r['backend']:>10} {r['load_s']:>8.2f} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} "
+              f"{r['rss_mb']:>8.0f} {cos:>8}")
+
+
+if __name__ == "__main__":
+    _report(os.getenv("RAG_EMBED_MODEL", "all-MiniLM-L6-v2"))
@@ -0,0 +1,528 @@
+"""
+RAG Vector Index — Karim Osman Portfolio
+Pluggable inner-product search: FAISS when available, pure NumPy otherwise.
+Both backends return FAISS-style (D, I) arrays so callers never branch.
+
+build_index() picks exact (flat), IVF or HNSW from the corpus size and a
+target recall, tunes the search breadth until the target is met on sampled
+queries, and records the measured recall@k against exact search.
+
+    python rag_index.py         # exact backends: latency + parity
+    python rag_index.py ann     # index kind, latency and recall as the corpus grows
+"""
+
+import os
+import time
+
+import numpy as np
+
+INDEX_BACKEND = os.getenv("RAG_INDEX_BACKEND", "auto")  # auto | faiss | numpy
+INDEX_KIND = os.getenv("RAG_INDEX_KIND", "auto")        # auto | flat | ivf | hnsw
+TARGET_RECALL = float(os.getenv("RAG_TARGET_RECALL", "0.95"))
+FLAT_MAX_DOCS = int(os.getenv("RAG_FLAT_MAX_DOCS", "20000"))  # exact search below this
+HNSW_MAX_DOCS = 1_000_000  # beyond this the graph's memory overhead favours IVF
+RECALL_K = 10
+
+# FAISS pads missing results with -FLT_MAX / -1 for inner-product indexes
+_MISSING_SCORE = -np.finfo(np.float32).max
+
+
+class VectorIndex:
+    """Minimal interface shared by all backends (mirrors faiss.Index)."""
+
+    backend = "base"
+    kind = "flat"
+    params: dict = {}
+    recall: float | None = 1.0  # measured recall@RECALL_K vs exact search
+
+    def describe(self) -> dict:
+        """What build_index chose, for artifact metadata and reports."""
+        recall = None if self.recall is None else round(float(self.recall), 4)
+        return {"kind": self.kind, "params": dict(self.params), "recall": recall, "recall_k": RECALL_K}
+
+    def set_params(self, params: dict) -> None:
+        """Apply search-time parameters (nprobe / efSearch); no-op for exact indexes."""
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    @property
+    def ntotal(self) -> int:
+        raise NotImplementedError
+
+    def add(self, vectors: np.ndarray) -> None:
+        raise NotImplementedError
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        raise NotImplementedError
+
+    def vectors(self) -> np.ndarray:
+        """All stored vectors in insertion order (used to re-index / compact)."""
+        raise NotImplementedError
+
+
+class NumpyIndex(VectorIndex):
+    """Exact search: one contiguous float32 matmul + argpartition for top-k.
+
+    A float16 matrix (compact storage, see rag_compress) is kept as float16 and
+    upcast block by block at search time, so it never costs float32 memory.
+    """
+
+    backend = "numpy"
+    _BLOCK = 32768
+
+    def __init__(self, dim: int, vectors: np.ndarray | None = None, dtype=None):
+        super().__init__(dim)
+        if dtype is None:
+            dtype = np.float16 if vectors is not None and vectors.dtype == np.float16 else np.float32
+        self.dtype = np.dtype(dtype)
+        self._buf = np.empty((0, dim), dtype=self.dtype)
+        self._n = 0
+        if vectors is not None:
+            self.add(vectors)
+
+    @property
+    def ntotal(self) -> int:
+        return self._n
+
+    @property
+    def _matrix(self) -> np.ndarray:
+        return self._buf[:self._n]
+
+    def add(self, vectors: np.ndarray) -> None:
+        vectors = np.ascontiguousarray(vectors, dtype=self.dtype).reshape(-1, self.dim)
+        if self._n == 0:
+            # Keeps a memory-mapped matrix from the artifact store un-copied
+            self._buf, self._n = vectors, len(vectors)
+            return
+        needed = self._n + len(vectors)
+        if needed > len(self._buf) or not self._buf.flags.writeable or isinstance(self._buf, np.memmap):
+            # Geometric growth keeps batch-by-batch ingestion amortized O(n)
+            grown = np.empty((max(needed, 2 * len(self._buf)), self.dim), dtype=self.dtype)
+            grown[:self._n] = self._buf[:self._n]
+            self._buf = grown
+        self._buf[self._n:needed] = vectors
+        self._n = needed
+
+    def vectors(self) -> np.ndarray:
+        return self._matrix
+
+    def _scores(self, q: np.ndarray) -> np.ndarray:
+        matrix = self._matrix
+        if matrix.dtype == np.float32:
+            return q @ matrix.T
+        scores = np.empty((len(q), len(matrix)), dtype=np.float32)
+        for start in range(0, len(matrix), self._BLOCK):
+            block = matrix[start:start + self._BLOCK].astype(np.float32)
+            scores[:, start:start + len(block)] = q @ block.T
+        return scores
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        q = np.ascontiguousarray(queries, dtype=np.float32).reshape(-1, self.dim)
+        n_q, n = q.shape[0], self.ntotal
+        D = np.full((n_q, k), _MISSING_SCORE, dtype=np.float32)
+        I = np.full((n_q, k), -1, dtype=np.int64)
+        kk = min(k, n)
+        if kk == 0:
+            return D, I
+
+        scores = self._scores(q)
+        if kk < n:
+            cand = np.argpartition(-scores, kk - 1, axis=1)[:, :kk]
+        else:
+            cand = np.broadcast_to(np.arange(n), (n_q, n))
+        cand_scores = np.take_along_axis(scores, cand, axis=1)
+        if kk < n:
+            # argpartition picks arbitrary ids among ties at the k-th score; IndexFlatIP keeps the lowest
+            kth = cand_scores.min(axis=1)
+            cut = np.flatnonzero((scores == kth[:, None]).sum(axis=1) > (cand_scores == kth[:, None]).sum(axis=1))
+            if len(cut):
+                cand = cand.copy()
+                for row in cut:
+                    above = np.flatnonzero(scores[row] > kth[row])
+                    tied = np.flatnonzero(scores[row] == kth[row])[:kk - len(above)]
+                    cand[row] = np.concatenate([above, tied])
+                cand_scores = np.take_along_axis(scores, cand, axis=1)
+
+        # Score descending, id ascending on ties — same order as IndexFlatIP
+        for row in range(n_q):
+            order = np.lexsort((cand[row], -cand_scores[row]))
+            D[row, :kk] = cand_scores[row, order]
+            I[row, :kk] = cand[row, order]
+        return D, I
+
+
+class NumpyIVFIndex(VectorIndex):
+    """Inverted-file ANN on NumPy: k-means cells, only `nprobe` cells scanned per query.
+
+    Vectors are kept in one matrix; the inverted lists are a cell-sorted
+    permutation of row ids plus offsets, rebuilt lazily after adds.
+    """
+
+    backend = "numpy"
+    kind = "ivf"
+
+    def __init__(self, dim: int, centroids: np.ndarray, nprobe: int = 8, dtype=np.float32):
+        super().__init__(dim)
+        self.centroids = np.ascontiguousarray(centroids, dtype=np.float32)
+        self.params = {"nlist": len(self.centroids), "nprobe": nprobe}
+        self._rows = NumpyIndex(dim, dtype=dtype)
+        self._assign = np.empty(0, dtype=np.int64)
+        self._order = self._offsets = None
+
+    @staticmethod
+    def train(vectors: np.ndarray, nlist: int, iters: int = 10, seed: int = 0) -> np.ndarray:
+        """Spherical k-means centroids (inner product on unit vectors)."""
+        rng = np.random.default_rng(seed)
+        x = np.ascontiguousarray(vectors, dtype=np.float32)
+        centroids = x[rng.choice(len(x), nlist, replace=False)].copy()
+        for _ in range(iters):
+            assign = np.argmax(x @ centroids.T, axis=1)
+            order = np.argsort(assign, kind="stable")
+            cells, starts = np.unique(assign[order], return_index=True)
+            sums = np.zeros_like(centroids)
+            sums[cells] = np.add.reduceat(x[order], starts, axis=0)
+            empty = ~sums.any(axis=1)
+            sums[empty] = x[rng.choice(len(x), int(empty.sum()), replace=False)]
+            centroids = sums / np.linalg.norm(sums, axis=1, keepdims=True)
+        return centroids
+
+    @property
+    def ntotal(self) -> int:
+        return self._rows.ntotal
+
+    def set_params(self, params: dict) -> None:
+        if "nprobe" in params:
+            self.params["nprobe"] = int(params["nprobe"])
+
+    def add(self, vectors: np.ndarray) -> None:
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        assign = [np.argmax(vectors[s:s + 8192] @ self.centroids.T, axis=1)
+                  for s in range(0, len(vectors), 8192)]
+        self._rows.add(vectors)
+        self._assign = np.concatenate([self._assign, *assign])
+        self._order = None
+
+    def vectors(self) -> np.ndarray:
+        return self._rows.vectors()
+
+    def _lists(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._order is None:
+            self._order = np.argsort(self._assign, kind="stable")
+            self._offsets = np.searchsorted(self._assign[self._order], np.arange(len(self.centroids) + 1))
+        return self._order, self._offsets
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        q = np.ascontiguousarray(queries, dtype=np.float32).reshape(-1, self.dim)
+        D = np.full((len(q), k), _MISSING_SCORE, dtype=np.float32)
+        I = np.full((len(q), k), -1, dtype=np.int64)
+        if self.ntotal == 0:
+            return D, I
+        order, offsets = self._lists()
+        matrix = self._rows.vectors()
+        nprobe = min(self.params["nprobe"], len(self.centroids))
+        probes = np.argpartition(-(q @ self.centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+
+        for row in range(len(q)):
+            cand = np.concatenate([order[offsets[c]:offsets[c + 1]] for c in probes[row]])
+            scores = matrix[cand] @ q[row]
+            kk = min(k, len(cand))
+            if kk < len(cand):
+                top = np.argpartition(-scores, kk - 1)[:kk]
+                cand, scores = cand[top], scores[top]
+            top = np.lexsort((cand, -scores))[:kk]
+            D[row, :kk] = scores[top]
+            I[row, :kk] = cand[top]
+        return D, I
+
+
+class FaissIndex(VectorIndex):
+    """Thin wrapper over a FAISS index: IndexFlatIP by default, or a trained/deserialized one."""
+
+    backend = "faiss"
+
+    def __init__(self, dim: int, index=None, kind: str = "flat", params: dict | None = None):
+        import faiss
+
+        super().__init__(dim)
+        self.faiss_index = index if index is not None else faiss.IndexFlatIP(dim)
+        self.kind = kind
+        self.params = {}
+        if params:
+            self.set_params(params)
+
+    @property
+    def ntotal(self) -> int:
+        return self.faiss_index.ntotal
+
+    def set_params(self, params: dict) -> None:
+        import faiss
+
+        self.params.update(params)
+        if "nprobe" in params:
+            faiss.extract_index_ivf(self.faiss_index).nprobe = int(params["nprobe"])
+        if "efSearch" in params:
+            self.faiss_index.hnsw.efSearch = int(params["efSearch"])
+
+    def add(self, vectors: np.ndarray) -> None:
+        self.faiss_index.add(np.ascontiguousarray(vectors, dtype=np.float32).reshape(-1, self.dim))
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        q = np.ascontiguousarray(queries, dtype=np.float32).reshape(-1, self.dim)
+        return self.faiss_index.search(q, k)
+
+    def vectors(self) -> np.ndarray:
+        return self.faiss_index.reconstruct_n(0, self.ntotal)
+
+
+def faiss_available() -> bool:
+    try:
+        import faiss  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def resolve_backend(backend: str | None = None) -> str:
+    """Map 'auto' to the best installed backend."""
+    backend = (backend or INDEX_BACKEND).lower()
+    if backend == "auto":
+        return "faiss" if faiss_available() else "numpy"
+    if backend not in ("faiss", "numpy"):
+        raise ValueError(f"Unknown index backend: {backend}")
+    return backend
+
+
+def _faiss_codec_index(dim: int, description: str, vectors: np.ndarray | None) -> "FaissIndex":
+    """FAISS index from a factory string, trained on a sample of `vectors` if it needs it."""
+    import faiss
+
+    index = faiss.index_factory(dim, description, faiss.METRIC_INNER_PRODUCT)
+    if not index.is_trained:
+        if vectors is None:
+            raise ValueError(f"FAISS index {description} needs training vectors")
+        rng = np.random.default_rng(0)
+        picks = np.sort(rng.choice(len(vectors), min(len(vectors), 65536), replace=False))
+        index.train(np.asarray(vectors[picks], dtype=np.float32))
+    return FaissIndex(dim, index)
+
+
+def make_index(dim: int, vectors: np.ndarray | None = None,
+               backend: str | None = None, codec: str = "Flat") -> VectorIndex:
+    """Create an exhaustive inner-product index on the configured backend.
+
+    codec is the FAISS vector encoding — "Flat", "SQfp16" or "PQ<m>"; the NumPy
+    backend stores vectors in their own dtype (float32 or float16) instead.
+    """
+    if resolve_backend(backend) == "faiss":
+        index = FaissIndex(dim) if codec == "Flat" else _faiss_codec_index(dim, codec, vectors)
+        if codec != "Flat":
+            index.params["codec"] = codec
+        if vectors is not None:
+            for start in range(0, len(vectors), 65536):
+                index.add(vectors[start:start + 65536])
+        return index
+    return NumpyIndex(dim, vectors)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  ANN FACTORY
+# ─────────────────────────────────────────────────────────────────────────────
+def choose_kind(n_docs: int, target_recall: float = TARGET_RECALL, backend: str | None = None,
+                kind: str | None = None, codec: str = "Flat") -> str:
+    """flat while brute force is cheap (or near-perfect recall is required), then
+    HNSW (FAISS only) up to HNSW_MAX_DOCS, IVF beyond that."""
+    kind = (kind or INDEX_KIND).lower()
+    if kind not in ("auto", "flat", "ivf", "hnsw"):
+        raise ValueError(f"Unknown index kind: {kind}")
+    if kind == "hnsw" and (resolve_backend(backend) != "faiss" or codec != "Flat"):
+        kind = "ivf"  # no HNSW graph on the NumPy backend; compressed codes go in IVF lists
+    if kind != "auto":
+        return kind
+    if n_docs <= FLAT_MAX_DOCS or target_recall >= 0.999:
+        return "flat"
+    if resolve_backend(backend) == "faiss" and codec == "Flat" and n_docs <= HNSW_MAX_DOCS:
+        return "hnsw"
+    return "ivf"
+
+
+def sample_queries(vectors: np.ndarray, n: int = 200, noise: float = 0.5,
+                   seed: int = 0) -> np.ndarray:
+    """Perturbed copies of stored vectors — held-out-like queries with known neighbourhoods."""
+    rng = np.random.default_rng(seed)
+    picks = np.sort(rng.choice(len(vectors), min(n, len(vectors)), replace=False))
+    q = np.asarray(vectors[picks], dtype=np.float32)
+    q = q + noise * rng.standard_normal(q.shape).astype(np.float32) / np.sqrt(q.shape[1])
+    return q / np.linalg.norm(q, axis=1, keepdims=True)
+
+
+def exact_neighbours(vectors: np.ndarray, queries: np.ndarray, k: int = RECALL_K) -> np.ndarray:
+    """Ground-truth ids, computed in query blocks so the score matrix stays small."""
+    exact = NumpyIndex(vectors.shape[1], vectors)
+    block = max(1, (1 << 24) // max(len(vectors), 1))
+    return np.vstack([exact.search(queries[s:s + block], k)[1] for s in range(0, len(queries), block)])
+
+
+def recall_at_k(index: VectorIndex, queries: np.ndarray, truth: np.ndarray) -> float:
+    found = index.search(queries, truth.shape[1])[1]
+    return float(np.mean([len(np.intersect1d(f, t)) / len(t) for f, t in zip(found, truth)]))
+
+
+def _train_ann(vectors: np.ndarray, kind: str, backend: str, codec: str = "Flat",
+               seed: int = 0) -> VectorIndex:
+    n, dim = vectors.shape
+    if kind == "ivf":
+        # ~4·√n cells, at least 39 training points per cell (FAISS' own floor)
+        nlist = int(np.clip(4 * np.sqrt(n), 1, max(1, n // 39)))
+        rng = np.random.default_rng(seed)
+        train = np.asarray(vectors[np.sort(rng.choice(n, min(n, nlist * 64), replace=False))],
+                           dtype=np.float32)
+        if backend == "faiss":
+            import faiss
+            index = FaissIndex(dim, faiss.index_factory(dim, f"IVF{nlist},{codec}",
+                                                        faiss.METRIC_INNER_PRODUCT), kind="ivf")
+            index.faiss_index.train(train)
+            index.params["nlist"] = nlist
+            if codec != "Flat":
+                index.params["codec"] = codec
+        else:
+            index = NumpyIVFIndex(dim, NumpyIVFIndex.train(train, nlist, seed=seed),
+                                  dtype=vectors.dtype)
+    else:
+        import faiss
+        hnsw = faiss.index_factory(dim, "HNSW32", faiss.METRIC_INNER_PRODUCT)
+        hnsw.hnsw.efConstruction = 80
+        index = FaissIndex(dim, hnsw, kind="hnsw", params={"M": 32})
+
+    for start in range(0, n, 65536):
+        index.add(vectors[start:start + 65536])
+    return index
+
+
+_SWEEP = {"ivf": ("nprobe", (1, 2, 4, 8, 16, 32, 64, 128, 256)),
+          "hnsw": ("efSearch", (16, 32, 64, 128, 256, 512))}
+
+
+def build_index(vectors: np.ndarray, backend: str | None = None, kind: str | None = None,
+                target_recall: float = TARGET_RECALL, codec: str = "Flat") -> VectorIndex:
+    """Index over `vectors` whose kind fits the corpus size and target recall.
+
+    ANN indexes are trained, filled, then tuned: the search breadth (nprobe /
+    efSearch) grows until recall@RECALL_K on sampled queries reaches the
+    target; the measured recall is kept on the index (see describe()).
+    Lossy codecs (FAISS PQ) get their recall measured even when exhaustive.
+    """
+    backend = resolve_backend(backend)
+    if backend != "faiss":
+        codec = "Flat"
+    n, dim = vectors.shape
+    kind = choose_kind(n, target_recall, backend, kind, codec)
+    if kind == "flat" or n <= RECALL_K:
+        index = make_index(dim, vectors, backend=backend, codec=codec)
+        if codec.startswith("PQ") and n > RECALL_K:
+            queries = sample_queries(vectors)
+            index.recall = recall_at_k(index, queries, exact_neighbours(vectors, queries))
+        return index
+
+    index = _train_ann(vectors, kind, backend, codec)
+    queries = sample_queries(vectors)
+    truth = exact_neighbours(vectors, queries)
+    name, sweep = _SWEEP[kind]
+    for value in sweep:
+        if kind == "ivf":
+            value = min(value, index.params["nlist"])
+        index.set_params({name: value})
+        index.recall = recall_at_k(index, queries, truth)
+        if index.recall >= target_recall or (kind == "ivf" and value == index.params["nlist"]):
+            break
+    return index
+
+
+def restore_index(vectors: np.ndarray, ann: dict, backend: str | None = None,
+                  faiss_index=None, centroids: np.ndarray | None = None) -> VectorIndex | None:
+    """Rebuild a persisted index from its artifacts, or None if they don't match.
+
+    Exact NumPy indexes are not persisted (the embeddings are the index).
+    """
+    backend, kind = resolve_backend(backend), ann.get("kind")
+    if not kind:
+        return None
+    if backend == "faiss" and faiss_index is not None:
+        index = FaissIndex(vectors.shape[1], faiss_index, kind=kind, params=ann.get("params"))
+    elif backend == "numpy" and kind == "ivf" and centroids is not None:
+        index = NumpyIVFIndex(vectors.shape[1], centroids, ann["params"]["nprobe"], vectors.dtype)
+        index.add(vectors)
+    else:
+        return None
+    index.recall = ann.get("recall")
+    return index
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  BENCHMARKS
+# ─────────────────────────────────────────────────────────────────────────────
+def _clustered(n: int, dim: int, rng, n_topics: int = 256) -> np.ndarray:
+    """Unit vectors around random topic centres — closer to text embeddings than pure noise."""
+    centres = rng.standard_normal((n_topics, dim)).astype(np.float32)
+    x = centres[rng.integers(0, n_topics, n)] + 0.8 * rng.standard_normal((n, dim)).astype(np.float32)
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+def _bench(sizes=(50, 1_000, 10_000, 100_000), dim=384, n_queries=200, k=4):
+    """Per-query latency of each backend across corpus sizes, plus result parity."""
+    rng = np.random.default_rng(0)
+    backends = ["numpy"] + (["faiss"] if faiss_available() else [])
+    print(f"{'n_docs':>8} " + " ".join(f"{b + ' µs/q':>14}" for b in backends) + "  parity")
+
+    for n in sizes:
+        docs = rng.standard_normal((n, dim)).astype(np.float32)
+        docs /= np.linalg.norm(docs, axis=1, keepdims=True)
+        queries = rng.standard_normal((n_queries, dim)).astype(np.float32)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+        timings, results = [], []
+        for b in backends:
+            index = make_index(dim, docs, backend=b)
+            index.search(queries[:1], k)  # warm caches
+            t0 = time.perf_counter()
+            for q in queries:
+                index.search(q[None, :], k)
+            timings.append((time.perf_counter() - t0) / n_queries * 1e6)
+            results.append(index.search(queries, k)[1])
+
+        parity = "—" if len(results) == 1 else ("exact" if np.array_equal(*results) else "MISMATCH")
+        print(f"{n:>8} " + " ".join(f"{t:>14.1f}" for t in timings) + f"  {parity}")
+
+
+def _bench_ann(sizes=(1_000, 30_000, 100_000, 300_000), dim=384, n_queries=200):
+    """What build_index picks per corpus size, its build time, µs/query and recall@k."""
+    rng = np.random.default_rng(0)
+    backends = ["numpy"] + (["faiss"] if faiss_available() else [])
+    print(f"target recall@{RECALL_K} ≥ {TARGET_RECALL}")
+    print(f"{'n_docs':>8} {'backend':>8} {'kind':>5} {'params':>28} {'build s':>8} "
+          f"{'µs/q':>8} {'exact µs/q':>10} {'recall':>7}")
+
+    for n in sizes:
+        docs = _clustered(n, dim, rng)
+        queries = sample_queries(docs, n_queries, seed=1)
+        truth = exact_neighbours(docs, queries)
+        for b in backends:
+            t0 = time.perf_counter()
+            index = build_index(docs, backend=b)
+            build_s = time.perf_counter() - t0
+            row = []
+            for idx in (index, make_index(dim, docs, backend=b)):
+                idx.search(queries[:1], RECALL_K)
+                t0 = time.perf_counter()
+                for q in queries:
+                    idx.search(q[None, :], RECALL_K)
+                row.append((time.perf_counter() - t0) / n_queries * 1e6)
+            params = ",".join(f"{k}={v}" for k, v in index.params.items()) or "—"
+            print(f"{n:>8} {b:>8} {index.kind:>5} {params:>28} {build_s:>8.2f} "
+                  f"{row[0]:>8.1f} {row[1]:>10.1f} {recall_at_k(index, queries, truth):>7.3f}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    _bench_ann() if sys.argv[1:] == ["ann"] else _bench()
@@ -0,0 +1,256 @@
+"""
+RAG Knowledge-Base Ingestion — Karim Osman Portfolio
+Streams factual text out of the repo's content files into the RAG index:
+
+    source files → split → normalize → dedupe (content hash) → embed in batches → index
+
+Chunks are yielded by generators and embedded batch by batch straight into a
+memory-mapped artifact, so the KB can grow to thousands of chunks without
+code changes or a startup memory spike.
+
+    python rag_ingest.py        # list the chunks each source contributes
+"""
+
+import ast
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from rag_store import ArtifactWriter, load_artifacts
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+KB_SOURCES = os.getenv(
+    "RAG_KB_SOURCES", "builtin,profile_content.json,locales/en/translation.json,index.py")
+KB_LANG = os.getenv("RAG_KB_LANG", "en")
+MAX_CHUNK_CHARS = int(os.getenv("RAG_MAX_CHUNK_CHARS", "400"))
+MIN_CHUNK_WORDS = int(os.getenv("RAG_MIN_CHUNK_WORDS", "6"))
+# Content literals read from .py sources — everything else in the module is UI code
+KB_PY_LITERALS = {name.strip() for name in os.getenv(
+    "RAG_KB_PY_LITERALS", "I18N,services,steps_map,featured,footer_texts").split(",") if name.strip()}
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+_MD_RE = re.compile(r"\*\*|__|^\s*[-•]\s+", re.M)
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9€\"'(])")
+_CODE_RE = re.compile(r"[{};]|\bpx\b|rgba?\(|#[0-9a-fA-F]{6}\b|https?://\S+$")
+# Keys of UI chrome in content files (py literals and JSON locales): headings, nav, form
+# fields and errors, placeholders, spinners, calls to action, footers, quick-question labels
+_UI_KEY_RE = re.compile(
+    r"(^|_)(nav|form|section|hero|header|tab|title|label|button|option|footer|call|placeholder"
+    r"|spinner|warning|advice|prompt|random|category|guidance|calendly|github|direct|professional"
+    r"|video|link|info|welcome|resume)(_|$)"
+    r"|^(purpose_opts|hire_cta|download_cv|strongest_skill|impactful_project|problem_solving"
+    r"|different|ai_vision|default_response|thinking|ai_assistant)$", re.I)
+_CONTENT_KEY_RE = re.compile(r"^project_\w+_title$", re.I)  # project names are facts, not headings
+_LANG_CODES = {"en", "it", "fr", "de", "es", "ja", "zh", "sv", "nl", "da", "ar"}
+
+
+@dataclass(frozen=True)
+class Chunk:
+    id: str        # content hash of the normalized text — stable across runs
+    text: str
+    source: str
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  SOURCES — each yields raw text blocks
+# ─────────────────────────────────────────────────────────────────────────────
+def _iter_json_strings(node, lang: str) -> Iterator[str]:
+    if isinstance(node, dict):
+        keys = set(node)
+        if lang in keys and keys <= _LANG_CODES:
+            yield from _iter_json_strings(node[lang], lang)
+            return
+        for value in node.values():
+            yield from _iter_json_strings(value, lang)
+    elif isinstance(node, (list, tuple)):
+        if node and all(isinstance(v, str) for v in node):
+            yield ", ".join(node)
+        else:
+            for value in node:
+                yield from _iter_json_strings(value, lang)
+    elif isinstance(node, str):
+        yield node
+
+
+def _drop_ui_keys(node):
+    """Remove UI chrome (headings, nav, form fields, calls to action) from a content tree."""
+    if isinstance(node, dict):
+        return {k: _drop_ui_keys(v) for k, v in node.items()
+                if not (isinstance(k, str) and _UI_KEY_RE.search(k) and not _CONTENT_KEY_RE.match(k))}
+    if isinstance(node, (list, tuple)):
+        return [_drop_ui_keys(v) for v in node]
+    return node
+
+
+def _iter_python_strings(path: str, lang: str) -> Iterator[str]:
+    """Strings of the content literals named in RAG_KB_PY_LITERALS, read with ast
+    (never imported or executed).
+
+    Only `NAME = {...}` / `[...]` assignments with an allowlisted name count, at
+    module level or inside a page function; docstrings, widget defaults, call
+    arguments and demo text elsewhere in the module are never indexed.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Assign)
+                and any(getattr(t, "id", None) in KB_PY_LITERALS for t in node.targets)):
+            continue
+        try:
+            value = ast.literal_eval(node.value)
+        except ValueError:
+            print(f"RAG ingest: {path}:{node.lineno} is not a plain literal, skipping")
+            continue
+        yield from _iter_json_strings(_drop_ui_keys(value), lang)
+
+
+def _builtin_kb() -> list[str]:
+    """KARIM_KB from rag_agent.py, read as a literal (importing would pull in streamlit)."""
+    with open(source_path("builtin"), "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "KARIM_KB" for t in node.targets):
+            return ast.literal_eval(node.value)
+    return []
+
+
+def kb_sources() -> list[str]:
+    """Source specs configured in RAG_KB_SOURCES."""
+    return [s.strip() for s in KB_SOURCES.split(",") if s.strip()]
+
+
+def source_path(source: str) -> str:
+    """File behind a source spec ('builtin' is KARIM_KB in rag_agent.py)."""
+    if source == "builtin":
+        return os.path.join(BASE_DIR, "rag_agent.py")
+    return source if os.path.isabs(source) else os.path.join(BASE_DIR, source)
+
+
+def iter_source_texts(source: str, lang: str = KB_LANG) -> Iterator[str]:
+    """Raw text blocks from one source spec: 'builtin', a .json or a .py path."""
+    if source == "builtin":
+        yield from _builtin_kb()
+        return
+
+    path = source_path(source)
+    if not os.path.exists(path):
+        print(f"RAG ingest: source not found, skipping: {source}")
+        return
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            yield from _iter_json_strings(_drop_ui_keys(json.load(f)), lang)
+    elif path.endswith(".py"):
+        yield from _iter_python_strings(path, lang)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            for block in f.read().split("\n\n"):
+                yield block
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  SPLIT → NORMALIZE → DEDUPE
+# ─────────────────────────────────────────────────────────────────────────────
+def normalize_text(text: str) -> str:
+    """Strip HTML tags and markdown emphasis/bullets, fold Unicode and whitespace."""
+    text = unicodedata.normalize("NFKC", _TAG_RE.sub(" ", text))
+    text = _MD_RE.sub(" ", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def split_text(text: str, max_chars: int = MAX_CHUNK_CHARS) -> Iterator[str]:
+    """Sentence-packed pieces of at most max_chars (single long sentences pass through)."""
+    if len(text) <= max_chars:
+        yield text
+        return
+    piece = ""
+    for sentence in _SENTENCE_RE.split(text):
+        if piece and len(piece) + 1 + len(sentence) > max_chars:
+            yield piece
+            piece = sentence
+        else:
+            piece = f"{piece} {sentence}".strip()
+    if piece:
+        yield piece
+
+
+def _is_factual(text: str) -> bool:
+    return (len(text.split()) >= MIN_CHUNK_WORDS and not text.startswith("#")
+            and not _CODE_RE.search(text))
+
+
+def chunk_id(text: str) -> str:
+    return hashlib.sha1(text.casefold().encode("utf-8")).hexdigest()[:16]
+
+
+def iter_chunks(sources: Iterable[str] | None = None, lang: str = KB_LANG) -> Iterator[Chunk]:
+    """Deduplicated chunks across all sources, in source order."""
+    if sources is None:
+        sources = kb_sources()
+    seen: set[str] = set()
+    for source in sources:
+        for raw in iter_source_texts(source, lang):
+            for piece in split_text(normalize_text(raw)):
+                if not _is_factual(piece):
+                    continue
+                cid = chunk_id(piece)
+                if cid in seen:
+                    continue
+                seen.add(cid)
+                yield Chunk(cid, piece, source)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  EMBED + INDEX
+# ─────────────────────────────────────────────────────────────────────────────
+def iter_batches(items: list, batch_size: int) -> Iterator[tuple[int, list]]:
+    for start in range(0, len(items), batch_size):
+        yield start, items[start:start + batch_size]
+
+
+def embed_into_store(texts: list[str], encoder, key: str, make_index,
+                     batch_size: int = 64, meta: dict | None = None):
+    """Encode `texts` batch by batch into a memory-mapped artifact and an index.
+
+    make_index(dim) must return an empty VectorIndex. Returns (embeddings, index),
+    where embeddings is the published memory map, or None if publishing failed
+    (e.g. on a read-only filesystem) — the index itself is complete either way.
+    """
+    writer, index = None, None
+    for start, batch in iter_batches(texts, batch_size):
+        vecs = np.ascontiguousarray(
+            encoder.encode(batch, batch_size=batch_size, show_progress_bar=False,
+                           normalize_embeddings=True), dtype=np.float32)
+        if index is None:
+            index = make_index(vecs.shape[1])
+            try:
+                writer = ArtifactWriter(key, len(texts), vecs.shape[1])
+            except OSError as e:
+                print(f"RAG ingest: not persisting artifacts {key}: {e}")
+        if writer is not None:
+            writer.write(start, vecs)
+        index.add(vecs)
+
+    if index is None:
+        raise ValueError("RAG ingest: no chunks to embed")
+    if writer is None:
+        return None, index
+    writer.commit(getattr(index, "faiss_index", None), meta)
+    stored = load_artifacts(key)
+    return (stored["embeddings"] if stored is not None else None), index
+
+
+if __name__ == "__main__":
+    from collections import Counter
+
+    chunks = list(iter_chunks())
+    for source, n in Counter(c.source for c in chunks).items():
+        print(f"{source:>32}: {n} chunks")
+    print(f"{'total':>32}: {len(chunks)} chunks, {sum(len(c.text) for c in chunks)} chars")
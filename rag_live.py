@@ -0,0 +1,303 @@
+"""
+RAG Live Knowledge Base — Karim Osman Portfolio
+Incremental add / update / delete of KB chunks by stable chunk ID, and a
+watcher on the KB source files that applies the deltas to the running index.
+
+Chunk IDs are content hashes (see rag_ingest), so editing a fact is a delete
+of the old ID plus an add of the new one: only the changed chunks go through
+the encoder. Index positions are append-only; deleted ones are tombstoned and
+skipped at search time until enough pile up to compact the index.
+
+    python rag_live.py      # time a one-fact edit against a full re-encode
+"""
+
+import os
+import threading
+import time
+from typing import Iterable
+
+import numpy as np
+
+from rag_index import NumpyIndex
+from rag_ingest import Chunk, iter_chunks, kb_sources, source_path
+from rag_sparse import BM25Index, tokenize
+
+KB_WATCH = os.getenv("RAG_KB_WATCH", "false").lower() in ("1", "true", "yes")
+KB_WATCH_INTERVAL = float(os.getenv("RAG_KB_WATCH_INTERVAL", "2"))
+COMPACT_RATIO = float(os.getenv("RAG_KB_COMPACT_RATIO", "0.25"))
+
+_MISSING_SCORE = -np.finfo(np.float32).max
+
+
+class SlotVectors:
+    """Embeddings addressed by slot, e.g. rag_state["embeddings"][ids]."""
+
+    def __init__(self, live: "LiveKB"):
+        self._live = live
+
+    def __getitem__(self, slots) -> np.ndarray:
+        live = self._live
+        with live._lock:
+            pos = live._slot_pos[np.asarray(slots)]
+            if np.any(pos < 0):
+                raise KeyError(f"Deleted KB slots: {np.unique(np.asarray(slots)[pos < 0]).tolist()}")
+            return np.asarray(live._rows.vectors()[pos])
+
+
+class _SlotSparse:
+    """BM25 over the live chunks, reporting slots instead of its own doc ids."""
+
+    def __init__(self, docs: list[str], slots: np.ndarray, tokens: dict[int, list[str]]):
+        self._bm25 = BM25Index([docs[s] for s in slots], tokenized=[tokens[s] for s in slots])
+        self._slots = slots
+
+    def search(self, query: str, k: int) -> list[tuple[int, float]]:
+        return [(int(self._slots[i]), score) for i, score in self._bm25.search(query, k)]
+
+
+class LiveKB:
+    """Chunk-ID-mapped view over a VectorIndex that accepts deltas in place.
+
+    Every chunk version gets a slot — an int that stays fixed while the chunk is
+    live — so `docs[slot]` stays valid for callers while the KB changes
+    underneath. Slots of deleted chunks are recycled once compaction has removed
+    their rows, so docs and the slot maps stay bounded under churn. search() returns
+    slots in FAISS-style (D, I) arrays, so a LiveKB drops in for rag_state["index"].
+    build_index(rows) makes the replacement index when tombstones are compacted.
+    """
+
+    def __init__(self, chunks: list[Chunk], embeddings: np.ndarray | None, index,
+                 encoder, build_index, batch_size: int = 64):
+        self.dim = index.dim
+        self.backend = index.backend
+        self.encoder, self._build_index, self.batch_size = encoder, build_index, batch_size
+        self.on_change: list = []
+        self.version = 0
+        self._lock = threading.RLock()
+
+        self.index = index
+        self._rows = index if isinstance(index, NumpyIndex) else NumpyIndex(
+            self.dim, embeddings if embeddings is not None else index.vectors())
+        self.docs = [c.text for c in chunks]
+        self._slot_of = {c.id: i for i, c in enumerate(chunks)}
+        self._pos_slot = np.arange(len(chunks), dtype=np.int64)   # index position → slot
+        self._slot_pos = np.arange(len(chunks), dtype=np.int64)   # slot → position, -1 if deleted
+        self._tokens = {i: tokenize(c.text) for i, c in enumerate(chunks)}  # BM25 rebuilds skip these
+        self._free: list[int] = []  # slots whose rows were compacted away, reused by _append
+        self.sparse = self._build_sparse()
+
+    @property
+    def ntotal(self) -> int:
+        return len(self._slot_of)
+
+    @property
+    def embeddings(self) -> SlotVectors:
+        return SlotVectors(self)
+
+    def __contains__(self, chunk_id: str) -> bool:
+        return chunk_id in self._slot_of
+
+    # ── search ───────────────────────────────────────────────────────────────
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        with self._lock:
+            n_dead = len(self._pos_slot) - len(self._slot_of)
+            D, P = self.index.search(queries, k + n_dead)
+            if not len(self._pos_slot):
+                return D[:, :k], P[:, :k]
+            slots = np.where(P >= 0, self._pos_slot[np.clip(P, 0, None)], -1)
+            if n_dead:
+                slots[self._slot_pos[np.clip(slots, 0, None)] < 0] = -1
+        if not n_dead:
+            return D, slots
+
+        out_D = np.full((len(D), k), _MISSING_SCORE, dtype=np.float32)
+        out_I = np.full((len(D), k), -1, dtype=np.int64)
+        for row in range(len(D)):
+            keep = np.flatnonzero(slots[row] >= 0)[:k]
+            out_D[row, :len(keep)] = D[row, keep]
+            out_I[row, :len(keep)] = slots[row, keep]
+        return out_D, out_I
+
+    # ── deltas ───────────────────────────────────────────────────────────────
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        return np.ascontiguousarray(
+            self.encoder.encode(texts, batch_size=self.batch_size, show_progress_bar=False,
+                                normalize_embeddings=True), dtype=np.float32).reshape(-1, self.dim)
+
+    def _drop(self, chunk_ids: Iterable[str]) -> int:
+        n = 0
+        for cid in chunk_ids:
+            slot = self._slot_of.pop(cid, None)
+            if slot is not None:
+                self._slot_pos[slot] = -1
+                del self._tokens[slot]
+                n += 1
+        return n
+
+    def _append(self, chunks: list[Chunk], vecs: np.ndarray) -> None:
+        n_reused = min(len(self._free), len(chunks))
+        reused = [self._free.pop() for _ in range(n_reused)]
+        slots = np.array(reused + list(range(len(self.docs), len(self.docs) + len(chunks) - n_reused)),
+                         dtype=np.int64)
+        positions = np.arange(self.index.ntotal, self.index.ntotal + len(chunks), dtype=np.int64)
+        self.index.add(vecs)
+        if self._rows is not self.index:
+            self._rows.add(vecs)
+        for slot, c in zip(reused, chunks):
+            self.docs[slot] = c.text
+        self.docs.extend(c.text for c in chunks[n_reused:])  # in place: rag_state["docs"] is this list
+        self._slot_of.update((c.id, int(s)) for c, s in zip(chunks, slots))
+        self._tokens.update((int(s), tokenize(c.text)) for c, s in zip(chunks, slots))
+        self._pos_slot = np.concatenate([self._pos_slot, slots])
+        self._slot_pos = np.concatenate([self._slot_pos, np.full(len(chunks) - n_reused, -1, np.int64)])
+        self._slot_pos[slots] = positions
+
+    def _compact(self) -> None:
+        """Rebuild the index from live rows only. Live slots are unchanged; the
+        slots of the dropped rows go on the free list."""
+        alive = self._slot_pos[self._pos_slot] >= 0
+        keep = np.flatnonzero(alive)
+        rows = np.ascontiguousarray(self._rows.vectors()[keep])
+        index = self._build_index(rows)
+        self.index = index
+        self._rows = index if isinstance(index, NumpyIndex) else NumpyIndex(self.dim, rows)
+        freed = self._pos_slot[~alive]
+        self._pos_slot = self._pos_slot[keep]
+        self._slot_pos[self._pos_slot] = np.arange(len(keep), dtype=np.int64)
+        for slot in freed.tolist():
+            self.docs[slot] = ""
+        self._free.extend(freed.tolist())
+
+    def _build_sparse(self) -> _SlotSparse:
+        return _SlotSparse(self.docs, np.array(sorted(self._slot_of.values()), dtype=np.int64),
+                           self._tokens)
+
+    def _commit(self, added: int, removed: int, started: float) -> dict:
+        """Called under the lock once a delta is applied."""
+        if len(self._pos_slot) - len(self._slot_of) > COMPACT_RATIO * max(len(self._pos_slot), 1):
+            self._compact()
+        self.sparse = self._build_sparse()
+        self.version += 1
+        delta = {"added": added, "removed": removed, "n_chunks": self.ntotal,
+                 "version": self.version, "ms": (time.perf_counter() - started) * 1e3}
+        for fn in self.on_change:
+            try:
+                fn(delta)
+            except Exception as e:
+                print(f"RAG live: on_change callback failed: {e}")
+        return delta
+
+    def upsert(self, chunks: list[Chunk]) -> dict:
+        """Add chunks, replacing any with the same ID. Only these chunks are encoded."""
+        started = time.perf_counter()
+        chunks = list({c.id: c for c in chunks}.values())
+        vecs = self._encode([c.text for c in chunks]) if chunks else None
+        with self._lock:
+            removed = self._drop(c.id for c in chunks)
+            if chunks:
+                self._append(chunks, vecs)
+            return self._commit(len(chunks) - removed, removed, started)
+
+    def delete(self, chunk_ids: Iterable[str]) -> dict:
+        started = time.perf_counter()
+        with self._lock:
+            return self._commit(0, self._drop(chunk_ids), started)
+
+    def sync(self, chunks: list[Chunk]) -> dict:
+        """Make the live KB match `chunks`: encode only IDs it has not seen, drop the rest."""
+        started = time.perf_counter()
+        wanted = {c.id: c for c in chunks}
+        with self._lock:
+            stale = [cid for cid in self._slot_of if cid not in wanted]
+            fresh = [c for cid, c in wanted.items() if cid not in self._slot_of]
+        if not stale and not fresh:
+            return {"added": 0, "removed": 0, "n_chunks": self.ntotal,
+                    "version": self.version, "ms": (time.perf_counter() - started) * 1e3}
+
+        vecs = self._encode([c.text for c in fresh]) if fresh else None  # outside the lock
+        with self._lock:
+            removed = self._drop(stale)
+            # An upsert may have landed while encoding
+            keep = [i for i, c in enumerate(fresh) if c.id not in self._slot_of]
+            if keep:
+                self._append([fresh[i] for i in keep], vecs[keep])
+            return self._commit(len(keep), removed, started)
+
+
+class KBWatcher:
+    """Polls the KB source files and syncs the live KB when one of them changes.
+
+    Polling a handful of mtimes is cheap and needs no extra dependency; a source
+    that fails to parse mid-edit is retried on the next change.
+    """
+
+    def __init__(self, live: LiveKB, sources: list[str] | None = None,
+                 interval: float = KB_WATCH_INTERVAL):
+        self.live = live
+        self.sources = sources if sources is not None else kb_sources()
+        self.interval = interval
+        self._seen = self._snapshot()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _snapshot(self) -> dict:
+        snap = {}
+        for source in self.sources:
+            try:
+                st = os.stat(source_path(source))
+                snap[source] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                snap[source] = None
+        return snap
+
+    def poll(self) -> dict | None:
+        """Apply a delta if any source changed since the last successful sync."""
+        snap = self._snapshot()
+        if snap == self._seen:
+            return None
+        delta = self.live.sync(list(iter_chunks(self.sources)))
+        self._seen = snap
+        return delta
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                delta = self.poll()
+            except Exception as e:
+                print(f"RAG live: KB reload failed, keeping the current index: {e}")
+                continue
+            if delta is not None:
+                print(f"RAG live: +{delta['added']} −{delta['removed']} chunks "
+                      f"({delta['n_chunks']} total) in {delta['ms']:.1f} ms")
+
+    def start(self) -> "KBWatcher":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="rag-kb-watch", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+if __name__ == "__main__":
+    from dataclasses import replace
+
+    from rag_encoders import ENCODER_BACKEND, load_encoder
+    from rag_index import build_index, make_index
+
+    encoder = load_encoder(os.getenv("RAG_EMBED_MODEL", "all-MiniLM-L6-v2"), ENCODER_BACKEND)
+    chunks = list(iter_chunks())
+
+    t0 = time.perf_counter()
+    vecs = np.asarray(encoder.encode([c.text for c in chunks], batch_size=64,
+                                     normalize_embeddings=True), dtype=np.float32)
+    full_ms = (time.perf_counter() - t0) * 1e3
+    live = LiveKB(chunks, vecs, make_index(vecs.shape[1], vecs), encoder,
+                  build_index)
+
+    edited = chunks[:]
+    edited[0] = replace(chunks[0], id="edited", text=chunks[0].text + " (updated)")
+    delta = live.sync(edited)
+    print(f"full encode: {len(chunks)} chunks in {full_ms:.0f} ms")
+    print(f"one-fact edit: +{delta['added']} −{delta['removed']} in {delta['ms']:.1f} ms")
@@ -0,0 +1,219 @@
+"""
+RAG Generation Backend — Karim Osman Portfolio
+Streams answers from a local OpenAI-compatible completion server (e.g. a
+llama.cpp server) with the retrieved context. Identical concurrent prompts from
+different sessions share one generation (single-flight), and a bounded
+concurrency queue keeps the model from being oversubscribed. Callers fall back
+to the rule-based synthesizer whenever this raises.
+
+    python rag_llm.py --stub --port 8080    # canned local server for development
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LLM_URL = os.getenv("RAG_LLM_URL", "")  # e.g. http://127.0.0.1:8080 — empty disables generation
+LLM_MODEL = os.getenv("RAG_LLM_MODEL", "local")
+LLM_MAX_TOKENS = int(os.getenv("RAG_LLM_MAX_TOKENS", "256"))
+LLM_TEMPERATURE = float(os.getenv("RAG_LLM_TEMPERATURE", "0.2"))
+LLM_TIMEOUT = float(os.getenv("RAG_LLM_TIMEOUT", "30"))
+LLM_MAX_CONCURRENCY = int(os.getenv("RAG_LLM_MAX_CONCURRENCY", "2"))
+LLM_MAX_QUEUE = int(os.getenv("RAG_LLM_MAX_QUEUE", "8"))
+LLM_QUEUE_TIMEOUT = float(os.getenv("RAG_LLM_QUEUE_TIMEOUT", "5"))
+
+SYSTEM_PROMPT = (
+    "You are Karim Osman's portfolio assistant. Answer in at most four sentences, "
+    "using only the facts in the context. If the context does not cover the question, say so."
+)
+
+
+class GenerationUnavailable(RuntimeError):
+    """Raised when the backend is busy, unreachable or returns an error."""
+
+
+def build_messages(query: str, context_docs: list[str]) -> list[dict]:
+    context = "\n".join(f"- {d}" for d in context_docs)
+    return [{"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": f"Context:\n{context}\n\nQuestion: {query}"}]
+
+
+class OpenAICompatGenerator:
+    """Streaming client for POST {base_url}/v1/chat/completions (SSE)."""
+
+    def __init__(self, base_url: str, model: str = LLM_MODEL, max_tokens: int = LLM_MAX_TOKENS,
+                 temperature: float = LLM_TEMPERATURE, timeout: float = LLM_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.model, self.max_tokens = model, max_tokens
+        self.temperature, self.timeout = temperature, timeout
+
+    def payload(self, messages: list[dict]) -> dict:
+        return {"model": self.model, "messages": messages, "stream": True,
+                "max_tokens": self.max_tokens, "temperature": self.temperature}
+
+    def stream(self, messages: list[dict]):
+        req = urllib.request.Request(
+            f"{self.base_url}/v1/chat/completions",
+            data=json.dumps(self.payload(messages)).encode("utf-8"),
+            headers={"Content-Type": "application/json", "Accept": "text/event-stream"},
+        )
+        try:
+            resp = urllib.request.urlopen(req, timeout=self.timeout)
+        except Exception as e:
+            raise GenerationUnavailable(f"LLM backend unreachable: {e}") from e
+        with resp:
+            for raw in resp:
+                line = raw.decode("utf-8").strip()
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    return
+                delta = json.loads(data)["choices"][0].get("delta", {}).get("content")
+                if delta:
+                    yield delta
+        raise GenerationUnavailable("LLM stream ended before [DONE]")
+
+
+class _Flight:
+    """One in-progress generation whose tokens every waiter can replay."""
+
+    def __init__(self):
+        self.tokens: list[str] = []
+        self.done = False
+        self.error: Exception | None = None
+        self.cond = threading.Condition()
+
+    def follow(self):
+        i = 0
+        while True:
+            with self.cond:
+                while i >= len(self.tokens) and not self.done:
+                    self.cond.wait()
+                pending = self.tokens[i:]
+                finished, error = self.done, self.error
+            yield from pending
+            i += len(pending)
+            if finished and i >= len(self.tokens):
+                if error is not None:
+                    raise error  # also after tokens were streamed: a truncated answer is not an answer
+                return
+
+
+class CoalescingGenerator:
+    """Single-flight + bounded concurrency around a streaming generator.
+
+    The first caller for a prompt becomes the leader and runs the backend on its
+    own thread; identical prompts arriving meanwhile follow the same token
+    stream. At most `max_concurrency` generations run at once; up to `max_queue`
+    more wait for a slot, and anything beyond that is rejected immediately.
+    """
+
+    def __init__(self, backend, max_concurrency: int = LLM_MAX_CONCURRENCY,
+                 max_queue: int = LLM_MAX_QUEUE, queue_timeout: float = LLM_QUEUE_TIMEOUT):
+        self.backend = backend
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._capacity = threading.BoundedSemaphore(max_concurrency + max_queue)
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self.stats = {"generations": 0, "coalesced": 0, "rejected": 0}
+
+    @staticmethod
+    def _key(payload: dict) -> str:
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def stream(self, messages: list[dict]):
+        key = self._key(self.backend.payload(messages))
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.stats["coalesced"] += 1
+            else:
+                if not self._capacity.acquire(blocking=False):
+                    self.stats["rejected"] += 1
+                    raise GenerationUnavailable("LLM queue full")
+                flight = self._flights[key] = _Flight()
+                self.stats["generations"] += 1
+                threading.Thread(target=self._lead, args=(key, flight, messages), daemon=True).start()
+        yield from flight.follow()
+
+    def _lead(self, key: str, flight: _Flight, messages: list[dict]):
+        try:
+            if not self._slots.acquire(timeout=self.queue_timeout):
+                raise GenerationUnavailable("LLM busy: timed out waiting for a slot")
+            try:
+                for token in self.backend.stream(messages):
+                    with flight.cond:
+                        flight.tokens.append(token)
+                        flight.cond.notify_all()
+            finally:
+                self._slots.release()
+        except Exception as e:
+            flight.error = e if isinstance(e, GenerationUnavailable) else GenerationUnavailable(str(e))
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            self._capacity.release()
+            with flight.cond:
+                flight.done = True
+                flight.cond.notify_all()
+
+
+def make_generator(base_url: str = LLM_URL) -> CoalescingGenerator | None:
+    """Configured generator, or None when RAG_LLM_URL is unset."""
+    if not base_url:
+        return None
+    return CoalescingGenerator(OpenAICompatGenerator(base_url))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  STUB SERVER — OpenAI-compatible, canned streaming replies, no model needed
+# ─────────────────────────────────────────────────────────────────────────────
+def make_stub_server(host: str = "127.0.0.1", port: int = 0, reply: str | None = None,
+                     token_delay: float = 0.0, fail_after: int | None = None) -> ThreadingHTTPServer:
+    """fail_after=N drops the connection after N tokens, like a backend crashing mid-answer."""
+    import time
+
+    class Handler(BaseHTTPRequestHandler):
+        calls = 0
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            Handler.calls += 1
+            question = body["messages"][-1]["content"].rsplit("Question:", 1)[-1].strip()
+            text = reply or f"Stub answer to: {question}"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for n, word in enumerate(text.split(" ")):
+                if fail_after is not None and n >= fail_after:
+                    return
+                chunk = {"choices": [{"delta": {"content": word + " "}}]}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                time.sleep(token_delay)
+            self.wfile.write(b"data: [DONE]\n\n")
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RAG generation backend utilities")
+    parser.add_argument("--stub", action="store_true", help="serve canned streaming completions")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    if args.stub:
+        server = make_stub_server(args.host, args.port, token_delay=0.02)
+        print(f"Stub LLM server on http://{args.host}:{args.port}")
+        server.serve_forever()
+    else:
+        parser.print_help()
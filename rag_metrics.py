@@ -0,0 +1,226 @@
+"""
+RAG Telemetry — Karim Osman Portfolio
+Per-stage latency (encode, search, rerank, synthesize), intent branches and
+cache hit rates for the resume agent, from real traffic:
+
+    RAG_METRICS_PORT=9464  → Prometheus text format on http://127.0.0.1:9464/metrics
+    RAG_METRICS_FILE=...   → one JSON line per agent turn, size-rotated
+
+Stages are timed with `stage()`; everything recorded while a `track_turn()` is
+open also lands in that turn's structured record.
+"""
+
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+METRICS_PORT = int(os.getenv("RAG_METRICS_PORT", "0"))  # 0 = no endpoint
+METRICS_HOST = os.getenv("RAG_METRICS_HOST", "127.0.0.1")
+METRICS_FILE = os.getenv("RAG_METRICS_FILE", "")        # empty = no file
+METRICS_FILE_MAX_BYTES = int(os.getenv("RAG_METRICS_FILE_MAX_BYTES", str(10 * 2**20)))
+METRICS_FILE_BACKUPS = int(os.getenv("RAG_METRICS_FILE_BACKUPS", "3"))
+
+LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_HELP = {
+    "rag_stage_latency_ms": ("histogram", "Latency of one agent pipeline stage"),
+    "rag_turn_latency_ms": ("histogram", "End-to-end latency of one agent turn"),
+    "rag_turns_total": ("counter", "Agent turns by entry point"),
+    "rag_intent_total": ("counter", "Answer branch taken by simple_rag_answer"),
+    "rag_answer_path_total": ("counter", "How answers were produced: cache, llm or rule"),
+    "rag_cache_requests_total": ("counter", "Cache lookups by cache and result"),
+    "rag_rerank_total": ("counter", "Rerank stage outcomes"),
+}
+
+
+class Registry:
+    """Thread-safe counters and fixed-bucket histograms, rendered as Prometheus text."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self._counters: dict[tuple, float] = {}
+        self._histograms: dict[tuple, list] = {}  # key → [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> tuple:
+        return (name, tuple(sorted(labels.items())))
+
+    def inc(self, name: str, value: float = 1.0, **labels) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            h = self._histograms.get(key)
+            if h is None:
+                h = self._histograms[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    h[i] += 1
+            h[-2] += value
+            h[-1] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"counters": dict(self._counters),
+                    "histograms": {k: list(v) for k, v in self._histograms.items()}}
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        snap = self.snapshot()
+
+        def fmt(labels, extra=()):
+            pairs = [*labels, *extra]
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{k}="{str(v)}"' for k, v in pairs) + "}"
+
+        lines, seen = [], set()
+
+        def header(name):
+            if name not in seen:
+                seen.add(name)
+                kind, text = _HELP.get(name, ("untyped", name))
+                lines.extend([f"# HELP {name} {text}", f"# TYPE {name} {kind}"])
+
+        for (name, labels), value in sorted(snap["counters"].items()):
+            header(name)
+            lines.append(f"{name}{fmt(labels)} {value:g}")
+        for (name, labels), h in sorted(snap["histograms"].items()):
+            header(name)
+            for bound, count in zip(self.buckets, h):
+                lines.append(f"{name}_bucket{fmt(labels, [('le', f'{bound:g}')])} {count}")
+            lines.append(f"{name}_bucket{fmt(labels, [('le', '+Inf')])} {h[-1]}")
+            lines.append(f"{name}_sum{fmt(labels)} {h[-2]:.3f}")
+            lines.append(f"{name}_count{fmt(labels)} {h[-1]}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+_turn: contextvars.ContextVar[dict | None] = contextvars.ContextVar("rag_turn", default=None)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  INSTRUMENTATION
+# ─────────────────────────────────────────────────────────────────────────────
+@contextmanager
+def stage(name: str):
+    """Time one pipeline stage (encode / search / rerank / synthesize)."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - t0) * 1e3
+        REGISTRY.observe("rag_stage_latency_ms", ms, stage=name)
+        turn = _turn.get()
+        if turn is not None:
+            turn["stages_ms"][name] = round(turn["stages_ms"].get(name, 0.0) + ms, 3)
+
+
+def cache_event(cache: str, hit: bool, n: int = 1) -> None:
+    if n <= 0:
+        return
+    REGISTRY.inc("rag_cache_requests_total", n, cache=cache, result="hit" if hit else "miss")
+    turn = _turn.get()
+    if turn is not None:
+        counts = turn["cache"].setdefault(cache, {"hit": 0, "miss": 0})
+        counts["hit" if hit else "miss"] += n
+
+
+def count(name: str, field: str, value: str) -> None:
+    """Increment counter `name` labelled {field: value} and note it on the open turn."""
+    REGISTRY.inc(name, **{field: value})
+    turn = _turn.get()
+    if turn is not None:
+        turn[field] = value
+
+
+@contextmanager
+def track_turn(entry: str, query: str | None = None):
+    """One agent turn; nested turns fold into the outer one."""
+    if _turn.get() is not None:
+        yield _turn.get()
+        return
+    record = {"ts": round(time.time(), 3), "entry": entry, "stages_ms": {}, "cache": {}}
+    if query is not None:
+        record["query_chars"] = len(query)  # not the text itself — visitors' questions stay private
+    token = _turn.set(record)
+    t0 = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record["total_ms"] = round((time.perf_counter() - t0) * 1e3, 3)
+        REGISTRY.observe("rag_turn_latency_ms", record["total_ms"], entry=entry)
+        REGISTRY.inc("rag_turns_total", entry=entry)
+        try:
+            _turn.reset(token)
+        except ValueError:
+            _turn.set(None)  # generator finalized in another context
+        _write(record)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  EXPORT — rotating JSONL file, Prometheus endpoint
+# ─────────────────────────────────────────────────────────────────────────────
+_file_logger = None
+_file_lock = threading.Lock()
+
+
+def _write(record: dict) -> None:
+    global _file_logger
+    if not METRICS_FILE:
+        return
+    with _file_lock:
+        if _file_logger is None:
+            try:
+                handler = logging.handlers.RotatingFileHandler(
+                    METRICS_FILE, maxBytes=METRICS_FILE_MAX_BYTES, backupCount=METRICS_FILE_BACKUPS,
+                    encoding="utf-8")
+            except OSError as e:
+                print(f"RAG metrics: cannot open {METRICS_FILE}: {e}")
+                return
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            _file_logger = logging.getLogger("rag_metrics")
+            _file_logger.propagate = False
+            _file_logger.setLevel(logging.INFO)
+            _file_logger.addHandler(handler)
+    _file_logger.info(json.dumps(record, ensure_ascii=False))
+
+
+def start_metrics_server(port: int = METRICS_PORT, host: str = METRICS_HOST,
+                         registry: Registry = REGISTRY) -> ThreadingHTTPServer | None:
+    """Serve GET /metrics on a daemon thread; None if disabled or the port is taken."""
+    if not port:
+        return None
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    try:
+        server = ThreadingHTTPServer((host, port), Handler)
+    except OSError as e:
+        print(f"RAG metrics: endpoint disabled, cannot bind {host}:{port}: {e}")
+        return None
+    threading.Thread(target=server.serve_forever, name="rag-metrics", daemon=True).start()
+    return server
@@ -0,0 +1,77 @@
+"""
+RAG Context Packer — Karim Osman Portfolio
+Fills a prompt token budget with the highest-value retrieved chunks: near
+duplicates are dropped and MMR (maximal marginal relevance) trades relevance
+against redundancy, so generation prompts stay as small as possible.
+"""
+
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from rag_sparse import tokenize
+
+_WORDPIECE_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def make_token_counter(tokenizer=None):
+    """Token counter backed by the encoder's own (fast, local) tokenizer when available.
+
+    Without one, falls back to a word/punctuation count scaled for sub-word
+    splits — close enough for budgeting.
+    """
+    if tokenizer is not None:
+        def count(text: str) -> int:
+            return len(tokenizer.encode(text, add_special_tokens=False))
+    else:
+        def count(text: str) -> int:
+            return int(len(_WORDPIECE_RE.findall(text)) * 1.3) + 1
+    return lru_cache(maxsize=4096)(count)
+
+
+def _jaccard_matrix(docs: list[str]) -> np.ndarray:
+    sets = [set(tokenize(d)) for d in docs]
+    n = len(sets)
+    sim = np.eye(n, dtype=np.float32)
+    for i in range(n):
+        for j in range(i + 1, n):
+            union = len(sets[i] | sets[j])
+            sim[i, j] = sim[j, i] = len(sets[i] & sets[j]) / union if union else 0.0
+    return sim
+
+
+def pack_context(docs: list[str], relevance: list[float], budget_tokens: int, count_tokens,
+                 doc_vecs: np.ndarray | None = None, mmr_lambda: float = 0.7,
+                 dedup_threshold: float = 0.95) -> list[str]:
+    """Greedy MMR selection of `docs` under a token budget.
+
+    relevance: one score per doc (higher is better, any scale).
+    doc_vecs:  L2-normalized embeddings for redundancy; token Jaccard if None.
+    Chunks too long for the remaining budget are skipped, not truncated.
+    """
+    n = len(docs)
+    if n == 0 or budget_tokens <= 0:
+        return []
+
+    rel = np.asarray(relevance, dtype=np.float32)
+    span = float(rel.max() - rel.min())
+    rel = (rel - rel.min()) / span if span > 0 else np.ones(n, dtype=np.float32)
+    sim = (np.asarray(doc_vecs, dtype=np.float32) @ np.asarray(doc_vecs, dtype=np.float32).T
+           if doc_vecs is not None else _jaccard_matrix(docs))
+    cost = np.array([count_tokens(d) for d in docs])
+
+    selected: list[int] = []
+    remaining = budget_tokens
+    open_ = np.ones(n, dtype=bool)
+    while open_.any():
+        redundancy = sim[:, selected].max(axis=1) if selected else np.zeros(n, dtype=np.float32)
+        score = mmr_lambda * rel - (1.0 - mmr_lambda) * redundancy
+        score[~open_] = -np.inf
+        best = int(np.argmax(score))
+        open_[best] = False
+        if redundancy[best] >= dedup_threshold or cost[best] > remaining:
+            continue
+        selected.append(best)
+        remaining -= cost[best]
+    return [docs[i] for i in selected]
@@ -0,0 +1,127 @@
+"""
+RAG Reranker — Karim Osman Portfolio
+Optional cross-encoder stage after hybrid retrieval: a wider candidate set is
+rescored jointly with the query by a small CPU cross-encoder, which orders
+specific questions far better than bi-encoder similarity.
+
+Reranking runs under a strict latency budget. Scores are cached per
+(query, chunk), and the stage is skipped — the fused order is kept — whenever
+the uncached pairs are not expected to fit in the time left.
+
+    python rag_reranker.py      # cold vs cached latency and order changes on the KB
+"""
+
+import os
+import threading
+import time
+
+from rag_cache import PairScoreCache
+from rag_ingest import chunk_id
+from rag_metrics import REGISTRY, cache_event
+
+RERANK_MODEL = os.getenv("RAG_RERANK_MODEL", "")  # e.g. cross-encoder/ms-marco-MiniLM-L-6-v2
+RERANK_CANDIDATES = int(os.getenv("RAG_RERANK_CANDIDATES", "20"))
+RERANK_BUDGET_MS = float(os.getenv("RAG_RERANK_BUDGET_MS", "150"))
+RERANK_BATCH = int(os.getenv("RAG_RERANK_BATCH", "8"))
+RERANK_CACHE_SIZE = int(os.getenv("RAG_RERANK_CACHE_SIZE", "4096"))
+
+
+class Reranker:
+    """Budgeted cross-encoder rescoring of (id, score) candidate lists.
+
+    `model.predict(pairs)` must return one relevance score per (query, text)
+    pair (sentence_transformers.CrossEncoder does). Per-pair cost is tracked
+    as a moving average so over-budget work is refused before it starts.
+    """
+
+    def __init__(self, model, budget_ms: float = RERANK_BUDGET_MS, batch_size: int = RERANK_BATCH,
+                 cache: PairScoreCache | None = None):
+        self.model = model
+        self.budget_ms, self.batch_size = budget_ms, batch_size
+        self.cache = cache if cache is not None else PairScoreCache(RERANK_CACHE_SIZE)
+        self.pair_ms: float | None = None
+        self._lock = threading.Lock()
+        self._stats = {"reranked": 0, "skipped": 0, "timed_out": 0}
+
+    def _predict(self, query: str, texts: list[str]) -> list[float]:
+        t0 = time.perf_counter()
+        scores = [float(s) for s in self.model.predict([(query, t) for t in texts],
+                                                       batch_size=len(texts), show_progress_bar=False)]
+        per_pair = (time.perf_counter() - t0) * 1e3 / max(len(texts), 1)
+        with self._lock:
+            self.pair_ms = per_pair if self.pair_ms is None else 0.8 * self.pair_ms + 0.2 * per_pair
+        return scores
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self._stats[outcome] += 1
+        REGISTRY.inc("rag_rerank_total", outcome=outcome)
+
+    def rerank(self, query: str, hits: list[tuple[int, float]], docs: list[str],
+               budget_ms: float | None = None) -> list[tuple[int, float]]:
+        """`hits` reordered by cross-encoder score, or unchanged if over budget."""
+        if len(hits) < 2:
+            return hits
+        deadline = time.perf_counter() + (self.budget_ms if budget_ms is None else budget_ms) / 1e3
+        keys = [chunk_id(docs[i]) for i, _ in hits]
+        scores = self.cache.get_many(query, keys)
+        missing = [j for j, s in enumerate(scores) if s is None]
+        cache_event("rerank_pair", True, len(hits) - len(missing))
+        cache_event("rerank_pair", False, len(missing))
+
+        if missing and self.pair_ms is not None:
+            if self.pair_ms * len(missing) > (deadline - time.perf_counter()) * 1e3:
+                self._count("skipped")
+                return hits
+        for start in range(0, len(missing), self.batch_size):
+            if time.perf_counter() > deadline:
+                self._count("timed_out")  # scores so far stay cached for the next asker
+                return hits
+            batch = missing[start:start + self.batch_size]
+            fresh = self._predict(query, [docs[hits[j][0]] for j in batch])
+            self.cache.put_many(query, [keys[j] for j in batch], fresh)
+            for j, score in zip(batch, fresh):
+                scores[j] = score
+
+        self._count("reranked")
+        order = sorted(range(len(hits)), key=lambda j: (-scores[j], j))
+        return [(hits[j][0], scores[j]) for j in order]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "pair_ms": self.pair_ms, "cache": self.cache.stats()}
+
+
+def load_reranker(model_name: str = RERANK_MODEL) -> Reranker | None:
+    """Configured reranker (warmed up once so its per-pair cost is known), or None."""
+    if not model_name:
+        return None
+    from sentence_transformers import CrossEncoder
+
+    reranker = Reranker(CrossEncoder(model_name, max_length=256, device="cpu"))
+    reranker._predict("warm up", ["Karim Osman is a Senior AI Engineer."] * reranker.batch_size)
+    return reranker
+
+
+if __name__ == "__main__":
+    from rag_ingest import iter_chunks
+    from rag_sparse import BM25Index
+
+    docs = [c.text for c in iter_chunks()]
+    bm25 = BM25Index(docs)
+    reranker = load_reranker(RERANK_MODEL or "cross-encoder/ms-marco-MiniLM-L-6-v2")
+    reranker.budget_ms = 10_000  # measure, don't skip
+    for query in ["What was the uptime of the Baker Hughes RAG platform?",
+                  "Which techniques did Karim use to fine-tune LLMs?",
+                  "Where did Karim study machine learning?"]:
+        hits = bm25.search(query, RERANK_CANDIDATES)
+        t0 = time.perf_counter()
+        ranked = reranker.rerank(query, hits, docs)
+        cold = (time.perf_counter() - t0) * 1e3
+        t0 = time.perf_counter()
+        reranker.rerank(query, hits, docs)
+        warm = (time.perf_counter() - t0) * 1e3
+        moved = sum(a != b for (a, _), (b, _) in zip(hits[:4], ranked[:4]))
+        print(f"{query}\n  {len(hits)} pairs · cold {cold:.0f} ms · cached {warm:.2f} ms · "
+              f"{moved}/4 top slots changed\n  → {docs[ranked[0][0]][:90]}")
+    print(reranker.stats())
@@ -0,0 +1,60 @@
+"""
+RAG Intent Router — Karim Osman Portfolio
+Compiles every intent keyword into a single alternation regex, finds all hits
+in one pass over the question, and picks the best-scoring intent.
+Rules live in rag_intents.json, not in code.
+"""
+
+import json
+import os
+import re
+from collections import defaultdict
+
+INTENTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rag_intents.json")
+
+
+class IntentRouter:
+    """One-pass keyword router.
+
+    Keywords match at a word start and act as stems ("certif" hits
+    "certification"). Alternatives are ordered longest first, so a phrase like
+    "language model" is consumed before the bare "language" can match.
+    An intent scores one point per distinct keyword hit; ties go to the intent
+    listed first in the rules file.
+    """
+
+    def __init__(self, intents: list[dict]):
+        self.intents = {it["name"]: it for it in intents}
+        self._priority = {it["name"]: i for i, it in enumerate(intents)}
+        self._owners: dict[str, list[str]] = defaultdict(list)
+        for it in intents:
+            for kw in it["keywords"]:
+                self._owners[kw.casefold()].append(it["name"])
+
+        alternation = "|".join(re.escape(kw) for kw in sorted(self._owners, key=len, reverse=True))
+        self._pattern = re.compile(rf"(?<!\w)(?:{alternation})") if self._owners else None
+
+    @classmethod
+    def from_file(cls, path: str = INTENTS_PATH) -> "IntentRouter":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f)["intents"])
+
+    def scores(self, query: str) -> dict[str, float]:
+        if self._pattern is None:
+            return {}
+        hits = {m.group(0) for m in self._pattern.finditer(query.casefold())}
+        scores: dict[str, float] = defaultdict(float)
+        for kw in hits:
+            for name in self._owners[kw]:
+                scores[name] += 1.0
+        return dict(scores)
+
+    def route(self, query: str) -> str | None:
+        """Name of the best intent, or None when no keyword matches."""
+        scores = self.scores(query)
+        if not scores:
+            return None
+        return min(scores, key=lambda name: (-scores[name], self._priority[name]))
+
+    def answer(self, name: str) -> str:
+        return self.intents[name]["answer"]
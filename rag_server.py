@@ -0,0 +1,201 @@
+"""
+RAG Embedding Server — Karim Osman Portfolio
+One encoder + vector index per machine, shared by every Streamlit worker over
+localhost HTTP. Concurrent requests are micro-batched into single encode /
+search calls.
+
+    python rag_server.py --port 8765
+    RAG_EMBED_SERVER=http://127.0.0.1:8765 streamlit run app.py
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+import urllib.request
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from queue import Empty, Queue
+
+import numpy as np
+
+DEFAULT_PORT = int(os.getenv("RAG_EMBED_SERVER_PORT", "8765"))
+MAX_BATCH = int(os.getenv("RAG_EMBED_SERVER_MAX_BATCH", "64"))
+MAX_WAIT_MS = float(os.getenv("RAG_EMBED_SERVER_MAX_WAIT_MS", "5"))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  SERVER
+# ─────────────────────────────────────────────────────────────────────────────
+class MicroBatcher:
+    """Collects concurrent requests for up to max_wait_ms and runs them as one batch.
+
+    `fn` receives a list of request payloads and must return one result per payload.
+    """
+
+    def __init__(self, fn, max_batch: int = MAX_BATCH, max_wait_ms: float = MAX_WAIT_MS):
+        self.fn = fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1e3
+        self._queue: Queue = Queue()
+        threading.Thread(target=self._loop, daemon=True).start()
+
+    def submit(self, payload) -> Future:
+        fut = Future()
+        self._queue.put((payload, fut))
+        return fut
+
+    def _loop(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.perf_counter() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except Empty:
+                    break
+
+            payloads = [p for p, _ in batch]
+            try:
+                results = self.fn(payloads)
+                for (_, fut), res in zip(batch, results):
+                    fut.set_result(res)
+            except Exception as e:
+                for _, fut in batch:
+                    fut.set_exception(e)
+
+
+def _make_handler(rag_state: dict):
+    model, index = rag_state["model"], rag_state["index"]
+
+    def encode_batch(payloads: list[list[str]]) -> list[np.ndarray]:
+        flat = [t for texts in payloads for t in texts]
+        vecs = np.asarray(model.encode(flat, batch_size=MAX_BATCH, show_progress_bar=False,
+                                       normalize_embeddings=True), dtype=np.float32)
+        out, start = [], 0
+        for texts in payloads:
+            out.append(vecs[start:start + len(texts)])
+            start += len(texts)
+        return out
+
+    def search_batch(payloads: list[tuple[np.ndarray, int]]) -> list[tuple[np.ndarray, np.ndarray]]:
+        k = max(k for _, k in payloads)
+        D, I = index.search(np.vstack([v for v, _ in payloads]), k)
+        out, start = [], 0
+        for vecs, k_i in payloads:
+            out.append((D[start:start + len(vecs), :k_i], I[start:start + len(vecs), :k_i]))
+            start += len(vecs)
+        return out
+
+    encoder, searcher = MicroBatcher(encode_batch), MicroBatcher(search_batch)
+    info = {"key": rag_state["key"], "dim": int(index.dim),
+            "n_docs": len(rag_state["docs"]), "backend": rag_state.get("backend")}
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, code: int, body: dict):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send(200, {"ok": True, **info})
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            try:
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                if self.path == "/encode":
+                    vecs = encoder.submit(list(body["texts"])).result()
+                    self._send(200, {"embeddings": vecs.tolist()})
+                elif self.path == "/search":
+                    vecs = np.asarray(body["vectors"], dtype=np.float32).reshape(-1, info["dim"])
+                    D, I = searcher.submit((vecs, int(body["k"]))).result()
+                    self._send(200, {"D": D.tolist(), "I": I.tolist()})
+                else:
+                    self._send(404, {"error": "not found"})
+            except Exception as e:
+                self._send(500, {"error": str(e)})
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def serve(host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+    from rag_agent import load_rag_state
+
+    rag_state = load_rag_state()
+    if not rag_state.get("ok"):
+        raise SystemExit(f"RAG embedding server: index build failed: {rag_state.get('error')}")
+    server = ThreadingHTTPServer((host, port), _make_handler(rag_state))
+    print(f"RAG embedding server on http://{host}:{port} · {len(rag_state['docs'])} docs "
+          f"· key {rag_state['key']}")
+    server.serve_forever()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  CLIENT — duck-types the local model / index used by rag_agent
+# ─────────────────────────────────────────────────────────────────────────────
+def _post(url: str, body: dict, timeout: float) -> dict:
+    req = urllib.request.Request(url, data=json.dumps(body).encode("utf-8"),
+                                 headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read())
+
+
+class RemoteEncoder:
+    """Stands in for SentenceTransformer.encode (always L2-normalized)."""
+
+    def __init__(self, url: str, timeout: float = 10.0):
+        self.url, self.timeout = url.rstrip("/"), timeout
+
+    def encode(self, texts, **_kwargs) -> np.ndarray:
+        resp = _post(f"{self.url}/encode", {"texts": list(texts)}, self.timeout)
+        return np.asarray(resp["embeddings"], dtype=np.float32)
+
+
+class RemoteIndex:
+    """Stands in for a VectorIndex; search runs on the shared server."""
+
+    backend = "remote"
+
+    def __init__(self, url: str, dim: int, ntotal: int, timeout: float = 10.0):
+        self.url, self.dim, self.ntotal, self.timeout = url.rstrip("/"), dim, ntotal, timeout
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        resp = _post(f"{self.url}/search", {"vectors": np.asarray(queries).tolist(), "k": k}, self.timeout)
+        return (np.asarray(resp["D"], dtype=np.float32).reshape(-1, k),
+                np.asarray(resp["I"], dtype=np.int64).reshape(-1, k))
+
+
+def connect_remote_state(url: str, expected_key: str, timeout: float = 2.0) -> dict | None:
+    """Remote model/index pair, or None if the server is down or serves another KB."""
+    try:
+        with urllib.request.urlopen(f"{url.rstrip('/')}/health", timeout=timeout) as resp:
+            info = json.loads(resp.read())
+    except Exception as e:
+        print(f"RAG embedding server unreachable at {url}: {e}")
+        return None
+    if info.get("key") != expected_key:
+        print(f"RAG embedding server at {url} serves KB {info.get('key')}, expected {expected_key}")
+        return None
+    return {"model": RemoteEncoder(url), "index": RemoteIndex(url, info["dim"], info["n_docs"]),
+            "key": info["key"], "backend": "remote", "ok": True}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Shared RAG embedding/retrieval server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+    serve(args.host, args.port)
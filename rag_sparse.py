@@ -0,0 +1,96 @@
+"""
+RAG Sparse Retrieval — Karim Osman Portfolio
+BM25 inverted index over the knowledge base plus reciprocal-rank fusion (RRF)
+with the dense ranking, so exact terms like "QLoRA" or "99.9" are never missed.
+"""
+
+import re
+from collections import Counter, defaultdict
+
+import numpy as np
+
+from rag_cache import normalize_query
+
+_TOKEN_RE = re.compile(r"\d+(?:\.\d+)?|[^\W_]+")
+STOPWORDS = frozenset(
+    "a an and are at be by did do does for from has have he him his how i in is it its "
+    "me of on or s tell the to was what when where which who why with you your".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Normalized word/number tokens; decimals like 99.9 stay whole."""
+    return [t for t in _TOKEN_RE.findall(normalize_query(text)) if t not in STOPWORDS]
+
+
+class BM25Index:
+    """Okapi BM25 with per-posting weights precomputed at build time.
+
+    A query only touches the postings of its own terms, so scoring is a handful
+    of vectorized adds into one accumulator — well under a millisecond here.
+    """
+
+    def __init__(self, docs: list[str], k1: float = 1.5, b: float = 0.75,
+                 tokenized: list[list[str]] | None = None):
+        """`tokenized` (one token list per doc) skips re-tokenizing on a rebuild."""
+        self.k1, self.b = k1, b
+        self.n_docs = len(docs)
+        if tokenized is None:
+            tokenized = [tokenize(d) for d in docs]
+        lengths = np.array([len(t) for t in tokenized], dtype=np.float32)
+        avgdl = float(lengths.mean()) if self.n_docs else 0.0
+
+        # One flat (term, doc, tf) table → per-term weights in a few vectorized passes
+        vocab: dict[str, int] = {}
+        terms, doc_ids, freqs = [], [], []
+        for doc_id, tokens in enumerate(tokenized):
+            for term, tf in Counter(tokens).items():
+                terms.append(vocab.setdefault(term, len(vocab)))
+                doc_ids.append(doc_id)
+                freqs.append(tf)
+        order = np.argsort(np.array(terms, dtype=np.int64), kind="stable")
+        term_ids = np.array(terms, dtype=np.int64)[order]
+        ids = np.array(doc_ids, dtype=np.int64)[order]
+        tf = np.array(freqs, dtype=np.float32)[order]
+
+        df = np.bincount(term_ids, minlength=len(vocab)).astype(np.float32)
+        idf = np.log1p((self.n_docs - df + 0.5) / (df + 0.5))
+        norm = k1 * (1.0 - b + b * lengths[ids] / (avgdl or 1.0))
+        weights = (idf[term_ids] * tf * (k1 + 1.0) / (tf + norm)).astype(np.float32)
+
+        bounds = np.cumsum(df.astype(np.int64))[:-1]
+        self.postings: dict[str, tuple[np.ndarray, np.ndarray]] = dict(
+            zip(vocab, zip(np.split(ids, bounds), np.split(weights, bounds))))
+
+    def scores(self, query: str) -> np.ndarray:
+        acc = np.zeros(self.n_docs, dtype=np.float32)
+        for term in set(tokenize(query)):
+            hit = self.postings.get(term)
+            if hit is not None:
+                acc[hit[0]] += hit[1]
+        return acc
+
+    def search(self, query: str, k: int) -> list[tuple[int, float]]:
+        """Top-k (doc_id, score) pairs with a positive score."""
+        acc = self.scores(query)
+        nz = np.flatnonzero(acc)
+        if nz.size == 0:
+            return []
+        if nz.size > k:
+            nz = nz[np.argpartition(-acc[nz], k - 1)[:k]]
+        order = np.lexsort((nz, -acc[nz]))
+        return [(int(nz[i]), float(acc[nz[i]])) for i in order]
+
+
+def rrf_fuse(rankings: list[list[int]], k: int = 60, return_scores: bool = False):
+    """Reciprocal-rank fusion: score(d) = Σ 1 / (k + rank_d) over all rankings.
+
+    Returns fused doc ids best first, or (doc_id, score) pairs if return_scores.
+    """
+    fused = defaultdict(float)
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking):
+            if doc_id >= 0:
+                fused[doc_id] += 1.0 / (k + rank + 1)
+    order = sorted(fused, key=lambda d: (-fused[d], d))
+    return [(d, fused[d]) for d in order] if return_scores else order
@@ -0,0 +1,171 @@
+"""
+RAG Artifact Store — Karim Osman Portfolio
+Persists the KB embedding matrix (.npy, memory-mappable) and the serialized
+FAISS index (or NumPy IVF centroids) on disk, keyed by a content hash of the
+KB text and encoder name.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_STORE_DIR = os.getenv(
+    "RAG_STORE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".rag_store"),
+)
+
+EMBEDDINGS_FILE = "embeddings.npy"
+INDEX_FILE = "index.faiss"
+META_FILE = "meta.json"
+CENTROIDS_FILE = "ivf_centroids.npy"
+
+
+def kb_fingerprint(docs: list[str], model_name: str) -> str:
+    """Stable hash of the KB text and encoder name — changes only when either does."""
+    h = hashlib.sha256()
+    h.update(model_name.encode("utf-8"))
+    for doc in docs:
+        h.update(b"\x00")
+        h.update(doc.encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def artifact_dir(key: str, store_dir: str | None = None) -> Path:
+    """Directory holding the artifacts for one fingerprint."""
+    return Path(store_dir or DEFAULT_STORE_DIR) / key
+
+
+def load_artifacts(key: str, store_dir: str | None = None, mmap: bool = True) -> dict | None:
+    """Load persisted embeddings (+ FAISS index / IVF centroids if present). None on a miss."""
+    path = artifact_dir(key, store_dir)
+    emb_path = path / EMBEDDINGS_FILE
+    if not emb_path.exists():
+        return None
+    try:
+        embeddings = np.load(emb_path, mmap_mode="r" if mmap else None)
+        meta = {}
+        if (path / META_FILE).exists():
+            meta = json.loads((path / META_FILE).read_text(encoding="utf-8"))
+
+        index = None
+        if (path / INDEX_FILE).exists():
+            try:
+                import faiss
+                index = faiss.read_index(str(path / INDEX_FILE))
+            except ImportError:
+                index = None
+        centroids = np.load(path / CENTROIDS_FILE) if (path / CENTROIDS_FILE).exists() else None
+
+        return {"embeddings": embeddings, "index": index, "centroids": centroids, "meta": meta}
+    except Exception as e:
+        print(f"RAG store: could not load artifacts {key}: {e}")
+        return None
+
+
+class ArtifactWriter:
+    """Streams an embedding matrix into a staging dir batch by batch, then publishes it.
+
+    The .npy is written through a memory map, so only the current batch of
+    vectors is ever held in RAM; commit() renames the directory into place.
+    """
+
+    def __init__(self, key: str, n_rows: int, dim: int, store_dir: str | None = None,
+                 dtype=np.float32):
+        self.key = key
+        self.final = artifact_dir(key, store_dir)
+        self.tmp = self.final.with_name(f"{key}.tmp-{os.getpid()}-{threading.get_ident()}")
+        self.tmp.mkdir(parents=True, exist_ok=True)
+        self.embeddings = np.lib.format.open_memmap(
+            self.tmp / EMBEDDINGS_FILE, mode="w+", dtype=dtype, shape=(n_rows, dim))
+
+    def write(self, start: int, vectors: np.ndarray) -> None:
+        self.embeddings[start:start + len(vectors)] = vectors
+
+    def commit(self, index=None, meta: dict | None = None) -> bool:
+        try:
+            self.embeddings.flush()
+            shape = list(self.embeddings.shape)
+            del self.embeddings
+
+            if index is not None:
+                import faiss
+                faiss.write_index(index, str(self.tmp / INDEX_FILE))
+
+            meta = dict(meta or {})
+            meta.update({"key": self.key, "shape": shape, "created": time.time()})
+            (self.tmp / META_FILE).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+            try:
+                os.replace(self.tmp, self.final)
+            except OSError:
+                # Another replica won the race and already published this key
+                shutil.rmtree(self.tmp, ignore_errors=True)
+            return True
+        except Exception as e:
+            print(f"RAG store: could not save artifacts {self.key}: {e}")
+            self.abort()
+            return False
+
+    def abort(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+
+def save_artifacts(key: str, embeddings: np.ndarray, index=None,
+                   meta: dict | None = None, store_dir: str | None = None) -> bool:
+    """Persist artifacts atomically (write to a temp dir, then rename into place)."""
+    if (artifact_dir(key, store_dir) / EMBEDDINGS_FILE).exists():
+        return True
+    try:
+        writer = ArtifactWriter(key, embeddings.shape[0], embeddings.shape[1], store_dir)
+    except Exception as e:
+        print(f"RAG store: could not save artifacts {key}: {e}")
+        return False
+    writer.write(0, np.asarray(embeddings, dtype=np.float32))
+    return writer.commit(index, meta)
+
+
+def _replace_file(final: Path, write) -> None:
+    tmp = final.with_name(f"{final.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+    try:
+        write(tmp)
+        os.replace(tmp, final)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def save_index(key: str, index, ann: dict, store_dir: str | None = None) -> bool:
+    """Attach a trained ANN index to published artifacts (each file replaced atomically).
+
+    `index` is a VectorIndex; FAISS indexes are serialized whole, NumPy IVF
+    keeps only its centroids (lists are re-assigned from the embeddings on load).
+    `ann` (kind, search params, measured recall) is recorded in meta.json.
+    """
+    path = artifact_dir(key, store_dir)
+    try:
+        faiss_index = getattr(index, "faiss_index", None)
+        if faiss_index is not None:
+            import faiss
+            _replace_file(path / INDEX_FILE, lambda tmp: faiss.write_index(faiss_index, str(tmp)))
+        centroids = getattr(index, "centroids", None)
+        if centroids is not None:
+            def write_centroids(tmp: Path):
+                with open(tmp, "wb") as f:
+                    np.save(f, centroids)
+            _replace_file(path / CENTROIDS_FILE, write_centroids)
+
+        meta = {}
+        if (path / META_FILE).exists():
+            meta = json.loads((path / META_FILE).read_text(encoding="utf-8"))
+        meta["ann"] = ann
+        _replace_file(path / META_FILE,
+                      lambda tmp: tmp.write_text(json.dumps(meta, indent=2), encoding="utf-8"))
+        return True
+    except Exception as e:
+        print(f"RAG store: could not save index {key}: {e}")
+        return False
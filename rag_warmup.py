@@ -0,0 +1,64 @@
+"""
+RAG Warm-up — Karim Osman Portfolio
+Builds the RAG index (and any other cached models) on a background thread at
+server start, so no visitor request ever blocks on encoder load.
+"""
+
+import threading
+import time
+
+COLD, WARMING, WARM, FAILED = "cold", "warming", "warm", "failed"
+
+_lock = threading.Lock()
+_state = {"status": COLD, "started": None, "finished": None, "error": None}
+_thread = None
+
+
+def _run(tasks):
+    from rag_agent import build_rag_index, get_reranker
+
+    try:
+        rag_state = build_rag_index()
+        get_reranker()
+        for fn in tasks:
+            fn()
+        ok = rag_state.get("ok", False)
+        error = None if ok else rag_state.get("error")
+    except Exception as e:
+        ok, error = False, str(e)
+
+    with _lock:
+        _state["status"] = WARM if ok else FAILED
+        _state["error"] = error
+        _state["finished"] = time.time()
+
+
+def start_warmup(extra=()) -> None:
+    """Start the warm-up thread once per process. Safe to call on every rerun."""
+    global _thread
+    with _lock:
+        if _thread is not None:
+            return
+        _state["status"] = WARMING
+        _state["started"] = time.time()
+        _thread = threading.Thread(target=_run, args=(tuple(extra),),
+                                   name="rag-warmup", daemon=True)
+        _thread.start()
+
+
+def warmup_status() -> dict:
+    """Snapshot of the warm-up state: status, started, finished, error."""
+    with _lock:
+        return dict(_state)
+
+
+def is_warm() -> bool:
+    with _lock:
+        return _state["status"] == WARM
+
+
+if __name__ == "__main__":
+    # Pre-build the persisted index artifacts, e.g. during an image build
+    start_warmup()
+    _thread.join()
+    print(warmup_status())
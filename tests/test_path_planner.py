@@ -0,0 +1,113 @@
+import heapq
+import math
+
+import numpy as np
+import pytest
+
+from path_planner import astar, jps, plan
+
+STRAIGHT = ((0, 1), (0, -1), (1, 0), (-1, 0))
+DIAGONAL = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def _free(grid, weights, r, c):
+    h, w = grid.shape
+    return 0 <= r < h and 0 <= c < w and grid[r, c] == 0 and (weights is None or np.isfinite(weights[r, c]))
+
+
+def _moves(grid, weights, r, c, diagonal):
+    for dr, dc in STRAIGHT:
+        if _free(grid, weights, r + dr, c + dc):
+            yield r + dr, c + dc, 1.0
+    if diagonal:
+        for dr, dc in DIAGONAL:
+            if (_free(grid, weights, r + dr, c + dc) and _free(grid, weights, r + dr, c)
+                    and _free(grid, weights, r, c + dc)):
+                yield r + dr, c + dc, math.sqrt(2.0)
+
+
+def _dijkstra(grid, start, goal, weights=None, diagonal=True) -> float:
+    """Reference cost: plain Dijkstra over (row, col) tuples, no heuristic, no padding."""
+    if not (_free(grid, weights, *start) and _free(grid, weights, *goal)):
+        return math.inf
+    dist = {start: 0.0}
+    heap = [(0.0, start)]
+    while heap:
+        d, cell = heapq.heappop(heap)
+        if cell == goal:
+            return d
+        if d > dist[cell]:
+            continue
+        for r, c, step in _moves(grid, weights, *cell, diagonal):
+            nd = d + step * (1.0 if weights is None else weights[r, c])
+            if nd < dist.get((r, c), math.inf):
+                dist[(r, c)] = nd
+                heapq.heappush(heap, (nd, (r, c)))
+    return math.inf
+
+
+def _path_cost(grid, path, weights=None, diagonal=True) -> float:
+    """Cost of a returned path, checking every step is a legal move."""
+    total = 0.0
+    for (r0, c0), (r1, c1) in zip(path[:-1], path[1:]):
+        legal = {(r, c): step for r, c, step in _moves(grid, weights, r0, c0, diagonal)}
+        assert (r1, c1) in legal, f"illegal step {(r0, c0)} -> {(r1, c1)}"
+        total += legal[(r1, c1)] * (1.0 if weights is None else weights[r1, c1])
+    return total
+
+
+def _case(seed):
+    rng = np.random.default_rng(seed)
+    h, w = rng.integers(4, 16, size=2)
+    grid = (rng.random((h, w)) < rng.uniform(0.1, 0.4)).astype(np.uint8)
+    weights = rng.uniform(1.0, 5.0, (h, w))
+    weights[rng.random((h, w)) < 0.05] = np.inf
+    free = np.argwhere(grid == 0)
+    start, goal = (tuple(int(x) for x in free[i]) for i in rng.choice(len(free), 2))
+    return grid, weights, start, goal
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_costs_match_brute_force_dijkstra(seed):
+    grid, weights, start, goal = _case(seed)
+    runs = [(astar(grid, start, goal), None, True),
+            (astar(grid, start, goal, diagonal=False), None, False),
+            (astar(grid, start, goal, weights=weights), weights, True),
+            (astar(grid, start, goal, weights=weights, diagonal=False), weights, False),
+            (jps(grid, start, goal), None, True),
+            (plan(grid, start, goal, weights=weights), weights, True)]
+    for result, wts, diagonal in runs:
+        expected = _dijkstra(grid, start, goal, wts, diagonal)
+        if math.isinf(expected):
+            assert not result.found and math.isinf(result.cost)
+            continue
+        path = [tuple(cell) for cell in result.path.tolist()]
+        assert path[0] == start and path[-1] == goal
+        assert result.cost == pytest.approx(expected)
+        assert _path_cost(grid, path, wts, diagonal) == pytest.approx(expected)
+
+
+def test_diagonal_moves_never_cut_corners():
+    grid = np.array([[0, 1],
+                     [1, 0]], dtype=np.uint8)
+    assert not astar(grid, (0, 0), (1, 1)).found
+    assert not jps(grid, (0, 0), (1, 1)).found
+
+    grid = np.array([[0, 0],
+                     [1, 0]], dtype=np.uint8)
+    for result in (astar(grid, (1, 1), (0, 0)), jps(grid, (1, 1), (0, 0))):
+        assert result.path.tolist() == [[1, 1], [0, 1], [0, 0]]
+        assert result.cost == pytest.approx(2.0)
+
+
+def test_unreachable_goal():
+    grid = np.zeros((7, 7), dtype=np.uint8)
+    grid[2:5, 2:5] = 1
+    grid[3, 3] = 0                          # walled-in goal
+    weights = np.ones((7, 7))
+    weights[:, 5] = np.inf                  # impassable column splits the weighted map
+    for result in (astar(grid, (0, 0), (3, 3)), jps(grid, (0, 0), (3, 3)),
+                   astar(grid, (0, 0), (0, 6), weights=weights),
+                   astar(grid, (0, 0), (2, 2))):   # goal cell itself blocked
+        assert not result.found and math.isinf(result.cost)
+        assert result.path.shape == (0, 2)
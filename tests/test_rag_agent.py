@@ -0,0 +1,44 @@
+import pytest
+
+pytest.importorskip("streamlit")
+
+import rag_agent  # noqa: E402
+
+
+def test_retrieve_context_many_falls_back_to_sparse_when_index_down():
+    queries = ["Which LLM fine-tuning methods does Karim use?", "Computer vision at Baker Hughes"]
+    batch = rag_agent.retrieve_context_many(queries, {"ok": False}, top_k=3)
+
+    assert batch["results"] == [rag_agent.retrieve_context(q, {"ok": False}, top_k=3) for q in queries]
+    assert all(len(r) == 3 for r in batch["results"])
+    assert batch["timings"]["n_queries"] == 2 and batch["timings"]["encode_ms"] == 0.0
+
+
+def test_retrieve_context_many_empty_batch():
+    assert rag_agent.retrieve_context_many([], {"ok": False})["results"] == []
+
+
+def test_encode_queries_encodes_each_normalized_key_once(monkeypatch):
+    import numpy as np
+
+    from rag_cache import QueryEmbeddingCache
+
+    class Model:
+        def __init__(self):
+            self.batches = []
+
+        def encode(self, texts, **kwargs):
+            self.batches.append(list(texts))
+            return np.array([[len(t), 1.0] for t in texts], dtype=np.float32)
+
+    cache, model = QueryEmbeddingCache(), Model()
+    monkeypatch.setattr(rag_agent, "get_query_cache", lambda: cache)
+    queries = ["What is RAG?", "what is rag", "Tell me about LoRA", "  WHAT IS RAG  "]
+    vecs = rag_agent.encode_queries(queries, {"model": model})
+
+    assert model.batches == [["What is RAG?", "Tell me about LoRA"]]
+    assert vecs.shape == (4, 2) and (vecs[0] == vecs[1]).all() and (vecs[0] == vecs[3]).all()
+    assert cache.stats()["misses"] == 2 and cache.stats()["size"] == 2
+
+    rag_agent.encode_queries(["what is RAG"], {"model": model})
+    assert len(model.batches) == 1 and cache.stats()["hits"] == 1
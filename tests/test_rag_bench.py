@@ -0,0 +1,21 @@
+import rag_bench
+
+
+def _report(mrr=0.8, p95=10.0, mode="dense"):
+    return {"meta": {"mode": mode}, "quality": {"mrr": mrr},
+            "latency_ms": {"search": {"p50": p95 / 2, "p95": p95, "p99": p95}}}
+
+
+def test_missing_baseline_exits_2_before_running(tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr(rag_bench, "run_benchmark", lambda *a, **k: 1 / 0)
+    assert rag_bench.main(["--baseline", str(tmp_path / "rag_bench_baseline.json")]) == 2
+    assert "--save-baseline" in capsys.readouterr().out
+
+
+def test_compare_flags_quality_latency_and_mode_regressions():
+    base = _report()
+    assert rag_bench.compare(_report(mrr=0.795, p95=12.0), base) == []   # within tolerances
+    assert rag_bench.compare(_report(p95=10.4), _report(p95=0.1)) != []
+    assert rag_bench.compare(_report(p95=0.5), _report(p95=0.1)) == []   # sub-ms jitter ignored
+    problems = rag_bench.compare(_report(mrr=0.7, p95=20.0, mode="sparse"), base)
+    assert len(problems) == 3 and problems[0].startswith("mode changed")
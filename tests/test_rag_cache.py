@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+import rag_cache
+from rag_cache import QueryEmbeddingCache, SemanticAnswerCache, normalize_query
+
+
+def test_normalize_query_folds_trivial_variants():
+    assert normalize_query("  What is RAG?? ") == normalize_query("what is rag") == "what is rag"
+    assert normalize_query("Ｗhat\tis\nRAG!") == "what is rag"                 # NFKC + whitespace
+    assert normalize_query("Uptime of 99.9% in €?") == "uptime of 99.9% in €"  # decimal point, symbols kept
+    assert normalize_query("C++ and C#.") == "c++ and c#"
+    assert normalize_query("LoRA vs. QLoRA") == "lora vs qlora"
+
+
+def test_query_cache_hits_normalized_variants_and_counts():
+    cache = QueryEmbeddingCache(maxsize=4)
+    assert cache.get("What is RAG?") is None
+    cache.put("What is RAG?", [1.0, 0.0])
+
+    vec = cache.get("  what is rag ")
+    np.testing.assert_array_equal(vec, [1.0, 0.0])
+    assert vec.dtype == np.float32 and not vec.flags.writeable
+    assert cache.get("what is lora") is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 1, "maxsize": 4, "hit_rate": 1 / 3}
+
+    cache.clear()
+    assert cache.stats()["size"] == 0 and cache.hits == cache.misses == 0
+
+
+def test_query_cache_evicts_least_recently_used():
+    cache = QueryEmbeddingCache(maxsize=2)
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+    assert cache.get("a") is not None   # "b" is now the least recently used
+    cache.put("c", [3.0])
+
+    assert cache.get("b") is None
+    assert cache.get("a")[0] == 1.0 and cache.get("c")[0] == 3.0
+    cache.put("A", [4.0])               # same key as "a": replaced, nothing evicted
+    assert cache.stats()["size"] == 2 and cache.get("a")[0] == 4.0
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rag_cache, "time", clock)
+    return clock
+
+
+def _at(cos):
+    """Unit vector at cosine `cos` from e0."""
+    return np.array([cos, np.sqrt(1 - cos ** 2), 0.0], dtype=np.float32)
+
+
+def test_answer_cache_serves_paraphrases_above_threshold(clock):
+    cache = SemanticAnswerCache(dim=3, maxsize=4, threshold=0.9)
+    assert cache.get(_at(1.0)) is None                     # empty cache never matches
+    cache.put(_at(1.0), "RAG answer")
+
+    assert cache.get(_at(0.95)) == "RAG answer"
+    assert cache.get(_at(0.85)) is None
+    assert cache.get(-_at(1.0)) is None
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert cache.stats()["size"] == 1 and cache.stats()["hit_rate"] == 0.25
+
+
+def test_answer_cache_entries_expire_after_ttl(clock):
+    cache = SemanticAnswerCache(dim=3, maxsize=4, threshold=0.9, ttl=60.0)
+    cache.put(_at(1.0), "fresh")
+
+    clock.now += 59.0
+    assert cache.get(_at(1.0)) == "fresh"                  # a hit does not extend the TTL
+    clock.now += 1.0
+    assert cache.get(_at(1.0)) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_answer_cache_reuses_expired_slots_then_evicts_lru(clock):
+    e = np.eye(3, dtype=np.float32)
+    cache = SemanticAnswerCache(dim=3, maxsize=2, threshold=0.9, ttl=100.0)
+    cache.put(e[0], "a")
+    clock.now += 1
+    cache.put(e[1], "b")
+    clock.now += 1
+    assert cache.get(e[0]) == "a"                          # "b" is now least recently used
+    clock.now += 1
+    cache.put(e[2], "c")
+    assert cache.get(e[1]) is None
+    assert cache.get(e[2]) == "c"
+    clock.now += 1
+    assert cache.get(e[0]) == "a"                          # "c" is now least recently used
+
+    clock.now += 97                                        # "a" expires, "c" is still live
+    assert cache.get(e[0]) is None
+    cache.put(e[1], "b2")                                  # takes the expired slot, not the LRU one
+    assert cache.get(e[2]) == "c" and cache.get(e[1]) == "b2"
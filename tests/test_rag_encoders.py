@@ -0,0 +1,53 @@
+import os
+
+import numpy as np
+import pytest
+
+from rag_encoders import _publish_dir, load_encoder
+from rag_ingest import _builtin_kb
+
+MODEL = os.getenv("RAG_EMBED_MODEL", "all-MiniLM-L6-v2")
+
+
+def _export(path, marker="model.onnx", text="graph"):
+    os.makedirs(path)
+    with open(os.path.join(path, marker), "w") as f:
+        f.write(text)
+
+
+def test_publish_into_empty_location(tmp_path):
+    tmp, out = str(tmp_path / "m.tmp-1"), str(tmp_path / "m")
+    _export(tmp)
+    _publish_dir(tmp, out, "model.onnx")
+    assert os.listdir(tmp_path) == ["m"] and os.path.exists(os.path.join(out, "model.onnx"))
+
+
+def test_publish_replaces_partial_export(tmp_path):
+    tmp, out = str(tmp_path / "m.tmp-1"), str(tmp_path / "m")
+    os.makedirs(out)
+    open(os.path.join(out, "tokenizer.json"), "w").close()  # old non-atomic export, no graph
+    _export(tmp)
+    _publish_dir(tmp, out, "model.onnx")
+    assert os.listdir(tmp_path) == ["m"] and sorted(os.listdir(out)) == ["model.onnx"]
+
+
+def test_publish_keeps_another_process_export(tmp_path):
+    tmp, out = str(tmp_path / "m.tmp-1"), str(tmp_path / "m")
+    _export(out, text="theirs")
+    _export(tmp, text="ours")
+    _publish_dir(tmp, out, "model.onnx")
+    assert os.listdir(tmp_path) == ["m"]
+    with open(os.path.join(out, "model.onnx")) as f:
+        assert f.read() == "theirs"
+
+
+@pytest.mark.parametrize("backend", ["onnx", "onnx-int8"])
+def test_onnx_matches_pytorch_embeddings(backend):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("sentence_transformers")
+    docs = _builtin_kb()
+    ref = np.asarray(load_encoder(MODEL, "torch").encode(docs, normalize_embeddings=True), dtype=np.float32)
+    got = load_encoder(MODEL, backend).encode(docs, normalize_embeddings=True)
+
+    assert got.shape == ref.shape
+    assert float((got * ref).sum(axis=1).min()) >= 0.99
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from rag_index import NumpyIndex
+
+
+def _unit(rng, n, dim):
+    x = rng.standard_normal((n, dim)).astype(np.float32)
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+def test_topk_order_is_score_descending():
+    rng = np.random.default_rng(0)
+    docs, queries = _unit(rng, 500, 32), _unit(rng, 20, 32)
+    D, I = NumpyIndex(32, docs).search(queries, 10)
+
+    scores = queries @ docs.T
+    for row in range(len(queries)):
+        expected = np.argsort(-scores[row], kind="stable")[:10]
+        np.testing.assert_array_equal(I[row], expected)
+        np.testing.assert_allclose(D[row], scores[row, expected], rtol=1e-6)
+
+
+def test_ties_break_by_ascending_id_including_the_kth_slot():
+    docs = np.array([[0, 1], [1, 0], [1, 0], [0, 1], [1, 0], [1, 0]], dtype=np.float32)
+    D, I = NumpyIndex(2, docs).search(np.array([[1, 0]], dtype=np.float32), 3)
+    assert I.tolist() == [[1, 2, 4]]
+    assert D.tolist() == [[1.0, 1.0, 1.0]]
+
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        n = int(rng.integers(3, 40))
+        k = int(rng.integers(1, n))
+        docs = rng.integers(0, 3, (n, 2)).astype(np.float32)
+        q = np.ones((1, 2), dtype=np.float32)
+        _, I = NumpyIndex(2, docs).search(q, k)
+        expected = np.lexsort((np.arange(n), -(docs @ q[0])))[:k]
+        np.testing.assert_array_equal(I[0], expected)
+
+
+def test_k_larger_than_ntotal_pads_with_minus_one():
+    docs = np.eye(3, 4, dtype=np.float32)
+    D, I = NumpyIndex(4, docs).search(np.array([[1, 0.5, 0, 0]], dtype=np.float32), 5)
+    assert I.tolist() == [[0, 1, 2, -1, -1]]
+    assert D[0, :3].tolist() == [1.0, 0.5, 0.0]
+    assert (D[0, 3:] == -np.finfo(np.float32).max).all()
+
+    D, I = NumpyIndex(4).search(np.ones((2, 4), dtype=np.float32), 3)
+    assert (I == -1).all() and D.shape == (2, 3)
+
+
+def test_matches_faiss_index_flat_ip():
+    faiss = pytest.importorskip("faiss")
+    rng = np.random.default_rng(2)
+    docs, queries = _unit(rng, 2000, 64), _unit(rng, 50, 64)
+    docs[100:110] = docs[5]  # exact duplicates: tie-breaking must agree too
+
+    flat = faiss.IndexFlatIP(64)
+    flat.add(docs)
+    for k in (1, 10, 2005):
+        D_ref, I_ref = flat.search(queries, k)
+        D, I = NumpyIndex(64, docs).search(queries, k)
+        np.testing.assert_array_equal(I, I_ref)
+        np.testing.assert_allclose(D, D_ref, rtol=1e-5, atol=1e-6)
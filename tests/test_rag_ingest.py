@@ -0,0 +1,51 @@
+import rag_ingest
+from rag_ingest import iter_chunks
+
+# Strings in index.py and locales/en/translation.json that are UI chrome, not portfolio facts
+UI_STRINGS = [
+    "Explain the difference between LoRA and QLoRA fine-tuning",          # chat box default
+    "You are an expert AI engineer assistant",                             # system-prompt widget value
+    "Please fill in Name, Email, and Message.",                            # I18N form_error
+    "Full-width image banner with optional caption overlay.",              # img_banner docstring
+    "Fetching latest repositories from GitHub",                            # FETCHING_REPOS_SPINNER
+    "Tell me about your project, opportunity, or how we can collaborate",  # CONTACT_FORM_MESSAGE_PLACEHOLDER
+    "Book a convenient time for a video call",                             # CONTACT_CALENDLY_DESC
+    "Let's Build Something Amazing Together",                              # ABOUT_CALL_TITLE
+]
+
+
+def test_index_py_ui_strings_not_ingested():
+    texts = [c.text for c in iter_chunks()]
+    assert texts
+    for ui in UI_STRINGS:
+        assert not any(ui in t for t in texts), ui
+
+
+def test_translation_json_content_ingested():
+    texts = [c.text for c in iter_chunks(["locales/en/translation.json"])]
+    assert any("RAG as a service" in t for t in texts)                      # IMPACTFUL_PROJECT_RESPONSE
+    assert any("University of Pisa" in t for t in texts)                    # ABOUT_TIMELINE_EVENT2_DESC
+    assert any("Available: 9:00 AM - 6:00 PM CET" in t for t in texts)     # CONTACT_TIMEZONE_AVAILABLE
+
+
+def test_index_py_content_literals_ingested():
+    texts = [c.text for c in iter_chunks(["index.py"])]
+    assert any("Domain-adaptive fine-tuning" in t for t in texts)            # services
+    assert any("Discovery Call" in t for t in texts)                         # steps_map
+    assert any("Production RAG for 500+ global engineers" in t for t in texts)  # featured
+
+
+def test_python_source_only_reads_allowlisted_literals(tmp_path, monkeypatch):
+    src = tmp_path / "page.py"
+    src.write_text(
+        '"""Module docstring that should never be part of the knowledge base."""\n'
+        "CONTENT = {'en': {'bio': 'Karim builds production retrieval systems for global engineering teams.',\n"
+        "                  'form_error': 'Please fill in every required field before sending.'},\n"
+        "           'it': {'bio': 'Karim costruisce sistemi di recupero per team di ingegneria globali.'}}\n"
+        "def page():\n"
+        "    st.text_area('Prompt', value='Explain the difference between two fine-tuning methods today.')\n"
+        "    raise ValueError('Something went wrong while rendering the page, please retry.')\n",
+        encoding="utf-8")
+    monkeypatch.setattr(rag_ingest, "KB_PY_LITERALS", {"CONTENT"})
+    texts = [c.text for c in iter_chunks([str(src)])]
+    assert texts == ["Karim builds production retrieval systems for global engineering teams."]
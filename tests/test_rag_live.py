@@ -0,0 +1,70 @@
+import hashlib
+
+import numpy as np
+import pytest
+
+from rag_index import NumpyIndex
+from rag_ingest import Chunk, chunk_id
+from rag_live import LiveKB
+
+DIM = 16
+
+
+class HashEncoder:
+    """Deterministic unit vectors per text — stands in for the sentence encoder."""
+
+    def encode(self, texts, **kwargs):
+        vecs = np.stack([np.random.default_rng(int(hashlib.sha1(t.encode()).hexdigest()[:8], 16))
+                         .standard_normal(DIM) for t in texts]).astype(np.float32)
+        return vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+
+
+def _chunks(texts):
+    return [Chunk(chunk_id(t), t, "test") for t in texts]
+
+
+def _live(texts):
+    chunks = _chunks(texts)
+    vecs = HashEncoder().encode(texts)
+    return LiveKB(chunks, vecs, NumpyIndex(DIM, vecs), HashEncoder(), lambda rows: NumpyIndex(DIM, rows))
+
+
+def _top1(live, text):
+    _, ids = live.search(HashEncoder().encode([text]), 1)
+    return live.docs[ids[0, 0]]
+
+
+def test_slots_stay_bounded_under_churn():
+    live = _live([f"fact {i}" for i in range(20)])
+    for round_ in range(50):
+        new = _chunks([f"churn {round_} {j}" for j in range(4)])
+        live.upsert(new)
+        live.delete(c.id for c in new)
+
+    assert live.ntotal == 20
+    assert len(live.docs) <= 20 * 2 and len(live._slot_pos) == len(live.docs)
+    assert all(_top1(live, f"fact {i}") == f"fact {i}" for i in range(20))
+    assert "churn 49 0" not in live.docs
+
+
+def test_reused_slots_point_at_the_new_chunk():
+    live = _live([f"fact {i}" for i in range(8)])
+    live.delete(c.id for c in _chunks([f"fact {i}" for i in range(4)]))  # compacts: 4 dead of 8
+    n_slots = len(live.docs)
+    live.upsert(_chunks(["replacement a", "replacement b"]))
+
+    assert len(live.docs) == n_slots
+    assert _top1(live, "replacement a") == "replacement a"
+    assert _top1(live, "fact 6") == "fact 6"
+    assert {live.docs[slot] for slot, _ in live.sparse.search("replacement", 5)} == {
+        "replacement a", "replacement b"}
+
+
+def test_embeddings_reject_deleted_slots():
+    live = _live([f"fact {i}" for i in range(8)])
+    slot = live._slot_of[chunk_id("fact 1")]
+    live.delete([chunk_id("fact 1")])
+
+    with pytest.raises(KeyError):
+        live.embeddings[[0, slot]]
+    np.testing.assert_allclose(live.embeddings[[0]], HashEncoder().encode(["fact 0"]), rtol=1e-6)
@@ -0,0 +1,136 @@
+import socket
+import threading
+import time
+
+import pytest
+
+from rag_llm import (CoalescingGenerator, GenerationUnavailable, OpenAICompatGenerator,
+                     build_messages, make_stub_server)
+
+
+@pytest.fixture
+def stub():
+    """Local OpenAI-compatible stub streaming one word every 20 ms."""
+    server = make_stub_server(token_delay=0.02)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def _closed_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_concurrent_identical_prompts_share_one_generation(stub):
+    gen = CoalescingGenerator(OpenAICompatGenerator(_url(stub)), max_concurrency=2, max_queue=4)
+    messages = build_messages("What does Karim build?", ["Karim builds RAG systems."])
+    n = 5
+    barrier = threading.Barrier(n)
+    answers = [None] * n
+
+    def ask(i):
+        barrier.wait()
+        answers[i] = "".join(gen.stream(messages))
+
+    threads = [threading.Thread(target=ask, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+
+    assert stub.RequestHandlerClass.calls == 1
+    assert gen.stats["generations"] == 1 and gen.stats["coalesced"] == n - 1
+    assert answers == ["Stub answer to: What does Karim build? "] * n
+
+
+def test_full_queue_raises_generation_unavailable(stub):
+    gen = CoalescingGenerator(OpenAICompatGenerator(_url(stub)), max_concurrency=1, max_queue=0)
+    first = gen.stream(build_messages("first question", []))
+    assert next(first)  # a generation now holds the only slot
+    with pytest.raises(GenerationUnavailable, match="queue full"):
+        next(gen.stream(build_messages("second question", [])))
+    assert gen.stats["rejected"] == 1
+    assert "".join(first)  # the running generation is unaffected
+
+
+def test_unreachable_endpoint_raises_generation_unavailable():
+    gen = CoalescingGenerator(OpenAICompatGenerator(f"http://127.0.0.1:{_closed_port()}", timeout=2))
+    with pytest.raises(GenerationUnavailable, match="unreachable"):
+        list(gen.stream(build_messages("anyone there?", [])))
+
+
+def test_stream_answer_falls_back_to_rule_based_answer(monkeypatch):
+    pytest.importorskip("streamlit")
+    import rag_agent
+
+    down = CoalescingGenerator(OpenAICompatGenerator(f"http://127.0.0.1:{_closed_port()}", timeout=2))
+    monkeypatch.setattr(rag_agent, "get_generator", lambda: down)
+    query = "What are Karim's main skills?"
+    out = {}
+    t0 = time.perf_counter()
+    streamed = "".join(rag_agent.stream_answer(query, {"ok": False}, show_sources=False, out=out))
+
+    assert time.perf_counter() - t0 < 5
+    assert out["answer"] == rag_agent.simple_rag_answer(query, out["context"])
+    assert streamed == out["answer"]
+
+
+@pytest.fixture
+def crashing_stub():
+    """Stub that drops the connection after three tokens, without [DONE]."""
+    server = make_stub_server(fail_after=3)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_failure_after_tokens_streamed_still_raises(crashing_stub):
+    gen = CoalescingGenerator(OpenAICompatGenerator(_url(crashing_stub)))
+    seen = []
+    with pytest.raises(GenerationUnavailable):
+        for token in gen.stream(build_messages("a question that gets cut off", [])):
+            seen.append(token)
+    assert "".join(seen) == "Stub answer to: "
+
+
+def test_partial_generation_is_not_cached(crashing_stub, monkeypatch):
+    pytest.importorskip("streamlit")
+    import numpy as np
+
+    import rag_agent
+
+    class AnswerCache:
+        def __init__(self):
+            self.puts = []
+
+        def get(self, vec):
+            return None
+
+        def put(self, vec, answer):
+            self.puts.append(answer)
+
+    cache = AnswerCache()
+    docs = ["Karim builds production RAG systems with LangChain and FAISS."]
+    monkeypatch.setattr(rag_agent, "get_generator",
+                        lambda: CoalescingGenerator(OpenAICompatGenerator(_url(crashing_stub))))
+    monkeypatch.setattr(rag_agent, "encode_queries", lambda queries, state, **k: np.ones((1, 4), np.float32))
+    monkeypatch.setattr(rag_agent, "_search_ids", lambda queries, vecs, state, k: [[(0, 1.0)]])
+    monkeypatch.setattr(rag_agent, "get_answer_cache", lambda dim: cache)
+
+    query = "What does Karim build?"
+    out = {}
+    streamed = "".join(rag_agent.stream_answer(query, {"ok": True, "docs": docs}, show_sources=False, out=out))
+
+    fallback = rag_agent.simple_rag_answer(query, docs)
+    assert streamed.startswith("Stub answer to: ") and streamed.endswith(fallback)
+    assert out["answer"].endswith(fallback)
+    assert cache.puts == []
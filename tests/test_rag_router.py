@@ -0,0 +1,52 @@
+import pytest
+
+from rag_router import IntentRouter
+
+
+@pytest.fixture(scope="module")
+def router():
+    return IntentRouter.from_file()
+
+
+def _router(*rules):
+    return IntentRouter([{"name": name, "keywords": kws, "answer": name} for name, kws in rules])
+
+
+def test_phrase_is_consumed_before_its_stem():
+    r = _router(("languages", ["language"]), ("llm", ["language model"]))
+    assert r.route("Has he built a language model?") == "llm"
+    assert r.scores("Has he built a language model?") == {"llm": 1.0}
+    assert r.route("Which language does he speak?") == "languages"
+
+
+def test_language_model_questions_do_not_route_to_languages(router):
+    assert router.route("Has Karim trained a language model?") == "llm"
+    assert router.route("Experience with large language models?") == "llm"
+    assert "languages" not in router.scores("What large language model work has he done?")
+    assert router.route("Which languages does Karim speak?") == "languages"
+
+
+def test_keywords_match_only_at_word_start(router):
+    assert router.route("certifications") == "certifications"       # stem
+    assert router.route("Tell me about neural networks") is None     # no "eur" / "work" inside words
+    assert router.route("Can he translate documents?") is None       # no "sla" inside "translate"
+    assert router.route("What is his SLA?") == "reliability"
+
+
+def test_ties_go_to_the_intent_listed_first():
+    r = _router(("first", ["alpha"]), ("second", ["beta"]))
+    assert r.route("beta then alpha") == "first"
+    assert r.route("beta") == "second"
+
+
+def test_tie_priority_follows_rules_file_order(router):
+    # One hit each for stack ("python") and certifications ("aws"); stack is listed first
+    assert router.scores("python on aws") == {"stack": 1.0, "certifications": 1.0}
+    assert router.route("python on aws") == "stack"
+
+
+def test_score_counts_distinct_keywords():
+    r = _router(("rag", ["rag", "faiss"]), ("stack", ["python"]))
+    assert r.scores("rag rag rag python") == {"rag": 1.0, "stack": 1.0}
+    assert r.route("rag with faiss in python") == "rag"
+    assert _router().route("anything") is None